@@ -0,0 +1,49 @@
+from airflow.decorators import dag, task
+from airflow.utils.dates import days_ago
+import os
+from typing import List
+from scraper.backfill import backfill_season
+from scraper.checkpoint import SeasonCheckpoint
+from scraper.games import PFR_BASE_URL, get_team_name_mapping
+from uploader.client import UploadClient
+
+default_args = {
+    'owner': 'sampocs',
+    'retries': 2,
+}
+
+API_ENDPOINT = os.environ['JUICE_API_ENDPOINT']
+PFR_SOURCE = os.environ.get('JUICE_PFR_SOURCE', PFR_BASE_URL)
+
+# The seasons are read when the DAG is parsed, since Airflow 2.1 can't map tasks at runtime
+FIRST_SEASON = int(os.environ.get('JUICE_BACKFILL_FIRST_SEASON', 1970))
+LAST_SEASON = int(os.environ.get('JUICE_BACKFILL_LAST_SEASON', 2021))
+
+# Limits how many seasons are scraped at once (created in start-scheduler.sh)
+BACKFILL_POOL = 'pfr_scraper'
+CHECKPOINT_PATH = '/opt/airflow/data/backfill_checkpoint.json'
+
+def upload_games(rows: List[dict]):
+    with UploadClient(API_ENDPOINT) as client:
+        client.upload('/games', rows, method='PUT')
+
+@dag(default_args=default_args, schedule_interval=None, start_date=days_ago(1))
+def backfill_games():
+
+    def backfill(season: int):
+        print(f'Backfilling {season} from {PFR_SOURCE}...')
+        backfilled = backfill_season(
+            season,
+            upload=upload_games,
+            checkpoint=SeasonCheckpoint(CHECKPOINT_PATH),
+            team_name_mapping=get_team_name_mapping(historical=True),
+            source=PFR_SOURCE
+        )
+        if backfilled:
+            print('Done.')
+
+    # One independent task per season
+    for season in range(FIRST_SEASON, LAST_SEASON + 1):
+        task(task_id=f'backfill_{season}', pool=BACKFILL_POOL)(backfill)(season)
+
+backfill_games = backfill_games()
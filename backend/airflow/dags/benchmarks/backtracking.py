@@ -0,0 +1,111 @@
+"""
+Worst-case regex profiling for the play patterns
+
+Fuzzes every pattern in the registry with long and adversarial descriptions that almost match
+(e.g. repeated keywords, very long player names, examples with the ending cut off) and reports
+the worst-case search time per pattern
+
+With --legacy, the patterns are also rebuilt with the original unbounded player and penalty
+expressions for comparison
+
+Run from the dags directory:
+    python -m benchmarks.backtracking --lengths 50 100 200 --legacy
+"""
+import argparse
+import random
+import re
+import time
+from typing import Dict, Iterator, List, Tuple
+
+import parser.play_components as pc
+from parser import registry
+from tests import play_examples
+
+# The original player and penalty expressions, before their length was capped
+LEGACY_PLAYER = r"[A-Z][a-zA-Z, .'-]*[a-zA-Z]"
+LEGACY_PENALTY = r"[a-zA-Z \d()/]+"
+
+# Words used to build random descriptions
+FUZZ_VOCABULARY = [
+    'Aaron', 'Jones', "O'Donnell", 'St.', 'Smith-Marsette', 'and', 'for', 'by', 'at', '(', ')', ',',
+    '5', 'yards', 'no gain', 'CHI-10', '50',
+    *[anchor.strip() for anchors in registry.ANCHORS.values() for anchor in anchors],
+]
+
+
+def legacy_patterns() -> Dict[str, re.Pattern]:
+    """
+    Rebuilds every registry pattern with the original unbounded player and penalty expressions
+    """
+    return {
+        play_type: re.compile(pattern.pattern.replace(pc.PLAYER, LEGACY_PLAYER).replace(pc.PENALTY, LEGACY_PENALTY))
+        for (play_type, pattern) in registry.PATTERNS.items()
+    }
+
+
+def adversarial_descriptions(play_type: str, length: int, rng: random.Random) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (kind, description) pairs of roughly length words that are designed to backtrack
+    against the play type's pattern without matching it
+    """
+    name = ' '.join(['Aaron'] * length)
+    anchors = registry.ANCHORS[play_type]
+
+    # A single very long "player name"
+    yield 'long_name', name
+
+    # The play type's keywords repeated, separated by player names, with no ending
+    yield 'repeated_keywords', ''.join(f'Aaron Jones{anchor}' for _ in range(length // 3 or 1) for anchor in anchors)
+
+    # An example of the play type with every name made very long and the last few characters cut off
+    example = rng.choice(play_examples.ALL_PLAY_EXAMPLES[play_type])
+    inflated = re.sub(pc.PLAYER, name, example)
+    yield 'inflated_example', inflated[:-3]
+
+    # Random words and keywords
+    yield 'random', ' '.join(rng.choices(FUZZ_VOCABULARY, k=length))
+
+
+def profile_patterns(patterns: Dict[str, re.Pattern], lengths: List[int], seed: int = 0) -> Dict[str, dict]:
+    """
+    Returns the worst-case search time for each pattern across every adversarial description
+    Ex: {"INTERCEPTION": {"seconds": 0.0021, "kind": "repeated_keywords", "length": 200}, ...}
+    """
+    rng = random.Random(seed)
+    worst = {}
+    for (play_type, pattern) in patterns.items():
+        worst[play_type] = {'seconds': 0.0, 'kind': None, 'length': None}
+        for length in lengths:
+            # Every pattern is fuzzed with the adversarial descriptions of every play type
+            for adversarial_type in registry.PLAY_TYPES:
+                for (kind, description) in adversarial_descriptions(adversarial_type, length, rng):
+                    start = time.perf_counter()
+                    pattern.search(description)
+                    elapsed = time.perf_counter() - start
+                    if elapsed > worst[play_type]['seconds']:
+                        worst[play_type] = {'seconds': elapsed, 'kind': f'{adversarial_type}.{kind}', 'length': length}
+    return worst
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--lengths', type=int, nargs='+', default=[25, 50, 100],
+                            help='Number of words in the adversarial descriptions')
+    arg_parser.add_argument('--legacy', action='store_true',
+                            help='Also profile the patterns built with the unbounded expressions (slow)')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    results = {'current': profile_patterns(registry.PATTERNS, args.lengths, args.seed)}
+    if args.legacy:
+        results['legacy'] = profile_patterns(legacy_patterns(), args.lengths, args.seed)
+
+    for (name, worst) in results.items():
+        print(f'\n{name} patterns, worst-case search time (lengths: {args.lengths})')
+        print(f'{"play type":<24}{"worst (ms)":>12}  input')
+        for (play_type, result) in sorted(worst.items(), key=lambda item: -item[1]['seconds']):
+            print(f'{play_type:<24}{result["seconds"] * 1000:>12.2f}  {result["kind"]} ({result["length"]} words)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares parsing a season of play descriptions into a dataframe with batch.parse_plays against
+a plain loop over classify_play (the baseline it has to beat or match) and against the previous
+implementation, a Series.str.extract of the combined pattern
+
+Run from the dags directory:
+    python -m benchmarks.batch --size 50000
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+from benchmarks.suite import build_season, shuffle_season
+from parser import batch, classify, combined, registry
+
+
+def classify_loop(play_descriptions: pd.Series) -> list:
+    """
+    The baseline: classify_play on every description, without building a dataframe
+    """
+    return [classify.classify_play(play_description) for play_description in play_descriptions]
+
+
+def extract_parse_plays(play_descriptions: pd.Series) -> pd.DataFrame:
+    """
+    The previous parse_plays: a single Series.str.extract of the combined pattern, then one column
+    per variable merged across the play types' groups
+    """
+    extracted = play_descriptions.str.extract(combined.COMBINED_PATTERN, expand=True)
+
+    play_type_matches = extracted[registry.PLAY_TYPES].notna()
+    plays = pd.DataFrame(index=play_descriptions.index)
+    plays['play_type'] = play_type_matches.idxmax(axis=1).where(play_type_matches.any(axis=1))
+
+    for name in batch.FIELD_NAMES:
+        column = pd.Series(index=extracted.index, dtype=object)
+        for groups in combined.FIELD_GROUPS.values():
+            for (group, field) in groups:
+                if field == name:
+                    column = column.fillna(extracted[group])
+        plays[name] = column
+
+    return plays
+
+
+def _time_function(function: Callable, play_descriptions: pd.Series, repeat: int) -> float:
+    """
+    Returns the best time (in seconds) to process every description
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(play_descriptions)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--size', type=int, default=50_000, help='Number of plays in the season')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Number of timing runs (best is reported)')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--skip-extract', action='store_true', help="Don't time the previous (slow) implementation")
+    args = arg_parser.parse_args()
+
+    play_descriptions = pd.Series(shuffle_season(build_season(args.size, args.seed), args.seed))
+
+    functions: List = [('classify_play loop', classify_loop), ('parse_plays', batch.parse_plays)]
+    if not args.skip_extract:
+        functions.append(('str.extract (previous)', extract_parse_plays))
+
+    print(f'{len(play_descriptions):,} descriptions')
+    baseline = None
+    for (name, function) in functions:
+        elapsed = _time_function(function, play_descriptions, args.repeat)
+        baseline = baseline or elapsed
+        print(f'{name:<26}{elapsed:>8.2f}s{len(play_descriptions) / elapsed:>12,.0f} plays/s'
+              f'{elapsed / baseline:>8.2f}x baseline time')
+
+
+if __name__ == '__main__':
+    main()
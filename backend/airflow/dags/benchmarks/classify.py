@@ -0,0 +1,68 @@
+"""
+Compares classifying play descriptions with the classify_play engines (keyword dispatch and
+the combined pattern) against brute force (trying every parser in registry order until one matches)
+
+Run from the dags directory:
+    python -m benchmarks.classify
+"""
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+
+from parser import classify, registry
+from tests import play_examples
+
+
+def brute_force_classify(play_description: str) -> Tuple[str, dict] or None:
+    """
+    Tries every parser in registry order, returning the first match
+    """
+    for (play_type, parser_function) in registry.PARSERS.items():
+        match = parser_function(play_description)
+        if match:
+            return play_type, match.groupdict()
+    return None
+
+
+def _time_classifier(classifier: Callable, descriptions: List[str], repeat: int) -> float:
+    """
+    Returns the best time (in seconds) to classify every description
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for description in descriptions:
+            classifier(description)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--per-type', type=int, default=500, help='Examples sampled per play type')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Number of timing runs (best is reported)')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    descriptions = [
+        description
+        for examples in play_examples.ALL_PLAY_EXAMPLES.values()
+        for description in rng.sample(examples, min(args.per_type, len(examples)))
+    ]
+    rng.shuffle(descriptions)
+
+    brute_force = _time_classifier(brute_force_classify, descriptions, args.repeat)
+    print(f'{len(descriptions)} descriptions')
+    print(f'{"brute force":<24}{len(descriptions) / brute_force:>12,.0f} plays/s')
+
+    for engine in classify.ENGINES:
+        classifier = lambda play_description: classify.classify_play(play_description, engine=engine)
+        elapsed = _time_classifier(classifier, descriptions, args.repeat)
+        print(f'{"classify_play " + engine:<24}{len(descriptions) / elapsed:>12,.0f} plays/s'
+              f'{brute_force / elapsed:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
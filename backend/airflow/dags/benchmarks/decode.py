@@ -0,0 +1,40 @@
+"""
+Times decoding captured distances and yardage into numbers
+
+Run from the dags directory:
+    python -m benchmarks.decode
+"""
+import argparse
+import random
+import time
+
+from parser import decode
+from tests import play_examples
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--size', type=int, default=1_000_000, help='Number of captured strings to decode')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    distances = rng.choices(play_examples.DISTANCE_EXAMPLES, k=args.size)
+    yardages = rng.choices(play_examples.YARDAGE_EXAMPLES, k=args.size)
+    offenses = rng.choices(['CHI', 'SF'], k=args.size)
+
+    start = time.perf_counter()
+    decode.decode_distances(distances)
+    print(f'{"distances":<18}{time.perf_counter() - start:>8.3f}s for {args.size:,}')
+
+    start = time.perf_counter()
+    [decode.decode_yardage(yardage) for yardage in yardages]
+    print(f'{"yardage":<18}{time.perf_counter() - start:>8.3f}s for {args.size:,}')
+
+    start = time.perf_counter()
+    decode.decode_field_positions(yardages, offenses)
+    print(f'{"field positions":<18}{time.perf_counter() - start:>8.3f}s for {args.size:,}')
+
+
+if __name__ == '__main__':
+    main()
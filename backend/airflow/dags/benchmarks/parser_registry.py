@@ -0,0 +1,67 @@
+"""
+Compares parser throughput before and after the pattern registry
+
+Before: the pattern is assembled from its components and handed to re.search on every call
+After: the parse_* function searches the pattern compiled once at import time
+
+Run from the dags directory:
+    python -m benchmarks.parser_registry
+"""
+import argparse
+import re
+import sys
+import time
+from typing import Callable, List
+
+from parser import registry
+from tests import play_examples
+
+
+def _legacy_parser(play_type: str) -> Callable[[str], re.Match or None]:
+    """
+    Rebuilds the per-call behavior of the parsers prior to the registry:
+    assemble the pattern string, then search it
+    """
+    module = sys.modules[registry.PARSERS[play_type].__module__]
+    build_pattern = getattr(module, f'_build_{play_type.lower()}_pattern')
+    return lambda play_description: re.search(build_pattern(), play_description)
+
+
+def _time_parser(parser_function: Callable, descriptions: List[str], repeat: int) -> float:
+    """
+    Returns the best time (in seconds) to parse every description with the given parser
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for description in descriptions:
+            parser_function(description)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Number of timing runs (best is reported)')
+    args = arg_parser.parse_args()
+
+    print(f'{"play type":<24}{"plays":>9}{"before/s":>14}{"after/s":>14}{"speedup":>10}')
+
+    total_plays, total_before, total_after = 0, 0.0, 0.0
+    for play_type, descriptions in play_examples.ALL_PLAY_EXAMPLES.items():
+        before = _time_parser(_legacy_parser(play_type), descriptions, args.repeat)
+        after = _time_parser(registry.PARSERS[play_type], descriptions, args.repeat)
+
+        total_plays += len(descriptions)
+        total_before += before
+        total_after += after
+
+        print(f'{play_type:<24}{len(descriptions):>9}{len(descriptions) / before:>14,.0f}'
+              f'{len(descriptions) / after:>14,.0f}{before / after:>9.1f}x')
+
+    print(f'{"TOTAL":<24}{total_plays:>9}{total_plays / total_before:>14,.0f}'
+          f'{total_plays / total_after:>14,.0f}{total_before / total_after:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
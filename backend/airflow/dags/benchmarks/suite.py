@@ -0,0 +1,217 @@
+"""
+Parser throughput benchmark suite
+
+Builds a synthetic season of play descriptions from the play_examples corpus, using a realistic
+mix of play types, and reports:
+  * plays/sec for each parse function (on descriptions of its own play type)
+  * end-to-end plays/sec for each classify_play engine and for the typed records
+  * p50/p99 latency per play
+  * peak memory while parsing the season into records
+
+With --baseline, the results are compared against a stored baseline JSON and the run fails
+(exit code 1) if any throughput dropped by more than --threshold percent
+
+Run from the dags directory:
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 10
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from parser import classify, records, registry
+from tests import play_examples
+
+# Approximate number of each play type in a single NFL game
+PLAY_TYPE_WEIGHTS = {
+    'RUN': 52,
+    'RUN_NO_DIRECTION': 2,
+    'PASS_COMPLETE': 44,
+    'PASS_INCOMPLETE': 24,
+    'SACK_FULL': 4,
+    'SACK_HALF': 0.5,
+    'FUMBLE': 1.5,
+    'INTERCEPTION': 1.5,
+    'KICKOFF_TOUCHBACK': 5.5,
+    'KICKOFF_RETURNED': 4,
+    'KICKOFF_OUT_OF_BOUNDS': 0.2,
+    'ONSIDE_KICK': 0.2,
+    'FIELD_GOAL': 3.5,
+    'EXTRA_POINT': 4.5,
+    'PUNT_OUT_OF_BOUNDS': 0.8,
+    'PUNT_DOWNED': 1.2,
+    'PUNT_FAIR_CATCH': 2.5,
+    'PUNT_RETURNED': 3.5,
+    'PUNT_RECOVERED': 0.1,
+    'PUNT_TOUCHBACK': 0.6,
+    'PUNT_BLOCKED': 0.05,
+    'PENALTY': 13,
+    'TIMEOUT': 6,
+    'SPIKE': 0.3,
+    'KNEEL': 2,
+}
+
+DEFAULT_SEASON_SIZE = 300_000
+DEFAULT_THRESHOLD = 10.0 # percent
+DEFAULT_REPEAT = 3
+
+# Rare play types are repeated to at least this many descriptions when timing their parser,
+# otherwise the timing is too short to be stable
+MIN_PARSER_SAMPLE = 5_000
+
+
+def build_season(size: int = DEFAULT_SEASON_SIZE, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Builds a synthetic season of play descriptions, grouped by play type,
+    with the number of plays of each type proportional to PLAY_TYPE_WEIGHTS
+    """
+    rng = random.Random(seed)
+    total_weight = sum(PLAY_TYPE_WEIGHTS.values())
+    return {
+        play_type: rng.choices(play_examples.ALL_PLAY_EXAMPLES[play_type], k=max(1, round(size * weight / total_weight)))
+        for (play_type, weight) in PLAY_TYPE_WEIGHTS.items()
+    }
+
+
+def shuffle_season(season: Dict[str, List[str]], seed: int = 0) -> List[str]:
+    """
+    Flattens the season into a single list of descriptions in random order
+    """
+    descriptions = [description for descriptions in season.values() for description in descriptions]
+    random.Random(seed).shuffle(descriptions)
+    return descriptions
+
+
+def measure_throughput(function: Callable, descriptions: List[str], repeat: int = DEFAULT_REPEAT) -> float:
+    """
+    Returns the number of descriptions processed per second (best of repeat runs)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for description in descriptions:
+            function(description)
+        best = min(best, time.perf_counter() - start)
+    return len(descriptions) / best
+
+
+def measure_latency(function: Callable, descriptions: List[str]) -> Dict[str, float]:
+    """
+    Returns the p50 and p99 latency (in microseconds) of processing a single description
+    """
+    timer = time.perf_counter_ns
+    latencies = []
+    for description in descriptions:
+        start = timer()
+        function(description)
+        latencies.append(timer() - start)
+    latencies.sort()
+    return {
+        'p50_us': latencies[len(latencies) // 2] / 1000,
+        'p99_us': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] / 1000,
+    }
+
+
+def measure_peak_memory(descriptions: List[str]) -> float:
+    """
+    Returns the peak memory (in MB) allocated while parsing every description into a record
+    """
+    tracemalloc.start()
+    parsed = [records.parse_play_record(description) for description in descriptions]
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return peak / 1e6
+
+
+def run_suite(size: int = DEFAULT_SEASON_SIZE, seed: int = 0, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Runs every benchmark and returns the results
+    Throughputs (plays/sec) are stored under "throughput" so they can be compared to a baseline
+    """
+    season = build_season(size, seed)
+    descriptions = shuffle_season(season, seed)
+
+    throughput = {}
+    for (play_type, parser_function) in registry.PARSERS.items():
+        sample = season[play_type] * -(-MIN_PARSER_SAMPLE // len(season[play_type]))
+        throughput[f'parser.{play_type}'] = measure_throughput(parser_function, sample, repeat)
+
+    for engine in classify.ENGINES:
+        classifier = lambda play_description: classify.classify_play(play_description, engine=engine)
+        throughput[f'end_to_end.{engine}'] = measure_throughput(classifier, descriptions, repeat)
+    throughput['end_to_end.records'] = measure_throughput(records.parse_play_record, descriptions, repeat)
+
+    return {
+        'plays': len(descriptions),
+        'throughput': throughput,
+        'latency': measure_latency(classify.classify_play, descriptions),
+        'peak_memory_mb': measure_peak_memory(descriptions),
+    }
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compares the throughputs to a baseline, returning a message for every benchmark
+    that dropped by more than threshold percent
+    Benchmarks that aren't in the baseline are ignored
+    """
+    regressions = []
+    for (name, baseline_throughput) in baseline['throughput'].items():
+        throughput = results['throughput'].get(name)
+        if throughput is None:
+            continue
+        change = 100 * (throughput - baseline_throughput) / baseline_throughput
+        if change < -threshold:
+            regressions.append(f'{name}: {throughput:,.0f} plays/s vs baseline {baseline_throughput:,.0f} ({change:.1f}%)')
+    return regressions
+
+
+def print_results(results: dict):
+    print(f'{results["plays"]:,} plays')
+    print(f'{"benchmark":<36}{"plays/s":>14}')
+    for (name, throughput) in results['throughput'].items():
+        print(f'{name:<36}{throughput:>14,.0f}')
+    print(f'latency per play: p50 {results["latency"]["p50_us"]:.1f}us, p99 {results["latency"]["p99_us"]:.1f}us')
+    print(f'peak memory (parsing into records): {results["peak_memory_mb"]:.1f} MB')
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--size', type=int, default=DEFAULT_SEASON_SIZE, help='Number of plays in the season')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timing runs per benchmark (best is reported)')
+    arg_parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help='Allowed drop in throughput (percent) before failing')
+    arg_parser.add_argument('--save-baseline', help='Write the results to this path as the new baseline')
+    args = arg_parser.parse_args()
+
+    results = run_suite(args.size, args.seed, args.repeat)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f'Saved baseline to {args.save_baseline}')
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline['plays'] != results['plays']:
+            print(f'Warning: baseline has {baseline["plays"]:,} plays, this run has {results["plays"]:,}')
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print(f'Throughput dropped more than {args.threshold}% against {args.baseline}:')
+            for regression in regressions:
+                print(f'  {regression}')
+            sys.exit(1)
+        print(f'No throughput regressions against {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
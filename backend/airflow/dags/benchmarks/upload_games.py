@@ -0,0 +1,151 @@
+"""
+Benchmark for formatting scraped games for the database (scraper.games)
+
+Builds a synthetic multi-season schedule, in the format scraped from Pro Football Reference
+(past seasons have winner/loser columns and ISO dates, the upcoming season has home/away
+columns and written out dates), and compares the vectorized formatting of the whole
+multi-season frame with the original row by row implementation (df.apply with strptime,
+one season at a time since it needs the year), checking they produce the same rows
+
+Run from the dags directory:
+    python -m benchmarks.upload_games --first-season 1970 --last-season 2021
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scraper import games
+
+TEAMS_PATH = '../data/teams.csv'
+GAMES_PER_SEASON = 272
+
+
+def build_season(year: int, team_names: List[str], upcoming: bool, rng: random.Random) -> pd.DataFrame:
+    """
+    Builds a season of scraped games, as returned by read_html after the columns are renamed
+    """
+    rows = []
+    first_game = datetime(year, 9, 9)
+    for game in range(GAMES_PER_SEASON):
+        week = game // 16
+        date = first_game + timedelta(days=7 * week + game % 3)
+        (home_team, away_team) = rng.sample(team_names, 2)
+        hour = rng.choice([1, 4, 8])
+        if upcoming:
+            rows.append({
+                'week': str(week + 1), 'dow': 'Sun', 'date': date.strftime('%B %-d'), 'away_team': away_team,
+                'at': '@', 'away_score': np.nan, 'home_team': home_team, 'home_score': np.nan, 'time': f'{hour}:00 PM'
+            })
+        else:
+            (home_score, away_score) = (rng.randint(0, 45), rng.randint(0, 45))
+            home_won = home_score >= away_score
+            rows.append({
+                'week': str(week + 1), 'dow': 'Sun', 'date': date.strftime('%Y-%m-%d'), 'time': f'{hour}:00PM',
+                'away_team': home_team if home_won else away_team, 'at': np.nan if home_won else '@',
+                'home_team': away_team if home_won else home_team,
+                'away_score': max(home_score, away_score), 'home_score': min(home_score, away_score),
+            })
+    return pd.DataFrame(rows)
+
+
+def legacy_swap_home_away(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """
+    The original row by row implementation of swap_home_away
+    (with the scores swapped along with the teams, which the original didn't do)
+    """
+    df = df.copy()
+    df['home_temp'] = df['home_team']
+    df['away_temp'] = df['away_team']
+    df['away_team'] = df.apply(lambda df: df['away_temp'] if df['at'] == '@' else df['home_temp'], axis=1)
+    df['home_team'] = df.apply(lambda df: df['home_temp'] if df['at'] == '@' else df['away_temp'], axis=1)
+    df['home_temp'] = df['home_score']
+    df['away_temp'] = df['away_score']
+    df['away_score'] = df.apply(lambda df: df['away_temp'] if df['at'] == '@' else df['home_temp'], axis=1)
+    df['home_score'] = df.apply(lambda df: df['home_temp'] if df['at'] == '@' else df['away_temp'], axis=1)
+    df['season'] = year
+    df['week'] = df['week'].astype('int')
+    return df
+
+
+def legacy_format_for_db(df: pd.DataFrame, year: int, team_name_mapping: Dict) -> pd.DataFrame:
+    """
+    The original row by row implementation of format_for_db
+    """
+    def _to_datetime(row: pd.Series) -> datetime:
+        date_string = row['date']
+        time_string = row['time']
+        try:
+            date = datetime.strptime(date_string + f' {year}', '%B %d %Y')
+            if date.month < 3:
+                date = date + timedelta(days=365)
+            time = datetime.strptime(time_string, '%I:%M %p')
+        except:
+            date = datetime.strptime(date_string, '%Y-%m-%d')
+            time = datetime.strptime(time_string, '%I:%M%p')
+        return datetime.strptime(f'{date.strftime("%Y-%m-%d")} {time.strftime("%H:%M:%S")}', '%Y-%m-%d %H:%M:%S')
+
+    def _add_game_id(row: pd.Series) -> str:
+        return f'{row["datetime"].strftime("%Y%m%d")}_{row["home_team_id"]}'
+
+    df = df.copy()
+    df['home_team_id'] = df['home_team'].apply(lambda team_name: team_name_mapping[team_name])
+    df['away_team_id'] = df['away_team'].apply(lambda team_name: team_name_mapping[team_name])
+    df['datetime'] = df.apply(_to_datetime, axis=1)
+    df['game_id'] = df.apply(_add_game_id, axis=1)
+    df['datetime'] = df['datetime'].apply(lambda dt: datetime.strftime(dt, '%Y-%m-%d %H:%M:%S'))
+    df = df[['game_id', 'season', 'week', 'datetime', 'home_team_id', 'away_team_id', 'home_score', 'away_score']]
+    return df.astype(object).where(df.notna(), None)
+
+
+def time_legacy(seasons: Dict[int, pd.DataFrame], team_name_mapping: Dict) -> Tuple[float, list]:
+    """
+    Formats every season with the original implementation, returning the elapsed seconds and the formatted rows
+    """
+    start = time.perf_counter()
+    rows = []
+    for (year, df) in seasons.items():
+        rows.extend(legacy_format_for_db(legacy_swap_home_away(df, year), year, team_name_mapping).to_dict('records'))
+    return time.perf_counter() - start, rows
+
+
+def time_vectorized(seasons: Dict[int, pd.DataFrame], team_name_mapping: Dict) -> Tuple[float, list]:
+    """
+    Formats every season as a single frame, returning the elapsed seconds and the formatted rows
+    """
+    start = time.perf_counter()
+    df = pd.concat([games.swap_home_away(df, year) for (year, df) in seasons.items()], ignore_index=True)
+    rows = games.format_for_db(df, team_name_mapping).to_dict('records')
+    return time.perf_counter() - start, rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--first-season', type=int, default=1970)
+    arg_parser.add_argument('--last-season', type=int, default=2021)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    team_name_mapping = games.get_team_name_mapping(TEAMS_PATH)
+    rng = random.Random(args.seed)
+    seasons = {
+        year: build_season(year, list(team_name_mapping), upcoming=(year == args.last_season), rng=rng)
+        for year in range(args.first_season, args.last_season + 1)
+    }
+
+    (legacy_seconds, legacy_rows) = time_legacy(seasons, team_name_mapping)
+    (seconds, rows) = time_vectorized(seasons, team_name_mapping)
+    assert rows == legacy_rows, 'Vectorized formatting differs from the original'
+
+    print(f'{len(rows):,} games ({len(seasons)} seasons)')
+    print(f'{"row by row":<12}{legacy_seconds:>10.3f}s')
+    print(f'{"vectorized":<12}{seconds:>10.3f}s')
+    print(f'speedup: {legacy_seconds / seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
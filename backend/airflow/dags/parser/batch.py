@@ -0,0 +1,56 @@
+import pandas as pd
+from typing import List
+from .classify import classify_play
+from .combined import FIELD_GROUPS
+
+
+def _get_field_names() -> List[str]:
+    """
+    Returns every variable name across all play types, in the order they first appear
+    Ex: ["passer", "direction", "receiver", "distance", "tackler", ...]
+    """
+    field_names = []
+    for groups in FIELD_GROUPS.values():
+        for (_, name) in groups:
+            if name not in field_names:
+                field_names.append(name)
+    return field_names
+
+
+FIELD_NAMES = _get_field_names()
+
+
+def parse_plays(play_descriptions: pd.Series) -> pd.DataFrame:
+    """
+    Given a series of play by play descriptions, returns a dataframe with the play type
+    and the regex match for each variable
+    Descriptions that don't match any play type have a play_type of NaN
+
+    Each description is classified with classify_play (keyword dispatch) and the frame is built from the
+    records in one go. Extracting the combined pattern with Series.str.extract is much slower, since it still
+    runs the regex once per row and builds a column for every group of every play type (see benchmarks.batch)
+
+    Variables that are shared across play types (e.g. "distance", "tackler") are combined into one column
+
+    Example:
+        play_descriptions = pd.Series([
+            "David Montgomery right tackle for 15 yards",
+            "Robbie Gould kicks off 65 yards, touchback"
+        ])
+        returns:
+                    play_type            runner     direction  distance  tackler  ...        kicker
+            0             RUN  David Montgomery  right tackle  15 yards      NaN  ...           NaN
+            1  KICKOFF_TOUCHBACK            NaN           NaN  65 yards      NaN  ...  Robbie Gould
+    """
+    records = []
+    for play_description in play_descriptions:
+        classified = classify_play(play_description)
+        if classified is None:
+            records.append({})
+        else:
+            (play_type, groupdict) = classified
+            groupdict['play_type'] = play_type
+            records.append(groupdict)
+
+    # With dtype=object, pandas doesn't have to infer the type of every column
+    return pd.DataFrame(records, index=play_descriptions.index, columns=['play_type'] + FIELD_NAMES, dtype=object)
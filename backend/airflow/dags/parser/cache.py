@@ -0,0 +1,173 @@
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import Tuple
+from .classify import ENGINES, classify_play
+from .registry import PATTERNS
+
+DEFAULT_MAX_SIZE = 100_000 # descriptions
+DEFAULT_COMMIT_EVERY = 1000 # new descriptions
+
+# Stored in place of a result for descriptions that don't match any play type,
+# so they can be told apart from descriptions that haven't been seen
+_NO_MATCH = object()
+
+
+class ParseCache:
+    """
+    Bounded in-memory LRU cache in front of classify_play, keyed by the play description
+    Many descriptions repeat across games (e.g. "Timeout #1 by Chicago Bears", "X kicks extra point good"),
+    so these are only parsed once
+
+    Example:
+        >>> cache = ParseCache(max_size=10000)
+        >>> cache.classify("Timeout #1 by Chicago Bears")
+        ("TIMEOUT", {"timeout_number": "#1", "team": "Chicago Bears"})
+        >>> cache.stats()
+        {"size": 1, "hits": 0, "misses": 1, "evictions": 0}
+    """
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, engine: str = 'dispatch'):
+        assert max_size > 0, 'max_size must be positive'
+        assert engine in ENGINES, f'Invalid engine ({engine}). Must be one of: {ENGINES}'
+
+        self.max_size = max_size
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def classify(self, play_description: str) -> Tuple[str, dict] or None:
+        """
+        Returns the same result as classify_play, parsing the description only if it isn't cached
+        """
+        result = self._entries.get(play_description)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(play_description)
+        else:
+            self.misses += 1
+            result = classify_play(play_description, engine=self.engine) or _NO_MATCH
+            self._entries[play_description] = result
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        if result is _NO_MATCH:
+            return None
+        (play_type, groupdict) = result
+        return play_type, dict(groupdict)
+
+    def stats(self) -> dict:
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self):
+        self._entries.clear()
+
+
+def patterns_fingerprint(patterns: dict = PATTERNS) -> str:
+    """
+    Returns a hash of every play type's pattern, in registry order, which changes whenever
+    a pattern (or the order they're tried in) changes
+    """
+    fingerprint = hashlib.sha1()
+    for (play_type, pattern) in patterns.items():
+        fingerprint.update(f'{play_type}\0{pattern.pattern}\0'.encode('utf-8'))
+    return fingerprint.hexdigest()
+
+
+class PersistentParseCache:
+    """
+    On-disk cache in front of classify_play, stored in a sqlite database keyed by a hash of the description
+    Re-running a backfill (e.g. after a partial failure) skips parsing every description seen by a previous run
+
+    New results are committed every commit_every descriptions and when the cache is closed
+
+    The cache stores the fingerprint of the patterns it was built with, and every stored result
+    is discarded when it's opened with different patterns (e.g. after a pattern is fixed)
+
+    Example:
+        >>> with PersistentParseCache('/opt/airflow/data/parse_cache.db') as cache:
+        ...     cache.classify("Timeout #1 by Chicago Bears")
+        ("TIMEOUT", {"timeout_number": "#1", "team": "Chicago Bears"})
+    """
+    def __init__(self, path: str, engine: str = 'dispatch', commit_every: int = DEFAULT_COMMIT_EVERY,
+                 fingerprint: str or None = None):
+        assert engine in ENGINES, f'Invalid engine ({engine}). Must be one of: {ENGINES}'
+
+        self.path = path
+        self.engine = engine
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._uncommitted = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS parsed_plays ('
+            '    description_hash BLOB PRIMARY KEY,'
+            '    play_type TEXT,'
+            '    fields TEXT'
+            ')'
+        )
+        self._connection.execute('CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)')
+
+        self.fingerprint = fingerprint or patterns_fingerprint()
+        row = self._connection.execute("SELECT value FROM metadata WHERE key = 'patterns_fingerprint'").fetchone()
+        if row is None or row[0] != self.fingerprint:
+            self._connection.execute('DELETE FROM parsed_plays')
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata VALUES ('patterns_fingerprint', ?)", (self.fingerprint,)
+            )
+        self._connection.commit()
+
+    @staticmethod
+    def hash_description(play_description: str) -> bytes:
+        return hashlib.sha1(play_description.encode('utf-8')).digest()
+
+    def classify(self, play_description: str) -> Tuple[str, dict] or None:
+        """
+        Returns the same result as classify_play, parsing the description only if it isn't stored
+        """
+        description_hash = self.hash_description(play_description)
+        row = self._connection.execute(
+            'SELECT play_type, fields FROM parsed_plays WHERE description_hash = ?', (description_hash,)
+        ).fetchone()
+
+        if row is not None:
+            self.hits += 1
+            (play_type, fields) = row
+            return None if play_type is None else (play_type, json.loads(fields))
+
+        self.misses += 1
+        result = classify_play(play_description, engine=self.engine)
+        (play_type, groupdict) = result or (None, None)
+        self._connection.execute(
+            'INSERT OR REPLACE INTO parsed_plays VALUES (?, ?, ?)',
+            (description_hash, play_type, None if groupdict is None else json.dumps(groupdict))
+        )
+
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+        return result
+
+    def commit(self):
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def stats(self) -> dict:
+        (size,) = self._connection.execute('SELECT COUNT(*) FROM parsed_plays').fetchone()
+        return {'size': size, 'hits': self.hits, 'misses': self.misses, 'evictions': 0}
+
+    def close(self):
+        self.commit()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
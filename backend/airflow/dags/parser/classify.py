@@ -0,0 +1,73 @@
+from collections import defaultdict
+from typing import List, Tuple
+from .registry import ANCHORS, PARSERS, PLAY_TYPES
+from .combined import classify_play_combined
+
+ENGINES = ['dispatch', 'combined']
+
+
+def _build_keyword_index() -> List[Tuple[str, List[Tuple[str, Tuple[str, ...]]]]]:
+    """
+    Groups the play types by their keyword (first anchor) so that each keyword
+    only has to be searched for once per description
+
+    Ex: [(" punts ", [("PUNT_OUT_OF_BOUNDS", (" out of bounds",)), ("PUNT_DOWNED", (" downed by ",)), ...]), ...]
+    """
+    index = defaultdict(list)
+    for (play_type, (keyword, *remaining_anchors)) in ANCHORS.items():
+        index[keyword].append((play_type, tuple(remaining_anchors)))
+    return list(index.items())
+
+
+KEYWORD_INDEX = _build_keyword_index()
+PLAY_TYPE_ORDER = {play_type: i for (i, play_type) in enumerate(PLAY_TYPES)}
+
+
+def get_candidate_play_types(play_description: str) -> List[str]:
+    """
+    Returns the play types (in registry order) whose anchors all appear in the description
+    Only these play types can possibly match the description
+    """
+    candidates = [
+        play_type
+        for (keyword, play_types) in KEYWORD_INDEX if keyword in play_description
+        for (play_type, remaining_anchors) in play_types
+        if all(anchor in play_description for anchor in remaining_anchors)
+    ]
+    if len(candidates) > 1:
+        candidates.sort(key=PLAY_TYPE_ORDER.__getitem__)
+    return candidates
+
+
+def classify_play(play_description: str, engine: str = 'dispatch') -> Tuple[str, dict] or None:
+    """
+    Given a play by play description, returns the play type and the regex match dictionary
+    from the first play type (in registry order) whose parser matches the description
+    Otherwise, returns None
+
+    Two engines are available, and both return the same result:
+      * dispatch: the keyword anchors are checked first so that typically only one or two parsers are run
+      * combined: the same keyword check, then a single search of the candidates' patterns merged into
+        one regex (see combined.py). It's kept for parity with the combined pattern and is slower than
+        dispatch (python -m benchmarks.classify), which is the default
+
+    Example:
+        play_description = "Robbie Gould kicks off 65 yards, touchback"
+        returns: (
+            "KICKOFF_TOUCHBACK",
+            {
+                "kicker": "Robbie Gould",
+                "distance": "65 yards"
+            }
+        )
+    """
+    assert engine in ENGINES, f'Invalid engine ({engine}). Must be one of: {ENGINES}'
+
+    if engine == 'combined':
+        return classify_play_combined(play_description, get_candidate_play_types(play_description))
+
+    for play_type in get_candidate_play_types(play_description):
+        match = PARSERS[play_type](play_description)
+        if match:
+            return play_type, match.groupdict()
+    return None
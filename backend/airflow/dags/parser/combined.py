@@ -0,0 +1,96 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from .registry import ANCHORS, PATTERNS
+
+# Separates the play type from the variable name in the combined pattern's group names
+# Ex: the "runner" group of the RUN pattern becomes "RUN__runner"
+GROUP_SEPARATOR = '__'
+
+
+def prefix_group_names(pattern: str, prefix: str) -> str:
+    """
+    Given a regex pattern, renames every named group by adding a prefix to the group name
+    This allows patterns that share variable names (e.g. "tackler") to be merged into one regex
+
+    Ex: prefix_group_names(r"(?P<runner>[A-Z]+)", "RUN")
+        => r"(?P<RUN__runner>[A-Z]+)"
+    """
+    return re.sub(r"\(\?P<(\w+)>", r"(?P<%s%s\1>" % (prefix, GROUP_SEPARATOR), pattern)
+
+
+def build_combined_pattern(patterns: Dict[str, re.Pattern], guard_keywords: bool = True) -> str:
+    """
+    Merges the play type patterns into a single alternation with a named outer group per play type
+
+    Each alternative is anchored to the start of the description and preceded by a lazy .*?
+    so that, like re.search, it can match anywhere in the description. Because every alternative
+    starts at the same position, the first play type (in the given order) that matches anywhere
+    in the description wins, which is the same as trying each parser in order
+
+    With guard_keywords, each alternative is also guarded by a lookahead for the play type's keyword
+    (see registry.ANCHORS). This isn't a single scan: every alternative runs its own lookahead over
+    the description, but it's still much cheaper than letting the lazy .*? try the pattern at every position
+
+    Ex: ^(?:(?P<PASS_COMPLETE>(?=.*? pass complete).*?{pass complete pattern})|...)
+    """
+    alternatives = [
+        r"(?P<%s>%s.*?%s)" % (
+            play_type,
+            r"(?=.*?%s)" % re.escape(ANCHORS[play_type][0]) if guard_keywords else '',
+            prefix_group_names(pattern.pattern, play_type)
+        )
+        for (play_type, pattern) in patterns.items()
+    ]
+    return r"^(?:%s)" % r"|".join(alternatives)
+
+
+COMBINED_PATTERN = re.compile(build_combined_pattern(PATTERNS), re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def combined_pattern_for(play_types: Tuple[str, ...]) -> re.Pattern:
+    """
+    Returns the combined pattern of only the given play types (in the given order), compiled once per set
+    The play types' anchors are already known to be in the description, so the keyword guards are left out
+    """
+    return re.compile(
+        build_combined_pattern({play_type: PATTERNS[play_type] for play_type in play_types}, guard_keywords=False),
+        re.DOTALL
+    )
+
+# Maps each play type to its (combined group name, variable name) pairs
+FIELD_GROUPS: Dict[str, List[Tuple[str, str]]] = {
+    play_type: [
+        (f'{play_type}{GROUP_SEPARATOR}{name}', name)
+        for name in pattern.groupindex
+    ]
+    for (play_type, pattern) in PATTERNS.items()
+}
+
+
+def classify_play_combined(play_description: str, play_types: List[str] or None = None) -> Tuple[str, dict] or None:
+    """
+    Given a play by play description, returns the play type and the regex match dictionary
+    using a single search of the combined pattern
+    Otherwise, returns None
+
+    If play_types is given (e.g. classify.get_candidate_play_types), only their patterns are combined,
+    otherwise the pattern of every play type is searched
+
+    The result is the same as classify.classify_play
+    """
+    if play_types is None:
+        pattern = COMBINED_PATTERN
+    elif not play_types:
+        return None
+    else:
+        pattern = combined_pattern_for(tuple(play_types))
+
+    match = pattern.search(play_description)
+    if not match:
+        return None
+
+    # The outer play type group is the last group to close
+    play_type = match.lastgroup
+    return play_type, {name: match.group(group) for (group, name) in FIELD_GROUPS[play_type]}
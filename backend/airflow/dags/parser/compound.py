@@ -0,0 +1,48 @@
+import re
+from typing import Dict, List, Tuple
+from .combined import FIELD_GROUPS, prefix_group_names
+from .registry import PATTERNS
+
+
+def build_event_pattern(patterns: Dict[str, re.Pattern]) -> str:
+    """
+    Merges the play type patterns into a single unanchored alternation with a named outer group per play type
+    Unlike the combined pattern used by classify_play, matches aren't anchored to the start of the
+    description, so each match is the next event in the description
+
+    When events of different play types start at the same position, the first (in the given order) wins
+
+    Ex: (?P<PASS_COMPLETE>{pass complete pattern})|(?P<PASS_INCOMPLETE>{pass incomplete pattern})|...
+    """
+    return r"|".join(
+        r"(?P<%s>%s)" % (play_type, prefix_group_names(pattern.pattern, play_type))
+        for (play_type, pattern) in patterns.items()
+    )
+
+
+EVENT_PATTERN = re.compile(build_event_pattern(PATTERNS))
+
+
+def decompose_play(play_description: str) -> List[Tuple[str, dict]]:
+    """
+    Given a play by play description that chains several events (e.g. a completed pass followed by
+    a fumble, or a run followed by a penalty), returns the play type and regex match dictionary
+    of each event, in the order they appear in the description
+
+    The description is walked once from left to right: each event is matched where the previous one
+    ended, rather than searching the whole description again with each parser. The match dictionary of
+    each event is the same as the play type's parser would return for that part of the description
+
+    Example:
+        play_description = "Justin Fields pass complete short left to Darnell Mooney for 8 yards. " + \\
+                           "Darnell Mooney fumbles (forced by Jaire Alexander), recovered by Kenny Clark at CHI-30"
+        returns: [
+            ("PASS_COMPLETE", {"passer": "Justin Fields", "direction": "short left", "receiver": "Darnell Mooney", ...}),
+            ("FUMBLE", {"fumbler": "Darnell Mooney", "forcer": "Jaire Alexander", "recoverer": "Kenny Clark", ...})
+        ]
+    """
+    events = []
+    for match in EVENT_PATTERN.finditer(play_description):
+        play_type = match.lastgroup
+        events.append((play_type, {name: match.group(group) for (group, name) in FIELD_GROUPS[play_type]}))
+    return events
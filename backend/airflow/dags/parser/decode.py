@@ -0,0 +1,119 @@
+from typing import Dict, Iterable, List, Tuple
+
+# Team abbreviations used by Pro Football Reference in yardage (e.g. "GNB-35") that differ
+# from the team_id in teams.csv
+# Every team_id also maps to itself, so both forms are accepted
+PFR_ABBREVIATIONS = {
+    'GNB': 'GB',
+    'KAN': 'KC',
+    'LVR': 'LV',
+    'NOR': 'NO',
+    'NWE': 'NE',
+    'SFO': 'SF',
+    'TAM': 'TB',
+    'WAS': 'WSH',
+    'SDG': 'SD',
+}
+
+# team_id of every team in teams.csv
+TEAM_IDS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+    'HOU', 'IND', 'JAX', 'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+    'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WSH', 'OAK', 'STL', 'SD', 'WSHR',
+]
+
+TEAM_ABBREVIATIONS: Dict[str, str] = {**{team_id: team_id for team_id in TEAM_IDS}, **PFR_ABBREVIATIONS}
+
+# Distances can't be more than the length of the field (plus the endzones)
+MAX_DISTANCE = 110
+
+
+def _build_distance_table() -> Dict[str, int]:
+    """
+    Builds a lookup from every distance string that can be captured to the number of yards
+    Ex: {"no gain": 0, "1 yard": 1, "-1 yard": -1, "15 yards": 15, "-3 yards": -3, ...}
+    """
+    table = {'no gain': 0}
+    for yards in range(-MAX_DISTANCE, MAX_DISTANCE + 1):
+        table[f'{yards} yards'] = yards
+        table[f'{yards} yard'] = yards
+    return table
+
+
+def _build_yardage_table() -> Dict[str, Tuple[str or None, int]]:
+    """
+    Builds a lookup from every yardage string that can be captured for a known team
+    to the team_id of the side of the field and the yard line
+    Ex: {"50": (None, 50), "CHI-10": ("CHI", 10), "GNB-35": ("GB", 35), ...}
+    """
+    table = {'50': (None, 50)}
+    for (abbreviation, team_id) in TEAM_ABBREVIATIONS.items():
+        for yard_line in range(0, 50):
+            table[f'{abbreviation}-{yard_line}'] = (team_id, yard_line)
+    return table
+
+
+DISTANCE_TABLE = _build_distance_table()
+YARDAGE_TABLE = _build_yardage_table()
+
+
+def decode_distance(distance: str or None) -> int or None:
+    """
+    Converts a captured distance (see play_components.DISTANCES) into a number of yards
+
+    Ex: "15 yards" => 15, "1 yard" => 1, "-3 yards" => -3, "no gain" => 0
+    """
+    yards = DISTANCE_TABLE.get(distance)
+    if yards is not None or distance is None:
+        return yards
+    return int(distance.split(' ', 1)[0])
+
+
+def decode_yardage(yardage: str or None) -> Tuple[str or None, int or None]:
+    """
+    Splits a captured yardage (see play_components.YARDAGE) into the team_id of the
+    side of the field and the yard line
+
+    Ex: "CHI-10" => ("CHI", 10), "GNB-35" => ("GB", 35), "50" => (None, 50)
+    """
+    decoded = YARDAGE_TABLE.get(yardage)
+    if decoded is not None:
+        return decoded
+    if yardage is None:
+        return None, None
+
+    # Unknown team abbreviation
+    (side, yard_line) = yardage.split('-')
+    return side, int(yard_line)
+
+
+def decode_field_position(yardage: str or None, offense: str) -> int or None:
+    """
+    Converts a captured yardage into the absolute field position relative to the offense,
+    from 0 (the offense's own goal line) to 100 (the opponent's goal line)
+
+    :param yardage: Captured yardage (e.g. "CHI-10")
+    :param offense: team_id or PFR abbreviation of the team with the ball (e.g. "CHI")
+
+    Ex: ("CHI-10", "CHI") => 10, ("CHI-10", "GB") => 90, ("50", "GB") => 50
+    """
+    (side, yard_line) = decode_yardage(yardage)
+    if side is None:
+        return yard_line
+    if side == TEAM_ABBREVIATIONS.get(offense, offense):
+        return yard_line
+    return 100 - yard_line
+
+
+def decode_distances(distances: Iterable[str or None]) -> List[int or None]:
+    """
+    Decodes many captured distances at once (see decode_distance)
+    """
+    return [decode_distance(distance) for distance in distances]
+
+
+def decode_field_positions(yardages: Iterable[str or None], offenses: Iterable[str]) -> List[int or None]:
+    """
+    Decodes many captured yardages at once (see decode_field_position)
+    """
+    return [decode_field_position(yardage, offense) for (yardage, offense) in zip(yardages, offenses)]
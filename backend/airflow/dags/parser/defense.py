@@ -2,6 +2,21 @@ import re
 from . import play_components as pc
 from . import core
 
+def _build_sack_full_pattern() -> str:
+    """
+    Builds the regex pattern for a SACK_FULL play (see parse_sack_full)
+    """
+    expressions = {
+        'quarterback': pc.PLAYER,
+        'sacker': pc.PLAYER,
+        'distance': r"|".join(pc.DISTANCES)
+    }
+    return r"%(quarterback)s sacked by %(sacker)s for %(distance)s" % core.wrap_expressions(expressions)
+
+
+SACK_FULL_PATTERN = re.compile(_build_sack_full_pattern())
+
+
 def parse_sack_full(play_description: str) -> re.Match or None:
     """
     Given a play by play description, if it's a SACK_FULL,
@@ -19,14 +34,24 @@ def parse_sack_full(play_description: str) -> re.Match or None:
             "distance": "-10 yards"
         }
     """
+    return SACK_FULL_PATTERN.search(play_description)
+
+
+def _build_sack_half_pattern() -> str:
+    """
+    Builds the regex pattern for a SACK_HALF play (see parse_sack_half)
+    """
     expressions = {
         'quarterback': pc.PLAYER,
-        'sacker': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES)
+        'sacker1': pc.PLAYER,
+        'sacker2': pc.PLAYER,
+        'distance1': r"|".join(pc.DISTANCES),
+        'distance2': r"|".join(pc.DISTANCES)
     }
-    pattern = r"%(quarterback)s sacked by %(sacker)s for %(distance)s" % core.wrap_expressions(expressions)
+    return r"%(quarterback)s sacked by and %(sacker1)s for %(distance1)s and %(sacker2)s for %(distance2)s" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+SACK_HALF_PATTERN = re.compile(_build_sack_half_pattern())
 
 
 def parse_sack_half(play_description: str) -> re.Match or None:
@@ -48,16 +73,30 @@ def parse_sack_half(play_description: str) -> re.Match or None:
             "distance2": "-10 yards"
         }
     """
+    return SACK_HALF_PATTERN.search(play_description)
+
+
+def _build_fumble_pattern() -> str:
+    """
+    Builds the regex pattern for a FUMBLE play (see parse_fumble)
+    """
     expressions = {
-        'quarterback': pc.PLAYER,
-        'sacker1': pc.PLAYER,
-        'sacker2': pc.PLAYER,
-        'distance1': r"|".join(pc.DISTANCES),
-        'distance2': r"|".join(pc.DISTANCES)
+        'fumbler': pc.PLAYER,
+        'forcer': pc.PLAYER,
+        'recoverer': pc.PLAYER,
+        'yardage': pc.YARDAGE,
+        'return_distance': r"|".join(pc.DISTANCES),
+        'tackler': pc.PLAYER
     }
-    pattern = r"%(quarterback)s sacked by and %(sacker1)s for %(distance1)s and %(sacker2)s for %(distance2)s" % core.wrap_expressions(expressions)
+    expressions = core.wrap_expressions(expressions)
+    expressions = core.replace_forcer_with_forced_event(expressions)
+    expressions = core.replace_return_distance_with_return_event(expressions)
+    expressions = core.replace_tackler_with_tackle_event(expressions)
+
+    return r"%(fumbler)s fumbles%(forcer)s, recovered by %(recoverer)s at %(yardage)s%(return_distance)s%(tackler)s" % expressions
 
-    return re.search(pattern, play_description)
+
+FUMBLE_PATTERN = re.compile(_build_fumble_pattern())
 
 
 def parse_fumble(play_description: str) -> re.Match or None:
@@ -81,22 +120,34 @@ def parse_fumble(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
+    return FUMBLE_PATTERN.search(play_description)
+
+
+def _build_interception_pattern() -> str:
+    """
+    Builds the regex pattern for a INTERCEPTION play (see parse_interception)
+    """
     expressions = {
-        'fumbler': pc.PLAYER,
-        'forcer': pc.PLAYER,
-        'recoverer': pc.PLAYER,
+        'quarterback': pc.PLAYER,
+        'direction': r"|".join(pc.PASS_DIRECTIONS),
+        'defender': pc.PLAYER,
+        'receiver': pc.PLAYER,
+        'intercepter': pc.PLAYER,
         'yardage': pc.YARDAGE,
         'return_distance': r"|".join(pc.DISTANCES),
         'tackler': pc.PLAYER
     }
     expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_forcer_with_forced_event(expressions)
+    expressions['direction'] = core.make_optional(expressions['direction'])
+    expressions = core.replace_defender_with_defended_event(expressions)
+    expressions = core.replace_receiver_with_intended_event(expressions)
     expressions = core.replace_return_distance_with_return_event(expressions)
     expressions = core.replace_tackler_with_tackle_event(expressions)
 
-    pattern = r"%(fumbler)s fumbles%(forcer)s, recovered by %(recoverer)s at %(yardage)s%(return_distance)s%(tackler)s" % expressions
+    return r"%(quarterback)s pass%(direction)s%(defender)s%(receiver)s is intercepted by %(intercepter)s at %(yardage)s%(return_distance)s%(tackler)s" % expressions
 
-    return re.search(pattern, play_description)
+
+INTERCEPTION_PATTERN = re.compile(_build_interception_pattern())
 
 
 def parse_interception(play_description: str) -> re.Match or None:
@@ -123,23 +174,4 @@ def parse_interception(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
-    expressions = {
-        'quarterback': pc.PLAYER,
-        'direction': r"|".join(pc.PASS_DIRECTIONS),
-        'defender': pc.PLAYER,
-        'receiver': pc.PLAYER,
-        'intercepter': pc.PLAYER,
-        'yardage': pc.YARDAGE,
-        'return_distance': r"|".join(pc.DISTANCES),
-        'tackler': pc.PLAYER
-    }
-    expressions = core.wrap_expressions(expressions)
-    expressions['direction'] = core.make_optional(expressions['direction'])
-    expressions = core.replace_defender_with_defended_event(expressions)
-    expressions = core.replace_receiver_with_intended_event(expressions)
-    expressions = core.replace_return_distance_with_return_event(expressions)
-    expressions = core.replace_tackler_with_tackle_event(expressions)
-
-    pattern = r"%(quarterback)s pass%(direction)s%(defender)s%(receiver)s is intercepted by %(intercepter)s at %(yardage)s%(return_distance)s%(tackler)s" % expressions
-
-    return re.search(pattern, play_description)
\ No newline at end of file
+    return INTERCEPTION_PATTERN.search(play_description)
@@ -2,6 +2,26 @@ import re
 from . import play_components as pc
 from . import core
 
+def _build_penalty_pattern() -> str:
+    """
+    Builds the regex pattern for a PENALTY play (see parse_penalty)
+    """
+    expressions = {
+        'player': pc.PLAYER,
+        'penalty': pc.PENALTY,
+        'distance': r"|".join(pc.DISTANCES),
+        'response': r"|".join(pc.PENALTY_RESPONSES),
+        'no_play': pc.NO_PLAY
+    }
+    expressions = core.wrap_expressions(expressions)
+    expressions['response'] = core.make_optional(r"\(%s\)" % expressions['response'])
+    expressions['no_play'] = core.make_optional(r"\(%s\)" % expressions['no_play'])
+
+    return r"Penalty on %(player)s: %(penalty)s, %(distance)s%(response)s%(no_play)s" % expressions
+
+
+PENALTY_PATTERN = re.compile(_build_penalty_pattern())
+
 
 def parse_penalty(play_description: str) -> re.Match or None:
     """
@@ -21,20 +41,22 @@ def parse_penalty(play_description: str) -> re.Match or None:
             "no_play": None
         }
     """
+    return PENALTY_PATTERN.search(play_description)
+
+
+def _build_timeout_pattern() -> str:
+    """
+    Builds the regex pattern for a TIMEOUT play (see parse_timeout)
+    """
     expressions = {
-        'player': pc.PLAYER,
-        'penalty': pc.PENALTY,
-        'distance': r"|".join(pc.DISTANCES),
-        'response': r"|".join(pc.PENALTY_RESPONSES),
-        'no_play': pc.NO_PLAY
+        'timeout_number': r"#[\d]",
+        'team': pc.TEAM_NAME
     }
-    expressions = core.wrap_expressions(expressions)
-    expressions['response'] = core.make_optional(r"\(%s\)" % expressions['response'])
-    expressions['no_play'] = core.make_optional(r"\(%s\)" % expressions['no_play'])
 
-    pattern = r"Penalty on %(player)s: %(penalty)s, %(distance)s%(response)s%(no_play)s" % expressions
+    return r"Timeout %(timeout_number)s by %(team)s" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+TIMEOUT_PATTERN = re.compile(_build_timeout_pattern())
 
 
 def parse_timeout(play_description: str) -> re.Match or None:
@@ -53,14 +75,21 @@ def parse_timeout(play_description: str) -> re.Match or None:
             "team": "Chicago Bears"
         }
     """
+    return TIMEOUT_PATTERN.search(play_description)
+
+
+def _build_spike_pattern() -> str:
+    """
+    Builds the regex pattern for a SPIKE play (see parse_spike)
+    """
     expressions = {
-        'timeout_number': r"#[\d]",
-        'team': pc.TEAM_NAME
+        'player': pc.PLAYER
     }
 
-    pattern = r"Timeout %(timeout_number)s by %(team)s" % core.wrap_expressions(expressions)
+    return r"%(player)s spiked the ball" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+SPIKE_PATTERN = re.compile(_build_spike_pattern())
 
 
 def parse_spike(play_description: str) -> re.Match or None:
@@ -78,13 +107,20 @@ def parse_spike(play_description: str) -> re.Match or None:
             "player": "Justin Fields"
         }
     """
+    return SPIKE_PATTERN.search(play_description)
+
+
+def _build_kneel_pattern() -> str:
+    """
+    Builds the regex pattern for a KNEEL play (see parse_kneel)
+    """
     expressions = {
         'player': pc.PLAYER
     }
+    return r"%(player)s kneels" % core.wrap_expressions(expressions)
 
-    pattern = r"%(player)s spiked the ball" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+KNEEL_PATTERN = re.compile(_build_kneel_pattern())
 
 
 def parse_kneel(play_description: str) -> re.Match or None:
@@ -102,9 +138,4 @@ def parse_kneel(play_description: str) -> re.Match or None:
             "player": "Justin Fields"
         }
     """
-    expressions = {
-        'player': pc.PLAYER
-    }
-    pattern = r"%(player)s kneels" % core.wrap_expressions(expressions)
-
-    return re.search(pattern, play_description)
+    return KNEEL_PATTERN.search(play_description)
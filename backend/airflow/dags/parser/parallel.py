@@ -0,0 +1,64 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple
+from .classify import ENGINES, classify_play
+
+DEFAULT_CHUNK_SIZE = 16 # games per task
+
+
+def _init_worker():
+    """
+    Runs once when each worker process starts
+    Importing the registry compiles every play pattern, so each worker only compiles them once
+    (with the fork start method they are already compiled in the parent and this is a no-op)
+    """
+    from . import registry, combined
+
+
+def _parse_games(games: Sequence[Sequence[str]], engine: str) -> List[List[Tuple[str, dict] or None]]:
+    """
+    Classifies every play description in a chunk of games
+    """
+    return [[classify_play(description, engine=engine) for description in game] for game in games]
+
+
+def chunk_games(games: Sequence[Sequence[str]], chunk_size: int) -> List[Sequence[Sequence[str]]]:
+    """
+    Splits a list of games into chunks of (at most) chunk_size games
+    A game is never split across chunks
+    """
+    assert chunk_size > 0, 'chunk_size must be positive'
+    return [games[i:i + chunk_size] for i in range(0, len(games), chunk_size)]
+
+
+def parse_season(
+    games: Sequence[Sequence[str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int or None = None,
+    engine: str = 'dispatch'
+) -> List[List[Tuple[str, dict] or None]]:
+    """
+    Given a list of games, where each game is the list of its play by play descriptions,
+    classifies every description across a pool of worker processes
+
+    The games are sent to the workers in chunks of chunk_size games, and the results
+    are returned in the same order as the input, with one list of classify_play results per game
+
+    :param games: Play descriptions grouped by game (e.g. a full season)
+    :param chunk_size: Number of games sent to a worker at a time
+    :param max_workers: Number of worker processes (defaults to the number of cores)
+        If 1, the games are parsed in the current process
+    :param engine: classify_play engine used by the workers
+    """
+    assert engine in ENGINES, f'Invalid engine ({engine}). Must be one of: {ENGINES}'
+
+    games = list(games)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunks = chunk_games(games, chunk_size)
+
+    if max_workers == 1 or len(chunks) <= 1:
+        return _parse_games(games, engine)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        chunk_results = executor.map(_parse_games, chunks, [engine] * len(chunks))
+        return [game_result for chunk_result in chunk_results for game_result in chunk_result]
@@ -2,6 +2,27 @@ import re
 from . import play_components as pc
 from . import core
 
+def _build_pass_complete_pattern() -> str:
+    """
+    Builds the regex pattern for a PASS_COMPLETE play (see parse_pass_complete_play)
+    """
+    expressions = {
+        'passer': pc.PLAYER,
+        'direction': r"|".join(pc.PASS_DIRECTIONS),
+        'receiver': pc.PLAYER,
+        'distance': r"|".join(pc.DISTANCES),
+        'tackler': pc.PLAYER
+    }
+    expressions = core.wrap_expressions(expressions)
+    expressions = core.replace_tackler_with_tackle_event(expressions)
+    expressions['direction'] = core.make_optional(expressions['direction'])
+
+    return r"%(passer)s pass complete%(direction)s to %(receiver)s for %(distance)s%(tackler)s" % expressions
+
+
+PASS_COMPLETE_PATTERN = re.compile(_build_pass_complete_pattern())
+
+
 def parse_pass_complete_play(play_description: str) -> re.Match or None:
     """
     Given a play by play description, if it's a PASS_COMPLETE play,
@@ -20,20 +41,28 @@ def parse_pass_complete_play(play_description: str) -> re.Match or None:
             "tackler": Jalen Ramsey
         }
     """
+    return PASS_COMPLETE_PATTERN.search(play_description)
+
+
+def _build_pass_incomplete_pattern() -> str:
+    """
+    Builds the regex pattern for a PASS_INCOMPLETE play (see parse_pass_incomplete_play)
+    """
     expressions = {
         'passer': pc.PLAYER,
         'direction': r"|".join(pc.PASS_DIRECTIONS),
         'receiver': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES),
-        'tackler': pc.PLAYER
+        'defender': pc.PLAYER
     }
     expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_tackler_with_tackle_event(expressions)
+    expressions = core.replace_defender_with_defended_event(expressions)
+    expressions = core.replace_receiver_with_intended_event(expressions)
     expressions['direction'] = core.make_optional(expressions['direction'])
 
-    pattern = r"%(passer)s pass complete%(direction)s to %(receiver)s for %(distance)s%(tackler)s" % expressions
+    return r"%(passer)s pass incomplete%(direction)s%(receiver)s%(defender)s" % expressions
+
 
-    return re.search(pattern, play_description)
+PASS_INCOMPLETE_PATTERN = re.compile(_build_pass_incomplete_pattern())
 
 
 def parse_pass_incomplete_play(play_description: str) -> re.Match or None:
@@ -54,17 +83,4 @@ def parse_pass_incomplete_play(play_description: str) -> re.Match or None:
             "tackler": "Jalen Ramsey"
         }
     """
-    expressions = {
-        'passer': pc.PLAYER,
-        'direction': r"|".join(pc.PASS_DIRECTIONS),
-        'receiver': pc.PLAYER,
-        'defender': pc.PLAYER
-    }
-    expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_defender_with_defended_event(expressions)
-    expressions = core.replace_receiver_with_intended_event(expressions)
-    expressions['direction'] = core.make_optional(expressions['direction'])
-
-    pattern = r"%(passer)s pass incomplete%(direction)s%(receiver)s%(defender)s" % expressions
-
-    return re.search(pattern, play_description)
\ No newline at end of file
+    return PASS_INCOMPLETE_PATTERN.search(play_description)
@@ -1,4 +1,9 @@
-PLAYER = r"[A-Z][a-zA-Z, .'-]*[a-zA-Z]" # can't end with a space, must start w/ capital
+# can't end with a space, must start w/ capital
+# The length is capped (two full names joined by "and" fit comfortably) because the player expression
+# matches spaces and appears several times in a pattern. Unbounded, a long description that doesn't match
+# backtracks through every way to split it between the players, which grows polynomially with its length
+MAX_PLAYER_LENGTH = 60
+PLAYER = r"[A-Z][a-zA-Z, .'-]{0,%d}[a-zA-Z]" % (MAX_PLAYER_LENGTH - 2)
 
 # This is for matching run plays with no direction, because if the above player expression
 # is used, many other play types will match the "RUN_NO_DIRECTION" regex. So we instead 
@@ -39,7 +44,8 @@ FIELD_GOAL_STATUSES = [
     r"no good"
 ]
 
-PENALTY = r"[a-zA-Z \d()/]+"
+MAX_PENALTY_LENGTH = 100
+PENALTY = r"[a-zA-Z \d()/]{1,%d}" % MAX_PENALTY_LENGTH
 
 PENALTY_RESPONSES = [
     r"accepted",
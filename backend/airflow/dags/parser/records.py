@@ -0,0 +1,240 @@
+from typing import Dict, NamedTuple, Optional
+from .classify import classify_play
+from .decode import decode_distance, decode_yardage
+
+# Variables that capture a play_components.DISTANCES expression (e.g. "15 yards", "no gain")
+DISTANCE_FIELDS = {'distance', 'kick_distance', 'return_distance', 'punt_distance', 'distance1', 'distance2'}
+
+
+class PassComplete(NamedTuple):
+    passer: str
+    direction: Optional[str]
+    receiver: str
+    distance: int
+    tackler: Optional[str]
+
+
+class PassIncomplete(NamedTuple):
+    passer: str
+    direction: Optional[str]
+    receiver: Optional[str]
+    defender: Optional[str]
+
+
+class Interception(NamedTuple):
+    quarterback: str
+    direction: Optional[str]
+    defender: Optional[str]
+    receiver: Optional[str]
+    intercepter: str
+    yardage_side: Optional[str]
+    yardage_line: int
+    return_distance: Optional[int]
+    tackler: Optional[str]
+
+
+class SackFull(NamedTuple):
+    quarterback: str
+    sacker: str
+    distance: int
+
+
+class SackHalf(NamedTuple):
+    quarterback: str
+    sacker1: str
+    distance1: int
+    sacker2: str
+    distance2: int
+
+
+class KickoffTouchback(NamedTuple):
+    kicker: str
+    distance: int
+
+
+class KickoffReturned(NamedTuple):
+    kicker: str
+    kick_distance: int
+    returner: str
+    return_distance: int
+    tackler: Optional[str]
+
+
+class KickoffOutOfBounds(NamedTuple):
+    kicker: str
+    kick_distance: int
+
+
+class OnsideKick(NamedTuple):
+    kicker: str
+    kick_distance: int
+
+
+class FieldGoal(NamedTuple):
+    kicker: str
+    distance: int
+    status: str
+
+
+class ExtraPoint(NamedTuple):
+    kicker: str
+    status: str
+
+
+class PuntOutOfBounds(NamedTuple):
+    punter: str
+    distance: int
+
+
+class PuntDowned(NamedTuple):
+    punter: str
+    distance: int
+    downer: str
+
+
+class PuntFairCatch(NamedTuple):
+    punter: str
+    punt_distance: int
+    returner: str
+    yardage_side: Optional[str]
+    yardage_line: int
+
+
+class PuntReturned(NamedTuple):
+    punter: str
+    punt_distance: int
+    returner: str
+    return_distance: int
+    tackler: Optional[str]
+
+
+class PuntRecovered(NamedTuple):
+    punter: str
+    punt_distance: int
+    recoverer: str
+    yardage_side: Optional[str]
+    yardage_line: int
+
+
+class PuntTouchback(NamedTuple):
+    punter: str
+    punt_distance: int
+
+
+class PuntBlocked(NamedTuple):
+    punter: str
+    blocker: str
+
+
+class Spike(NamedTuple):
+    player: str
+
+
+class Kneel(NamedTuple):
+    player: str
+
+
+class Timeout(NamedTuple):
+    timeout_number: str
+    team: str
+
+
+class RunPlay(NamedTuple):
+    runner: str
+    direction: str
+    distance: int
+    tackler: Optional[str]
+
+
+class RunNoDirectionPlay(NamedTuple):
+    runner: str
+    distance: int
+    tackler: Optional[str]
+
+
+class Fumble(NamedTuple):
+    fumbler: str
+    forcer: Optional[str]
+    recoverer: str
+    yardage_side: Optional[str]
+    yardage_line: int
+    return_distance: Optional[int]
+    tackler: Optional[str]
+
+
+class Penalty(NamedTuple):
+    player: str
+    penalty: str
+    distance: int
+    response: Optional[str]
+    no_play: bool
+
+
+RECORD_TYPES: Dict[str, type] = {
+    'PASS_COMPLETE': PassComplete,
+    'PASS_INCOMPLETE': PassIncomplete,
+    'INTERCEPTION': Interception,
+    'SACK_FULL': SackFull,
+    'SACK_HALF': SackHalf,
+    'KICKOFF_TOUCHBACK': KickoffTouchback,
+    'KICKOFF_RETURNED': KickoffReturned,
+    'KICKOFF_OUT_OF_BOUNDS': KickoffOutOfBounds,
+    'ONSIDE_KICK': OnsideKick,
+    'FIELD_GOAL': FieldGoal,
+    'EXTRA_POINT': ExtraPoint,
+    'PUNT_OUT_OF_BOUNDS': PuntOutOfBounds,
+    'PUNT_DOWNED': PuntDowned,
+    'PUNT_FAIR_CATCH': PuntFairCatch,
+    'PUNT_RETURNED': PuntReturned,
+    'PUNT_RECOVERED': PuntRecovered,
+    'PUNT_TOUCHBACK': PuntTouchback,
+    'PUNT_BLOCKED': PuntBlocked,
+    'SPIKE': Spike,
+    'KNEEL': Kneel,
+    'TIMEOUT': Timeout,
+    'RUN': RunPlay,
+    'RUN_NO_DIRECTION': RunNoDirectionPlay,
+    'FUMBLE': Fumble,
+    'PENALTY': Penalty,
+}
+
+
+def to_record(play_type: str, groupdict: dict) -> NamedTuple:
+    """
+    Converts the regex match dictionary of a play into the play type's record,
+    parsing the distances and yardage into numbers
+
+    Example:
+        play_type = "RUN"
+        groupdict = {
+            "runner": "David Montgomery",
+            "direction": "right tackle",
+            "distance": "15 yards",
+            "tackler": None
+        }
+        returns: RunPlay(runner="David Montgomery", direction="right tackle", distance=15, tackler=None)
+    """
+    values = dict(groupdict)
+    for name in DISTANCE_FIELDS.intersection(values):
+        values[name] = decode_distance(values[name])
+    if 'yardage' in values:
+        (values['yardage_side'], values['yardage_line']) = decode_yardage(values.pop('yardage'))
+    if 'no_play' in values:
+        values['no_play'] = values['no_play'] is not None
+
+    return RECORD_TYPES[play_type](**values)
+
+
+def parse_play_record(play_description: str, engine: str = 'dispatch') -> NamedTuple or None:
+    """
+    Given a play by play description, returns the record for its play type
+    (e.g. PassComplete, PuntReturned)
+    Otherwise, returns None
+
+    Unlike the re.Match returned by the parse functions, the record doesn't hold a reference
+    to the description and its fields are already converted
+    """
+    classified = classify_play(play_description, engine=engine)
+    if not classified:
+        return None
+    return to_record(*classified)
@@ -0,0 +1,104 @@
+import re
+from typing import Callable, Dict, Tuple
+from . import run, pass_, defense, special_teams, misc
+
+# Each play type's pattern is assembled and compiled once when its module is imported,
+# so parsing a description is a single search against an already compiled pattern
+#
+# Play types are listed in the order they should be tried when classifying a description:
+# the primary play of a description (pass, kick, punt, etc.) comes before the run patterns,
+# and the events that are commonly appended to another play (fumbles, penalties) come last
+PATTERNS: Dict[str, re.Pattern] = {
+    'PASS_COMPLETE': pass_.PASS_COMPLETE_PATTERN,
+    'PASS_INCOMPLETE': pass_.PASS_INCOMPLETE_PATTERN,
+    'INTERCEPTION': defense.INTERCEPTION_PATTERN,
+    'SACK_FULL': defense.SACK_FULL_PATTERN,
+    'SACK_HALF': defense.SACK_HALF_PATTERN,
+    'KICKOFF_TOUCHBACK': special_teams.KICKOFF_TOUCHBACK_PATTERN,
+    'KICKOFF_RETURNED': special_teams.KICKOFF_RETURNED_PATTERN,
+    'KICKOFF_OUT_OF_BOUNDS': special_teams.KICKOFF_OUT_OF_BOUNDS_PATTERN,
+    'ONSIDE_KICK': special_teams.ONSIDE_KICK_PATTERN,
+    'FIELD_GOAL': special_teams.FIELD_GOAL_PATTERN,
+    'EXTRA_POINT': special_teams.EXTRA_POINT_PATTERN,
+    'PUNT_OUT_OF_BOUNDS': special_teams.PUNT_OUT_OF_BOUNDS_PATTERN,
+    'PUNT_DOWNED': special_teams.PUNT_DOWNED_PATTERN,
+    'PUNT_FAIR_CATCH': special_teams.PUNT_FAIR_CATCH_PATTERN,
+    'PUNT_RETURNED': special_teams.PUNT_RETURNED_PATTERN,
+    'PUNT_RECOVERED': special_teams.PUNT_RECOVERED_PATTERN,
+    'PUNT_TOUCHBACK': special_teams.PUNT_TOUCHBACK_PATTERN,
+    'PUNT_BLOCKED': special_teams.PUNT_BLOCKED_PATTERN,
+    'SPIKE': misc.SPIKE_PATTERN,
+    'KNEEL': misc.KNEEL_PATTERN,
+    'TIMEOUT': misc.TIMEOUT_PATTERN,
+    'RUN': run.RUN_PATTERN,
+    'RUN_NO_DIRECTION': run.RUN_NO_DIRECTION_PATTERN,
+    'FUMBLE': defense.FUMBLE_PATTERN,
+    'PENALTY': misc.PENALTY_PATTERN,
+}
+
+PARSERS: Dict[str, Callable[[str], re.Match or None]] = {
+    'PASS_COMPLETE': pass_.parse_pass_complete_play,
+    'PASS_INCOMPLETE': pass_.parse_pass_incomplete_play,
+    'INTERCEPTION': defense.parse_interception,
+    'SACK_FULL': defense.parse_sack_full,
+    'SACK_HALF': defense.parse_sack_half,
+    'KICKOFF_TOUCHBACK': special_teams.parse_kickoff_touchback,
+    'KICKOFF_RETURNED': special_teams.parse_kickoff_returned,
+    'KICKOFF_OUT_OF_BOUNDS': special_teams.parse_kickoff_out_of_bounds,
+    'ONSIDE_KICK': special_teams.parse_onside_kick,
+    'FIELD_GOAL': special_teams.parse_field_goal,
+    'EXTRA_POINT': special_teams.parse_extra_point,
+    'PUNT_OUT_OF_BOUNDS': special_teams.parse_punt_out,
+    'PUNT_DOWNED': special_teams.parse_punt_downed,
+    'PUNT_FAIR_CATCH': special_teams.parse_punt_fair_catch,
+    'PUNT_RETURNED': special_teams.parse_punt_returned,
+    'PUNT_RECOVERED': special_teams.parse_punt_recovered,
+    'PUNT_TOUCHBACK': special_teams.parse_punt_touchback,
+    'PUNT_BLOCKED': special_teams.parse_punt_blocked,
+    'SPIKE': misc.parse_spike,
+    'KNEEL': misc.parse_kneel,
+    'TIMEOUT': misc.parse_timeout,
+    'RUN': run.parse_run_play,
+    'RUN_NO_DIRECTION': run.parse_run_no_direction_play,
+    'FUMBLE': defense.parse_fumble,
+    'PENALTY': misc.parse_penalty,
+}
+
+PLAY_TYPES = list(PATTERNS.keys())
+
+# Literal text that must appear in a description for each play type's pattern to match
+# Checking these substrings is much cheaper than running a regex search, so they are used
+# to narrow down which parsers are worth trying on a given description
+#
+# Every anchor must be a fixed part of the play type's pattern, otherwise the classifier
+# could skip a parser that would have matched
+# The first anchor is used as the play type's keyword, so it should be the most distinctive
+ANCHORS: Dict[str, Tuple[str, ...]] = {
+    'PASS_COMPLETE': (' pass complete', ' to ', ' for '),
+    'PASS_INCOMPLETE': (' pass incomplete',),
+    'INTERCEPTION': (' is intercepted by ', ' pass'),
+    'SACK_FULL': (' sacked by ', ' for '),
+    'SACK_HALF': (' sacked by and ',),
+    'KICKOFF_TOUCHBACK': (' kicks off ', ', touchback'),
+    'KICKOFF_RETURNED': (' kicks off ', ', returned by ', ' for '),
+    'KICKOFF_OUT_OF_BOUNDS': (' kicks off ', ', out of bounds'),
+    'ONSIDE_KICK': (' kicks onside ',),
+    'FIELD_GOAL': (' field goal ',),
+    'EXTRA_POINT': (' kicks extra point ',),
+    'PUNT_OUT_OF_BOUNDS': (' punts ', ' out of bounds'),
+    'PUNT_DOWNED': (' punts ', ' downed by '),
+    'PUNT_FAIR_CATCH': (' punts ', ', fair catch by '),
+    'PUNT_RETURNED': (' punts ', ', returned by ', ' for '),
+    'PUNT_RECOVERED': (' punts ', ', recovered by '),
+    'PUNT_TOUCHBACK': (' punts ', ', touchback'),
+    'PUNT_BLOCKED': (' punts blocked by ',),
+    'SPIKE': (' spiked the ball',),
+    'KNEEL': (' kneels',),
+    'TIMEOUT': ('Timeout #',),
+    'RUN': (' for ',),
+    'RUN_NO_DIRECTION': (' for ',),
+    'FUMBLE': (' fumbles', ', recovered by '),
+    'PENALTY': ('Penalty on ',),
+}
+
+assert list(ANCHORS.keys()) == PLAY_TYPES, 'Every play type in the registry must have anchors'
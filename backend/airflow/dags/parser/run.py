@@ -2,6 +2,27 @@ import re
 from . import play_components as pc
 from . import core 
 
+def _build_run_pattern() -> str:
+    """
+    Builds the regex pattern for a RUN play (see parse_run_play)
+    """
+    expressions = {
+        'runner': pc.PLAYER,
+        'direction': r"|".join(pc.RUN_DIRECTIONS),
+        'distance': r"|".join(pc.DISTANCES),
+        'tackler': pc.PLAYER
+    }
+
+    # Make tackler optional
+    expressions = core.wrap_expressions(expressions)
+    expressions = core.replace_tackler_with_tackle_event(expressions)
+
+    return r"%(runner)s %(direction)s for %(distance)s%(tackler)s" % expressions
+
+
+RUN_PATTERN = re.compile(_build_run_pattern())
+
+
 def parse_run_play(play_description: str) -> re.Match or None:
     """
     Given a play by play description, if it's a RUN play,
@@ -20,10 +41,15 @@ def parse_run_play(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
+    return RUN_PATTERN.search(play_description)
+
 
+def _build_run_no_direction_pattern() -> str:
+    """
+    Builds the regex pattern for a RUN_NO_DIRECTION play (see parse_run_no_direction_play)
+    """
     expressions = {
-        'runner': pc.PLAYER,
-        'direction': r"|".join(pc.RUN_DIRECTIONS),
+        'runner': pc.STRICT_PLAYER,
         'distance': r"|".join(pc.DISTANCES),
         'tackler': pc.PLAYER
     }
@@ -32,8 +58,10 @@ def parse_run_play(play_description: str) -> re.Match or None:
     expressions = core.wrap_expressions(expressions)
     expressions = core.replace_tackler_with_tackle_event(expressions)
 
-    pattern = r"%(runner)s %(direction)s for %(distance)s%(tackler)s" % expressions
-    return re.search(pattern, play_description)
+    return r"^%(runner)s for %(distance)s%(tackler)s" % expressions
+
+
+RUN_NO_DIRECTION_PATTERN = re.compile(_build_run_no_direction_pattern())
 
 
 def parse_run_no_direction_play(play_description: str) -> re.Match or None:
@@ -53,16 +81,4 @@ def parse_run_no_direction_play(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
-
-    expressions = {
-        'runner': pc.STRICT_PLAYER,
-        'distance': r"|".join(pc.DISTANCES),
-        'tackler': pc.PLAYER
-    }
-
-    # Make tackler optional
-    expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_tackler_with_tackle_event(expressions)
-
-    pattern = r"^%(runner)s for %(distance)s%(tackler)s" % expressions
-    return re.search(pattern, play_description)
\ No newline at end of file
+    return RUN_NO_DIRECTION_PATTERN.search(play_description)
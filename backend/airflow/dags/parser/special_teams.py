@@ -2,6 +2,21 @@ import re
 from . import play_components as pc
 from . import core
 
+def _build_kickoff_touchback_pattern() -> str:
+    """
+    Builds the regex pattern for a KICKOFF_TOUCHBACK play (see parse_kickoff_touchback)
+    """
+    expressions = {
+        'kicker': pc.PLAYER,
+        'distance': r"|".join(pc.DISTANCES)
+    }
+
+    return r"%(kicker)s kicks off %(distance)s, touchback" % core.wrap_expressions(expressions)
+
+
+KICKOFF_TOUCHBACK_PATTERN = re.compile(_build_kickoff_touchback_pattern())
+
+
 def parse_kickoff_touchback(play_description: str) -> re.Match or None:
     """
     Given a play by play description, if it's a KICKOFF TOUCHBACK,
@@ -18,14 +33,27 @@ def parse_kickoff_touchback(play_description: str) -> re.Match or None:
             "kick_distance": "65 yards"
         }
     """
+    return KICKOFF_TOUCHBACK_PATTERN.search(play_description)
+
+
+def _build_kickoff_returned_pattern() -> str:
+    """
+    Builds the regex pattern for a KICKOFF_RETURNED play (see parse_kickoff_returned)
+    """
     expressions = {
         'kicker': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES)
+        'kick_distance': r"|".join(pc.DISTANCES),
+        'returner': pc.PLAYER,
+        'return_distance': r"|".join(pc.DISTANCES),
+        'tackler': pc.PLAYER
     }
+    expressions = core.wrap_expressions(expressions)
+    expressions = core.replace_tackler_with_tackle_event(expressions)
+
+    return r"%(kicker)s kicks off %(kick_distance)s, returned by %(returner)s for %(return_distance)s%(tackler)s" % expressions
 
-    pattern = r"%(kicker)s kicks off %(distance)s, touchback" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+KICKOFF_RETURNED_PATTERN = re.compile(_build_kickoff_returned_pattern())
 
 
 def parse_kickoff_returned(play_description: str) -> re.Match or None:
@@ -47,19 +75,22 @@ def parse_kickoff_returned(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
+    return KICKOFF_RETURNED_PATTERN.search(play_description)
+
+
+def _build_kickoff_out_of_bounds_pattern() -> str:
+    """
+    Builds the regex pattern for a KICKOFF_OUT_OF_BOUNDS play (see parse_kickoff_out_of_bounds)
+    """
     expressions = {
         'kicker': pc.PLAYER,
-        'kick_distance': r"|".join(pc.DISTANCES),
-        'returner': pc.PLAYER,
-        'return_distance': r"|".join(pc.DISTANCES),
-        'tackler': pc.PLAYER
+        'kick_distance': r"|".join(pc.DISTANCES)
     }
-    expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_tackler_with_tackle_event(expressions)
 
-    pattern = r"%(kicker)s kicks off %(kick_distance)s, returned by %(returner)s for %(return_distance)s%(tackler)s" % expressions
+    return r"%(kicker)s kicks off %(kick_distance)s, out of bounds" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+KICKOFF_OUT_OF_BOUNDS_PATTERN = re.compile(_build_kickoff_out_of_bounds_pattern())
 
 
 def parse_kickoff_out_of_bounds(play_description: str) -> re.Match or None:
@@ -78,14 +109,23 @@ def parse_kickoff_out_of_bounds(play_description: str) -> re.Match or None:
             "kick_distance": "73 yards"
         }
     """
+    return KICKOFF_OUT_OF_BOUNDS_PATTERN.search(play_description)
+
+
+def _build_field_goal_pattern() -> str:
+    """
+    Builds the regex pattern for a FIELD_GOAL play (see parse_field_goal)
+    """
     expressions = {
         'kicker': pc.PLAYER,
-        'kick_distance': r"|".join(pc.DISTANCES)
+        'distance': r"|".join(pc.DISTANCES),
+        'status': r"|".join(pc.FIELD_GOAL_STATUSES)
     }
 
-    pattern = r"%(kicker)s kicks off %(kick_distance)s, out of bounds" % core.wrap_expressions(expressions)
+    return r"%(kicker)s %(distance)s field goal %(status)s" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+FIELD_GOAL_PATTERN = re.compile(_build_field_goal_pattern())
 
 
 def parse_field_goal(play_description: str) -> re.Match or None:
@@ -105,15 +145,22 @@ def parse_field_goal(play_description: str) -> re.Match or None:
             "status": "good"
         }
     """
+    return FIELD_GOAL_PATTERN.search(play_description)
+
+
+def _build_extra_point_pattern() -> str:
+    """
+    Builds the regex pattern for a EXTRA_POINT play (see parse_extra_point)
+    """
     expressions = {
         'kicker': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES),
         'status': r"|".join(pc.FIELD_GOAL_STATUSES)
     }
 
-    pattern = r"%(kicker)s %(distance)s field goal %(status)s" % core.wrap_expressions(expressions)
+    return r"%(kicker)s kicks extra point %(status)s" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+EXTRA_POINT_PATTERN = re.compile(_build_extra_point_pattern())
 
 
 def parse_extra_point(play_description: str) -> re.Match or None:
@@ -132,14 +179,22 @@ def parse_extra_point(play_description: str) -> re.Match or None:
             "status": "good"
         }
     """
+    return EXTRA_POINT_PATTERN.search(play_description)
+
+
+def _build_punt_out_of_bounds_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_OUT_OF_BOUNDS play (see parse_punt_out)
+    """
     expressions = {
-        'kicker': pc.PLAYER,
-        'status': r"|".join(pc.FIELD_GOAL_STATUSES)
+        'punter': pc.PLAYER,
+        'distance': r"|".join(pc.DISTANCES)
     }
 
-    pattern = r"%(kicker)s kicks extra point %(status)s" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts %(distance)s out of bounds" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+PUNT_OUT_OF_BOUNDS_PATTERN = re.compile(_build_punt_out_of_bounds_pattern())
 
 
 def parse_punt_out(play_description: str) -> re.Match or None:
@@ -158,14 +213,23 @@ def parse_punt_out(play_description: str) -> re.Match or None:
             "distance": "45 yards"
         }
     """
+    return PUNT_OUT_OF_BOUNDS_PATTERN.search(play_description)
+
+
+def _build_punt_downed_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_DOWNED play (see parse_punt_downed)
+    """
     expressions = {
         'punter': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES)
+        'distance': r"|".join(pc.DISTANCES),
+        'downer': pc.PLAYER
     }
 
-    pattern = r"%(punter)s punts %(distance)s out of bounds" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts %(distance)s downed by %(downer)s" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+PUNT_DOWNED_PATTERN = re.compile(_build_punt_downed_pattern())
 
 
 def parse_punt_downed(play_description: str) -> re.Match or None:
@@ -185,15 +249,24 @@ def parse_punt_downed(play_description: str) -> re.Match or None:
             "downer": "Cordarrelle Patterson"
         }
     """
+    return PUNT_DOWNED_PATTERN.search(play_description)
+
+
+def _build_punt_fair_catch_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_FAIR_CATCH play (see parse_punt_fair_catch)
+    """
     expressions = {
         'punter': pc.PLAYER,
-        'distance': r"|".join(pc.DISTANCES),
-        'downer': pc.PLAYER
+        'punt_distance': r"|".join(pc.DISTANCES),
+        'returner': pc.PLAYER,
+        'yardage': pc.YARDAGE
     }
 
-    pattern = r"%(punter)s punts %(distance)s downed by %(downer)s" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts %(punt_distance)s, fair catch by %(returner)s at %(yardage)s" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+PUNT_FAIR_CATCH_PATTERN = re.compile(_build_punt_fair_catch_pattern())
 
 
 def parse_punt_fair_catch(play_description: str) -> re.Match or None:
@@ -214,16 +287,27 @@ def parse_punt_fair_catch(play_description: str) -> re.Match or None:
             "yardage": "DET-10"
         }
     """
+    return PUNT_FAIR_CATCH_PATTERN.search(play_description)
+
+
+def _build_punt_returned_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_RETURNED play (see parse_punt_returned)
+    """
     expressions = {
         'punter': pc.PLAYER,
         'punt_distance': r"|".join(pc.DISTANCES),
         'returner': pc.PLAYER,
-        'yardage': pc.YARDAGE
+        'return_distance': r"|".join(pc.DISTANCES),
+        'tackler': pc.PLAYER
     }
+    expressions = core.wrap_expressions(expressions)
+    expressions = core.replace_tackler_with_tackle_event(expressions)
 
-    pattern = r"%(punter)s punts %(punt_distance)s, fair catch by %(returner)s at %(yardage)s" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts %(punt_distance)s, returned by %(returner)s for %(return_distance)s%(tackler)s" % expressions
 
-    return re.search(pattern, play_description)
+
+PUNT_RETURNED_PATTERN = re.compile(_build_punt_returned_pattern())
 
 
 def parse_punt_returned(play_description: str) -> re.Match or None:
@@ -245,19 +329,24 @@ def parse_punt_returned(play_description: str) -> re.Match or None:
             "tackler": None
         }
     """
+    return PUNT_RETURNED_PATTERN.search(play_description)
+
+
+def _build_punt_recovered_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_RECOVERED play (see parse_punt_recovered)
+    """
     expressions = {
         'punter': pc.PLAYER,
         'punt_distance': r"|".join(pc.DISTANCES),
-        'returner': pc.PLAYER,
-        'return_distance': r"|".join(pc.DISTANCES),
-        'tackler': pc.PLAYER
+        'recoverer': pc.PLAYER,
+        'yardage': pc.YARDAGE
     }
-    expressions = core.wrap_expressions(expressions)
-    expressions = core.replace_tackler_with_tackle_event(expressions)
 
-    pattern = r"%(punter)s punts %(punt_distance)s, returned by %(returner)s for %(return_distance)s%(tackler)s" % expressions
+    return r"%(punter)s punts %(punt_distance)s, recovered by %(recoverer)s at %(yardage)s" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+PUNT_RECOVERED_PATTERN = re.compile(_build_punt_recovered_pattern())
 
 
 def parse_punt_recovered(play_description: str) -> re.Match or None:
@@ -278,16 +367,22 @@ def parse_punt_recovered(play_description: str) -> re.Match or None:
             "yardage": "CHI-10"
         }
     """
+    return PUNT_RECOVERED_PATTERN.search(play_description)
+
+
+def _build_punt_touchback_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_TOUCHBACK play (see parse_punt_touchback)
+    """
     expressions = {
         'punter': pc.PLAYER,
-        'punt_distance': r"|".join(pc.DISTANCES),
-        'recoverer': pc.PLAYER,
-        'yardage': pc.YARDAGE
+        'punt_distance': r"|".join(pc.DISTANCES)
     }
 
-    pattern = r"%(punter)s punts %(punt_distance)s, recovered by %(recoverer)s at %(yardage)s" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts %(punt_distance)s, touchback" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+PUNT_TOUCHBACK_PATTERN = re.compile(_build_punt_touchback_pattern())
 
 
 def parse_punt_touchback(play_description: str) -> re.Match or None:
@@ -306,14 +401,22 @@ def parse_punt_touchback(play_description: str) -> re.Match or None:
             "punt_distance": "45 yards"
         }
     """
+    return PUNT_TOUCHBACK_PATTERN.search(play_description)
+
+
+def _build_punt_blocked_pattern() -> str:
+    """
+    Builds the regex pattern for a PUNT_BLOCKED play (see parse_punt_blocked)
+    """
     expressions = {
         'punter': pc.PLAYER,
-        'punt_distance': r"|".join(pc.DISTANCES)
+        'blocker': pc.PLAYER
     }
 
-    pattern = r"%(punter)s punts %(punt_distance)s, touchback" % core.wrap_expressions(expressions)
+    return r"%(punter)s punts blocked by %(blocker)s" % core.wrap_expressions(expressions)
 
-    return re.search(pattern, play_description)
+
+PUNT_BLOCKED_PATTERN = re.compile(_build_punt_blocked_pattern())
 
 
 def parse_punt_blocked(play_description: str) -> re.Match or None:
@@ -332,14 +435,22 @@ def parse_punt_blocked(play_description: str) -> re.Match or None:
             "blocker": "Miles Killebrew"
         }
     """
+    return PUNT_BLOCKED_PATTERN.search(play_description)
+
+
+def _build_onside_kick_pattern() -> str:
+    """
+    Builds the regex pattern for a ONSIDE_KICK play (see parse_onside_kick)
+    """
     expressions = {
-        'punter': pc.PLAYER,
-        'blocker': pc.PLAYER
+        'kicker': pc.PLAYER,
+        'kick_distance': r"|".join(pc.DISTANCES)
     }
 
-    pattern = r"%(punter)s punts blocked by %(blocker)s" % core.wrap_expressions(expressions)
+    return r"%(kicker)s kicks onside %(kick_distance)s" % core.wrap_expressions(expressions)
+
 
-    return re.search(pattern, play_description)
+ONSIDE_KICK_PATTERN = re.compile(_build_onside_kick_pattern())
 
 
 def parse_onside_kick(play_description: str) -> re.Match or None:
@@ -358,11 +469,4 @@ def parse_onside_kick(play_description: str) -> re.Match or None:
             "kick_distance": "9 yards"
         }
     """
-    expressions = {
-        'kicker': pc.PLAYER,
-        'kick_distance': r"|".join(pc.DISTANCES)
-    }
-
-    pattern = r"%(kicker)s kicks onside %(kick_distance)s" % core.wrap_expressions(expressions)
-
-    return re.search(pattern, play_description)
\ No newline at end of file
+    return ONSIDE_KICK_PATTERN.search(play_description)
@@ -0,0 +1,57 @@
+from typing import Callable, Iterable, Iterator, List
+from utils.iterables import batched
+from .classify import classify_play
+
+DEFAULT_BATCH_SIZE = 1000 # plays per batch
+
+
+def stream_plays(play_descriptions: Iterable[str], engine: str = 'dispatch') -> Iterator[dict]:
+    """
+    Given an iterable of play by play descriptions (e.g. a file, table rows, or a database cursor),
+    lazily yields one parsed play record per description
+
+    Descriptions are only read from the input as records are requested, so memory stays flat
+    regardless of how many plays are streamed
+
+    Each record contains the description, the play type, and the regex match for each variable
+    Descriptions that don't match any play type have a play_type of None
+
+    Example:
+        play_descriptions = ["Timeout #1 by Chicago Bears"]
+        yields: {
+            "description": "Timeout #1 by Chicago Bears",
+            "play_type": "TIMEOUT",
+            "timeout_number": "#1",
+            "team": "Chicago Bears"
+        }
+    """
+    for play_description in play_descriptions:
+        classified = classify_play(play_description, engine=engine)
+        if classified:
+            (play_type, groupdict) = classified
+            yield {'description': play_description, 'play_type': play_type, **groupdict}
+        else:
+            yield {'description': play_description, 'play_type': None}
+
+
+def write_plays(
+    play_descriptions: Iterable[str],
+    flush: Callable[[List[dict]], None],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    engine: str = 'dispatch'
+) -> int:
+    """
+    Streams the parsed play records to a downstream writer, calling flush with every batch_size records
+    Parsing pauses while flush runs, so a slow writer throttles how fast the input is read
+
+    :param play_descriptions: Iterable of play by play descriptions
+    :param flush: Writer callback (e.g. a bulk insert or API post) that receives each batch of records
+    :param batch_size: Number of records per flush
+    :param engine: classify_play engine
+    :return: The total number of records written
+    """
+    total = 0
+    for batch in batched(stream_plays(play_descriptions, engine=engine), batch_size):
+        flush(batch)
+        total += len(batch)
+    return total
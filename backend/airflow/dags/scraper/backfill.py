@@ -0,0 +1,33 @@
+from typing import Callable, Dict, List
+from .checkpoint import SeasonCheckpoint
+from .games import PFR_BASE_URL, format_for_db, scrape_regular_season_games
+
+
+def backfill_season(
+    season: int,
+    upload: Callable[[List[dict]], None],
+    checkpoint: SeasonCheckpoint,
+    team_name_mapping: Dict,
+    source: str = PFR_BASE_URL
+) -> bool:
+    """
+    Scrapes, formats and uploads the games of a single season, unless the checkpoint says
+    it already finished, then records the season in the checkpoint
+
+    :param season: Season (year) to backfill
+    :param upload: Callback that writes the formatted games (e.g. a PUT to the API's upsert endpoint)
+    :param checkpoint: Checkpoint of the finished seasons, shared by every season of the backfill
+    :param team_name_mapping: Map from team names to team_id (see get_team_name_mapping)
+    :param source: Base URL of Pro Football Reference, or a directory of saved pages
+    :return: True if the season was backfilled, False if it was skipped
+    """
+    if checkpoint.is_complete(season):
+        print(f'Season {season} already backfilled, skipping')
+        return False
+
+    df = scrape_regular_season_games(season, source=source)
+    df = format_for_db(df, team_name_mapping)
+    upload(df.to_dict('records'))
+
+    checkpoint.mark_complete(season)
+    return True
@@ -0,0 +1,310 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from itertools import groupby
+from typing import Iterable, Iterator, List, Tuple
+import requests
+from parser.cache import ParseCache
+from parser.decode import decode_distance, decode_yardage
+
+PFR_BASE_URL = 'https://www.pro-football-reference.com'
+
+DEFAULT_MAX_WORKERS = 4 # concurrent fetches
+DEFAULT_REQUESTS_PER_MINUTE = 20 # PFR blocks clients that send more than this
+
+# Columns of the play by play table (by their data-stat attribute) and the key they're stored under
+PBP_COLUMNS = {
+    'quarter': 'quarter',
+    'qtr_time_remain': 'time_remaining',
+    'down': 'down',
+    'yds_to_go': 'yards_to_go',
+    'location': 'location',
+    'detail': 'description',
+}
+
+# Variables of each play type stored in the typed columns of the plays table:
+#   player: the player with the ball (or the player called for the penalty)
+#   target: the player the ball goes to (receiver, returner, intercepter, recoverer)
+#   defender: the player who made the tackle, sack, block or forced fumble
+#   yards: the main distance of the play (gained, kicked, or penalized)
+PLAY_COLUMN_FIELDS = {
+    'PASS_COMPLETE':         ('passer',      'receiver',    'tackler',  'distance'),
+    'PASS_INCOMPLETE':       ('passer',      'receiver',    'defender', None),
+    'INTERCEPTION':          ('quarterback', 'intercepter', 'tackler',  'return_distance'),
+    'SACK_FULL':             ('quarterback', None,          'sacker',   'distance'),
+    'SACK_HALF':             ('quarterback', None,          'sacker1',  'distance1'),
+    'KICKOFF_TOUCHBACK':     ('kicker',      None,          None,       'distance'),
+    'KICKOFF_RETURNED':      ('kicker',      'returner',    'tackler',  'kick_distance'),
+    'KICKOFF_OUT_OF_BOUNDS': ('kicker',      None,          None,       'kick_distance'),
+    'ONSIDE_KICK':           ('kicker',      None,          None,       'kick_distance'),
+    'FIELD_GOAL':            ('kicker',      None,          None,       'distance'),
+    'EXTRA_POINT':           ('kicker',      None,          None,       None),
+    'PUNT_OUT_OF_BOUNDS':    ('punter',      None,          None,       'distance'),
+    'PUNT_DOWNED':           ('punter',      'downer',      None,       'distance'),
+    'PUNT_FAIR_CATCH':       ('punter',      'returner',    None,       'punt_distance'),
+    'PUNT_RETURNED':         ('punter',      'returner',    'tackler',  'punt_distance'),
+    'PUNT_RECOVERED':        ('punter',      'recoverer',   None,       'punt_distance'),
+    'PUNT_TOUCHBACK':        ('punter',      None,          None,       'punt_distance'),
+    'PUNT_BLOCKED':          ('punter',      None,          'blocker',  None),
+    'SPIKE':                 ('player',      None,          None,       None),
+    'KNEEL':                 ('player',      None,          None,       None),
+    'TIMEOUT':               (None,          None,          None,       None),
+    'RUN':                   ('runner',      None,          'tackler',  'distance'),
+    'RUN_NO_DIRECTION':      ('runner',      None,          'tackler',  'distance'),
+    'FUMBLE':                ('fumbler',     'recoverer',   'forcer',   'return_distance'),
+    'PENALTY':               ('player',      None,          None,       'distance'),
+}
+
+# Overtime is shown as "OT" in the quarter column
+OVERTIME_QUARTER = 5
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out calls to at most requests_per_minute,
+    no matter how many threads are waiting on it
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=20)
+        >>> limiter.wait() # returns immediately
+        >>> limiter.wait() # returns 3 seconds after the previous call
+    """
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE):
+        assert requests_per_minute > 0, 'requests_per_minute must be positive'
+
+        self.interval = 60 / requests_per_minute
+        self._next_request = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """
+        Blocks until the caller is allowed to send its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self.interval
+        time.sleep(start - now)
+
+
+class PlayByPlayTableParser(HTMLParser):
+    """
+    Collects the rows of the play by play table (<table id="pbp">) from a boxscore page
+    Each row is stored as a dict of the cell text keyed by the cell's data-stat attribute
+
+    Header rows (the table head, and the rows between quarters) are skipped
+    """
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self._in_table = False
+        self._in_body = False
+        self._row = None
+        self._column = None
+        self._text = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]):
+        attrs = dict(attrs)
+        if tag == 'table' and attrs.get('id') == 'pbp':
+            self._in_table = True
+        elif not self._in_table:
+            return
+        elif tag == 'tbody':
+            self._in_body = True
+        elif tag == 'tr' and self._in_body and 'thead' not in (attrs.get('class') or ''):
+            self._row = {}
+        elif tag in ('th', 'td') and self._row is not None:
+            self._column = attrs.get('data-stat')
+            self._text = []
+
+    def handle_endtag(self, tag: str):
+        if not self._in_table:
+            return
+        if tag == 'table':
+            self._in_table = False
+        elif tag == 'tbody':
+            self._in_body = False
+        elif tag in ('th', 'td') and self._column is not None:
+            self._row[self._column] = ''.join(self._text).strip()
+            self._column = None
+        elif tag == 'tr' and self._row is not None:
+            if self._row.get('detail'):
+                self.rows.append(self._row)
+            self._row = None
+
+    def handle_data(self, data: str):
+        if self._column is not None:
+            self._text.append(data)
+
+
+def extract_play_by_play(html: str) -> List[dict]:
+    """
+    Returns the rows of the play by play table in a boxscore page, in the order they were played
+    PFR sends every table after the first inside an HTML comment (and renders it with javascript),
+    so the comment markers are removed before parsing
+
+    Example:
+        returns: [
+            {
+                "quarter": "1",
+                "time_remaining": "15:00",
+                "down": "",
+                "yards_to_go": "",
+                "location": "CHI 35",
+                "description": "Cairo Santos kicks off 65 yards, touchback"
+            },
+            ...
+        ]
+    """
+    table_parser = PlayByPlayTableParser()
+    table_parser.feed(html.replace('<!--', '').replace('-->', ''))
+    table_parser.close()
+    return [{key: row.get(column, '') for (column, key) in PBP_COLUMNS.items()} for row in table_parser.rows]
+
+
+def fetch_boxscore(
+    prf_game_id: str,
+    source: str = PFR_BASE_URL,
+    session: requests.Session or None = None,
+    rate_limiter: RateLimiter or None = None
+) -> str:
+    """
+    Returns the HTML of a game's boxscore page
+
+    :param prf_game_id: Pro Football Reference game id (e.g. "202109120chi")
+    :param source: Either the base URL of the site (PFR or a local fixture server),
+        or a directory of saved pages named {prf_game_id}.htm
+    :param session: Session used for the request (so connections are reused across games)
+    :param rate_limiter: Shared limiter to wait on before sending the request (not used for directories)
+    """
+    if os.path.isdir(source):
+        with open(os.path.join(source, f'{prf_game_id}.htm'), encoding='utf-8') as html_file:
+            return html_file.read()
+
+    if rate_limiter is not None:
+        rate_limiter.wait()
+    res = (session or requests).get(f'{source.rstrip("/")}/boxscores/{prf_game_id}.htm', timeout=30)
+
+    assert res.status_code == 200, f'Error fetching {prf_game_id} ({res.status_code})'
+
+    return res.text
+
+
+def fetch_boxscores(
+    prf_game_ids: Iterable[str],
+    source: str = PFR_BASE_URL,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE
+) -> Iterator[Tuple[str, str]]:
+    """
+    Fetches the boxscore page of every game across a pool of threads, yielding (prf_game_id, html)
+    pairs in the same order as the input
+
+    At most max_workers requests are in flight at once, and the requests are spaced out
+    to at most requests_per_minute (across all threads)
+    """
+    rate_limiter = RateLimiter(requests_per_minute)
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetch = lambda prf_game_id: fetch_boxscore(prf_game_id, source, session, rate_limiter)
+        prf_game_ids = list(prf_game_ids)
+        yield from zip(prf_game_ids, executor.map(fetch, prf_game_ids))
+
+
+def parse_boxscore(prf_game_id: str, html: str, parse_cache: ParseCache or None = None) -> List[dict]:
+    """
+    Parses every play in a boxscore page, returning one record per play with the game id,
+    the index of the play in the game, the play by play table columns, the play type,
+    and the regex match for each variable
+    Descriptions that don't match any play type have a play_type of None
+
+    Example:
+        returns: [
+            {
+                "prf_game_id": "202109120chi",
+                "play_index": 0,
+                "quarter": "1",
+                "time_remaining": "15:00",
+                ...,
+                "description": "Cairo Santos kicks off 65 yards, touchback",
+                "play_type": "KICKOFF_TOUCHBACK",
+                "kicker": "Cairo Santos",
+                "kick_distance": "65 yards"
+            },
+            ...
+        ]
+    """
+    parse_cache = parse_cache or ParseCache()
+    plays = []
+    for (play_index, row) in enumerate(extract_play_by_play(html)):
+        (play_type, groupdict) = parse_cache.classify(row['description']) or (None, {})
+        plays.append({'prf_game_id': prf_game_id, 'play_index': play_index, **row, 'play_type': play_type, **groupdict})
+    return plays
+
+
+def _to_int(value: str) -> int or None:
+    return int(value) if value.isdigit() else None
+
+
+def to_play_row(play: dict) -> dict:
+    """
+    Converts a parsed play (see parse_boxscore) into a row of the plays table, with the
+    play's variables moved into the typed player, target, defender and yards columns,
+    and the location split into the side of the field and the yard line
+
+    Example:
+        play: {"prf_game_id": "202109120chi", "play_index": 1, "quarter": "1", "location": "LAR 25",
+               "play_type": "RUN", "runner": "Darrell Henderson", "distance": "3 yards", "tackler": None, ...}
+        returns: {"prf_game_id": "202109120chi", "play_index": 1, "quarter": 1, "field_side": "LAR", "field_line": 25,
+                  "play_type": "RUN", "player": "Darrell Henderson", "target": None, "defender": None, "yards": 3, ...}
+    """
+    (player, target, defender, yards) = PLAY_COLUMN_FIELDS.get(play['play_type'], (None, None, None, None))
+    (field_side, field_line) = decode_yardage(play['location'].replace(' ', '-') or None)
+    return {
+        'prf_game_id': play['prf_game_id'],
+        'play_index': play['play_index'],
+        'quarter': OVERTIME_QUARTER if play['quarter'] == 'OT' else _to_int(play['quarter']),
+        'time_remaining': play['time_remaining'] or None,
+        'down': _to_int(play['down']),
+        'yards_to_go': _to_int(play['yards_to_go']),
+        'field_side': field_side,
+        'field_line': field_line,
+        'description': play['description'],
+        'play_type': play['play_type'],
+        'player': play.get(player),
+        'target': play.get(target),
+        'defender': play.get(defender),
+        'yards': decode_distance(play.get(yards)),
+    }
+
+
+def batched_games(plays: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    """
+    Lazily groups plays into lists of at least batch_size plays (except the last),
+    without splitting a game across batches
+    """
+    batch = []
+    for (_, game_plays) in groupby(plays, key=lambda play: play['prf_game_id']):
+        batch.extend(game_plays)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def scrape_plays(
+    prf_game_ids: Iterable[str],
+    source: str = PFR_BASE_URL,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE
+) -> Iterator[dict]:
+    """
+    Fetches and parses the play by play of every game, lazily yielding one record per play
+    (see parse_boxscore)
+    A single parse cache is shared across games, since many descriptions repeat (e.g. kickoffs and timeouts)
+    """
+    parse_cache = ParseCache()
+    for (prf_game_id, html) in fetch_boxscores(prf_game_ids, source, max_workers, requests_per_minute):
+        yield from parse_boxscore(prf_game_id, html, parse_cache)
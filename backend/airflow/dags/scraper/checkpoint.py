@@ -0,0 +1,58 @@
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from typing import Set
+
+
+class SeasonCheckpoint:
+    """
+    Records which seasons of a backfill finished in a JSON file, so a restarted backfill
+    only redoes the seasons that didn't finish
+
+    Seasons run as separate (possibly concurrent) tasks, so every update holds an exclusive
+    lock on {path}.lock and the file is replaced atomically
+
+    Example:
+        >>> checkpoint = SeasonCheckpoint('/opt/airflow/data/backfill_checkpoint.json')
+        >>> checkpoint.mark_complete(1970)
+        >>> checkpoint.completed()
+        {1970}
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    @contextmanager
+    def _lock(self):
+        with open(f'{self.path}.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Set[int]:
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path) as checkpoint_file:
+            return set(json.load(checkpoint_file)['completed'])
+
+    def completed(self) -> Set[int]:
+        with self._lock():
+            return self._read()
+
+    def is_complete(self, season: int) -> bool:
+        return season in self.completed()
+
+    def mark_complete(self, season: int):
+        with self._lock():
+            completed = self._read() | {season}
+            temp_path = f'{self.path}.tmp'
+            with open(temp_path, 'w') as checkpoint_file:
+                json.dump({'completed': sorted(completed)}, checkpoint_file)
+            os.replace(temp_path, self.path)
+
+    def reset(self):
+        with self._lock():
+            if os.path.exists(self.path):
+                os.remove(self.path)
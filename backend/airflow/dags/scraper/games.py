@@ -0,0 +1,155 @@
+import pandas as pd
+import numpy as np
+from typing import Dict
+
+PFR_BASE_URL = 'https://www.pro-football-reference.com'
+TEAMS_PATH = '/opt/airflow/data/teams.csv'
+
+# Names used by Pro Football Reference in past seasons that aren't in teams.csv,
+# mapped to the team_id of the same franchise
+HISTORICAL_TEAM_NAMES = {
+    'Baltimore Colts': 'IND',
+    'Boston Patriots': 'NE',
+    'Houston Oilers': 'TEN',
+    'Tennessee Oilers': 'TEN',
+    'Los Angeles Raiders': 'OAK',
+    'St. Louis Cardinals': 'ARI',
+    'Phoenix Cardinals': 'ARI',
+    'St. Louis Rams': 'STL',
+    'Washington Commanders': 'WSH',
+}
+
+
+def scrape_regular_season_games(year: int, source: str = PFR_BASE_URL) -> pd.DataFrame:
+    """
+    Scrapes the regular season games from Pro Football Reference 
+
+    :param source: Either the base URL of the site, or a directory of saved pages (at years/{year}/games.htm)
+    """
+    df = pd.read_html(f"{source.rstrip('/')}/years/{year}/games.htm")[0]    
+
+    # Remove header rows between weeks
+    df = df[df.Week != 'Week']
+
+    # Remove preseason games
+    df = df[df['Week'].str.startswith('Pre') == False]
+
+    # Remove playoff games (weeks named e.g. "WildCard", "Division", "SuperBowl") and any other
+    # rows without a week number, which completed seasons list after the regular season
+    df = df[df['Week'].astype(str).str.isdigit()]
+
+    # Fix columns
+    # At the start of the season, they don't have the points columns
+    if len(df.columns) == 9:
+        df.columns = ['week', 'dow', 'date', 'away_team', 'at', 'away_score', 'home_team', 'home_score', 'time']
+    else:
+        df.columns = [
+            'week', 'dow', 'date', 'time', 
+            'away_team', 'at', 'home_team', 'boxscore', 
+            'away_score', 'home_score', 
+            'home_yards', 'tow', 'away_yards', 'tol'
+        ]
+
+    # Drop columns (if they exist)
+    drop_columns = set(df.columns).intersection({'boxscore', 'home_yards', 'away_yards', 'tow', 'tol'})
+    df = df.drop(columns=drop_columns)
+
+    # The scores were read as text (because of the header rows), and are missing for games not played yet
+    df = df.assign(
+        away_score=pd.to_numeric(df['away_score']).astype('Int64'),
+        home_score=pd.to_numeric(df['home_score']).astype('Int64'),
+    )
+
+    return swap_home_away(df, year)
+
+
+def swap_home_away(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """
+    If the season has already begun, the teams will be displayed as winner/loser (rather than home/away)
+    so we'll want to switch the two team columns, along with their scores (points of the winner/loser)
+    Also adds the season (year) and casts the week
+    """
+    away_at_home = (df['at'] == '@').to_numpy()
+    (home_team, away_team) = (df['home_team'].to_numpy(), df['away_team'].to_numpy())
+    (home_score, away_score) = (df['home_score'].to_numpy(), df['away_score'].to_numpy())
+    df = df.assign(
+        away_team=np.where(away_at_home, away_team, home_team),
+        home_team=np.where(away_at_home, home_team, away_team),
+        away_score=np.where(away_at_home, away_score, home_score),
+        home_score=np.where(away_at_home, home_score, away_score),
+        season=year,
+        week=df['week'].astype('int'),
+    )
+    return df
+
+
+def get_team_name_mapping(path: str = TEAMS_PATH, historical: bool = False) -> Dict:
+    """
+    Reads the CSV file that contains each team and returns a dictionary that maps each 
+    team's full name to it's team_id
+
+    :param historical: If True, also maps inactive teams and the names of past seasons
+        (see HISTORICAL_TEAM_NAMES), otherwise only active teams are mapped
+    """
+    teams = pd.read_csv(path)
+    if not historical:
+        teams = teams[teams.active]
+
+    teams_mapping = dict(zip(teams['city'] + ' ' + teams['mascot'], teams['team_id']))
+    if historical:
+        teams_mapping.update(HISTORICAL_TEAM_NAMES)
+
+    return teams_mapping
+
+
+def _to_datetime(df: pd.DataFrame) -> pd.Series:
+    """
+    Converts the date and time columns into a single datetime column
+    The date is formatted differently before the season (e.g. "September 9", "8:20 PM")
+    and during the season (e.g. "2021-09-09", "8:20PM")
+    """
+    before_season = pd.to_datetime(
+        df['date'] + ' ' + df['season'].astype(str) + ' ' + df['time'], format='%B %d %Y %I:%M %p', errors='coerce'
+    )
+    # Games in January and February are played the year after the season starts
+    before_season = before_season.mask(before_season.dt.month < 3, before_season + pd.Timedelta(days=365))
+
+    during_season = pd.to_datetime(df['date'] + ' ' + df['time'], format='%Y-%m-%d %I:%M%p', errors='coerce')
+
+    datetimes = before_season.fillna(during_season)
+    assert datetimes.notna().all(), f'Invalid dates: {df.loc[datetimes.isna(), ["date", "time"]].values.tolist()}'
+
+    return datetimes
+
+
+def format_for_db(df: pd.DataFrame, team_name_mapping: Dict or None = None) -> pd.DataFrame:
+    """
+    Formats the dataframe with the columns needed in the database
+    The dataframe can contain several seasons (e.g. every season of a backfill concatenated)
+    """
+    # Add the team IDs from full team name
+    team_name_mapping = team_name_mapping or get_team_name_mapping()
+
+    df = df.assign(
+        home_team_id=df['home_team'].map(team_name_mapping),
+        away_team_id=df['away_team'].map(team_name_mapping),
+    )
+    missing = set(df.loc[df['home_team_id'].isna(), 'home_team']) | set(df.loc[df['away_team_id'].isna(), 'away_team'])
+    assert not missing, f'Teams {sorted(missing)} not in teams.csv'
+
+    # Add a datetime and game_id column
+    # The game id is a concatenation of the date and home team ID
+    datetimes = _to_datetime(df)
+    df['game_id'] = datetimes.dt.strftime('%Y%m%d') + '_' + df['home_team_id']
+
+    # Cast the datetime to a string
+    df['datetime'] = datetimes.dt.strftime('%Y-%m-%d %H:%M:%S')
+
+    df = df[[
+        'game_id', 'season', 'week', 'datetime', 'home_team_id', 'away_team_id', 'home_score', 'away_score'
+    ]]
+
+    # Fill all NaN's with None for the API
+    df = df.astype(object).where(df.notna(), None)
+
+    return df
@@ -0,0 +1,48 @@
+import sys
+import pytest
+from parser import classify, registry
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--parser-engine', default=None, choices=classify.ENGINES,
+        help='Run the parser tests against a classify_play engine instead of the individual parse functions'
+    )
+
+
+class EngineMatch:
+    """
+    Stands in for the re.Match returned by a parse function, using the fields from classify_play
+    """
+    def __init__(self, groupdict: dict):
+        self._groupdict = groupdict
+
+    def groupdict(self) -> dict:
+        return dict(self._groupdict)
+
+
+def _engine_parser(play_type: str, engine: str):
+    """
+    Returns a function that behaves like the play type's parse function, but uses the
+    classify_play engine: a match is only returned if the description is classified as the play type
+    """
+    def parser_function(play_description: str) -> EngineMatch or None:
+        classified = classify.classify_play(play_description, engine=engine)
+        if classified and classified[0] == play_type:
+            return EngineMatch(classified[1])
+        return None
+    return parser_function
+
+
+@pytest.fixture(autouse=True)
+def parser_engine(request, monkeypatch):
+    """
+    If --parser-engine is given, replaces every parse function with the engine equivalent
+    so the existing test suites run unchanged against that engine
+    """
+    engine = request.config.getoption('--parser-engine')
+    if engine:
+        for (play_type, parser_function) in registry.PARSERS.items():
+            module = sys.modules[parser_function.__module__]
+            monkeypatch.setattr(module, parser_function.__name__, _engine_parser(play_type, engine))
+    return engine
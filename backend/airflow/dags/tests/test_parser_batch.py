@@ -0,0 +1,40 @@
+import pandas as pd
+import play_examples
+from parser import batch, classify
+
+class TestParseBatch:
+
+    def test_parse_plays_matches_classify(self):
+        """
+        Test that the vectorized parse returns the same play type and fields as classify_play
+        """
+        descriptions = pd.Series([examples[0] for examples in play_examples.ALL_PLAY_EXAMPLES.values()])
+        plays = batch.parse_plays(descriptions)
+
+        assert list(plays.columns) == ['play_type'] + batch.FIELD_NAMES
+        for (description, (_, play)) in zip(descriptions, plays.iterrows()):
+            (play_type, groupdict) = classify.classify_play(description)
+            assert play['play_type'] == play_type
+
+            fields = {name: (None if pd.isna(value) else value) for (name, value) in play.drop('play_type').items()}
+            assert {name: value for (name, value) in fields.items() if name in groupdict} == groupdict
+            assert all(value is None for (name, value) in fields.items() if name not in groupdict)
+
+
+    def test_parse_plays_shared_columns(self):
+        """
+        Test that variables shared across play types end up in the same column
+        """
+        descriptions = pd.Series([
+            'David Montgomery right tackle for 10 yards (tackle by Aaron Donald)',
+            "Pat O'Donnell punts 45 yards, returned by Cordarrelle Patterson for 27 yards (tackle by Pat O'Donnell)",
+            'End of Regulation'
+        ], index=[10, 11, 12])
+        plays = batch.parse_plays(descriptions)
+
+        assert list(plays.index) == [10, 11, 12]
+        assert list(plays['play_type'][:2]) == ['RUN', 'PUNT_RETURNED']
+        assert pd.isna(plays['play_type'][12])
+        assert list(plays['tackler'][:2]) == ['Aaron Donald', "Pat O'Donnell"]
+        assert plays['distance'][10] == '10 yards'
+        assert plays['return_distance'][11] == '27 yards'
@@ -0,0 +1,85 @@
+import re
+from parser import cache, classify, registry
+
+TIMEOUT = 'Timeout #1 by Chicago Bears'
+EXTRA_POINT = 'Robbie Gould kicks extra point good'
+KICKOFF = 'Robbie Gould kicks off 65 yards, touchback'
+NOT_A_PLAY = 'End of Regulation'
+
+class TestParseCache:
+
+    def test_lru_cache_results(self):
+        """
+        Test that cached results are the same as classify_play
+        """
+        parse_cache = cache.ParseCache(max_size=10)
+        for description in (TIMEOUT, NOT_A_PLAY, TIMEOUT, NOT_A_PLAY):
+            assert parse_cache.classify(description) == classify.classify_play(description)
+
+        assert parse_cache.stats() == {'size': 2, 'hits': 2, 'misses': 2, 'evictions': 0}
+
+
+    def test_lru_cache_eviction(self):
+        """
+        Test that the least recently used description is evicted once the cache is full
+        """
+        parse_cache = cache.ParseCache(max_size=2)
+        parse_cache.classify(TIMEOUT)
+        parse_cache.classify(EXTRA_POINT)
+        parse_cache.classify(TIMEOUT) # hit, so EXTRA_POINT is now the least recently used
+        parse_cache.classify(KICKOFF) # evicts EXTRA_POINT
+        parse_cache.classify(TIMEOUT) # still cached
+        parse_cache.classify(EXTRA_POINT) # parsed again
+
+        assert parse_cache.stats() == {'size': 2, 'hits': 2, 'misses': 4, 'evictions': 2}
+
+
+    def test_lru_cache_returns_copies(self):
+        """
+        Test that modifying a returned match dict doesn't change the cached result
+        """
+        parse_cache = cache.ParseCache()
+        parse_cache.classify(TIMEOUT)[1]['team'] = 'Green Bay Packers'
+        assert parse_cache.classify(TIMEOUT)[1]['team'] == 'Chicago Bears'
+
+
+    def test_persistent_cache(self, tmp_path):
+        """
+        Test that results are stored on disk and reused by a new cache
+        """
+        path = str(tmp_path / 'parse_cache.db')
+        with cache.PersistentParseCache(path) as parse_cache:
+            assert parse_cache.classify(TIMEOUT) == classify.classify_play(TIMEOUT)
+            assert parse_cache.classify(NOT_A_PLAY) is None
+            assert parse_cache.stats() == {'size': 2, 'hits': 0, 'misses': 2, 'evictions': 0}
+
+        with cache.PersistentParseCache(path) as parse_cache:
+            assert parse_cache.classify(TIMEOUT) == classify.classify_play(TIMEOUT)
+            assert parse_cache.classify(NOT_A_PLAY) is None
+            assert parse_cache.stats() == {'size': 2, 'hits': 2, 'misses': 0, 'evictions': 0}
+
+
+    def test_persistent_cache_pattern_change(self, tmp_path):
+        """
+        Test that stored results are discarded when the patterns change
+        """
+        path = str(tmp_path / 'parse_cache.db')
+        with cache.PersistentParseCache(path, fingerprint='old patterns') as parse_cache:
+            parse_cache.classify(TIMEOUT)
+
+        with cache.PersistentParseCache(path, fingerprint='old patterns') as parse_cache:
+            assert parse_cache.stats()['size'] == 1
+
+        with cache.PersistentParseCache(path) as parse_cache:
+            assert parse_cache.stats()['size'] == 0
+            assert parse_cache.classify(TIMEOUT) == classify.classify_play(TIMEOUT)
+            assert parse_cache.stats() == {'size': 1, 'hits': 0, 'misses': 1, 'evictions': 0}
+
+
+    def test_patterns_fingerprint(self):
+        """
+        Test that the fingerprint changes with any pattern
+        """
+        changed = {**registry.PATTERNS, 'RUN': re.compile(registry.PATTERNS['RUN'].pattern + '$')}
+        assert cache.patterns_fingerprint() == cache.patterns_fingerprint(dict(registry.PATTERNS))
+        assert cache.patterns_fingerprint(changed) != cache.patterns_fingerprint()
@@ -0,0 +1,56 @@
+import play_examples
+from parser import classify, registry
+
+class TestParseClassify:
+
+    def test_classify_all_examples(self):
+        """
+        Test that every example is classified as its own play type,
+        with the same match dict as that play type's parser
+        """
+        for (play_type, examples) in play_examples.ALL_PLAY_EXAMPLES.items():
+            for example_string in examples:
+                classified = classify.classify_play(example_string)
+                assert classified, f'Example not classified: "{example_string}"'
+
+                (classified_type, groupdict) = classified
+                assert classified_type == play_type, \
+                    f'Example classified as {classified_type} instead of {play_type}: "{example_string}"'
+                assert groupdict == registry.PARSERS[play_type](example_string).groupdict()
+
+
+    def test_classify_matches_brute_force(self):
+        """
+        Test that the keyword dispatch returns the same result as trying every parser in order
+        """
+        descriptions = [
+            "Justin Fields pass complete short left to Darnell Mooney for 8 yards. Darnell Mooney fumbles, recovered by Jaire Alexander at CHI-30",
+            "David Montgomery left end for 3 yards. Penalty on Cody Whitehair: Offensive Holding, 10 yards (accepted)",
+            "Penalty on Jason Peters: False Start, 5 yards (no play)",
+            "Two-minute warning",
+            "End of Regulation",
+        ]
+        for description in descriptions:
+            expected = None
+            for (play_type, parser_function) in registry.PARSERS.items():
+                match = parser_function(description)
+                if match:
+                    expected = (play_type, match.groupdict())
+                    break
+            assert classify.classify_play(description) == expected
+
+
+    def test_classify_no_match(self):
+        """
+        Test that a description that isn't a play returns None
+        """
+        assert classify.classify_play('End of Regulation') is None
+
+
+    def test_candidate_play_types(self):
+        """
+        Test that the anchors narrow a description down to a few candidate parsers
+        """
+        assert classify.get_candidate_play_types('Robbie Gould kicks off 65 yards, touchback') == ['KICKOFF_TOUCHBACK']
+        assert classify.get_candidate_play_types('Timeout #1 by Chicago Bears') == ['TIMEOUT']
+        assert classify.get_candidate_play_types('David Montgomery left end for 3 yards') == ['RUN', 'RUN_NO_DIRECTION']
@@ -0,0 +1,41 @@
+import play_examples
+from parser import classify, combined
+
+class TestParseCombined:
+
+    def test_prefix_group_names(self):
+        """
+        Test that only the group names are renamed
+        """
+        pattern = r"(?P<runner>[A-Z]+) for (?P<distance>\d+)( \(tackle by (?P<tackler>[A-Z]+)\))?"
+        expected = r"(?P<RUN__runner>[A-Z]+) for (?P<RUN__distance>\d+)( \(tackle by (?P<RUN__tackler>[A-Z]+)\))?"
+        assert combined.prefix_group_names(pattern, 'RUN') == expected
+
+
+    def test_combined_all_examples(self):
+        """
+        Test that the combined engine classifies every example the same as the keyword dispatch
+        """
+        for (play_type, examples) in play_examples.ALL_PLAY_EXAMPLES.items():
+            for example_string in examples:
+                classified = combined.classify_play_combined(example_string)
+                assert classified and classified[0] == play_type, \
+                    f'Example not classified as {play_type}: "{example_string}"'
+                assert classified == classify.classify_play(example_string)
+                assert classify.classify_play(example_string, engine='combined') == classified
+
+
+    def test_combined_precedence(self):
+        """
+        Test that when multiple play types match, the first in registry order wins
+        """
+        description = "David Montgomery left end for 3 yards. Penalty on Cody Whitehair: Offensive Holding, 10 yards (accepted)"
+        (play_type, groupdict) = classify.classify_play(description, engine='combined')
+        assert play_type == 'RUN'
+        assert groupdict == {
+            'runner': 'David Montgomery',
+            'direction': 'left end',
+            'distance': '3 yards',
+            'tackler': None
+        }
+        assert classify.classify_play('End of Regulation', engine='combined') is None
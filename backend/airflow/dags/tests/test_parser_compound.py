@@ -0,0 +1,84 @@
+import random
+import play_examples
+from parser import compound, registry
+
+PASS_THEN_FUMBLE = (
+    'Justin Fields pass complete short left to Darnell Mooney for 8 yards (tackle by Jaire Alexander). '
+    'Darnell Mooney fumbles (forced by Jaire Alexander), recovered by Kenny Clark at CHI-30 and returned for no gain'
+)
+RUN_THEN_PENALTY = 'David Montgomery left end for 3 yards. Penalty on Cody Whitehair: Offensive Holding, 10 yards (accepted)'
+KICKOFF_THEN_FUMBLE = (
+    "Robbie Gould kicks off 65 yards, returned by Cordarrelle Patterson for 20 yards (tackle by Pat O'Donnell). "
+    'Cordarrelle Patterson fumbles, recovered by Khalil Mack at DET-25'
+)
+
+class TestDecomposePlay:
+
+    def test_single_event_descriptions(self):
+        """
+        Test that every example decomposes into a single event with the same match as its parser
+        """
+        rng = random.Random(0)
+        for (play_type, examples) in play_examples.ALL_PLAY_EXAMPLES.items():
+            for play_description in rng.sample(examples, min(200, len(examples))):
+                expected = [(play_type, registry.PARSERS[play_type](play_description).groupdict())]
+                assert compound.decompose_play(play_description) == expected, play_description
+
+
+    def test_pass_then_fumble(self):
+        """
+        Test a completed pass followed by a fumble and recovery
+        """
+        events = compound.decompose_play(PASS_THEN_FUMBLE)
+        assert [play_type for (play_type, _) in events] == ['PASS_COMPLETE', 'FUMBLE']
+
+        (_, completion), (_, fumble) = events
+        assert completion['receiver'] == 'Darnell Mooney'
+        assert completion['distance'] == '8 yards'
+        assert fumble['fumbler'] == 'Darnell Mooney'
+        assert fumble['forcer'] == 'Jaire Alexander'
+        assert fumble['recoverer'] == 'Kenny Clark'
+        assert fumble['yardage'] == 'CHI-30'
+
+
+    def test_run_then_penalty(self):
+        """
+        Test a run with a penalty appended
+        """
+        assert compound.decompose_play(RUN_THEN_PENALTY) == [
+            ('RUN', {'runner': 'David Montgomery', 'direction': 'left end', 'distance': '3 yards', 'tackler': None}),
+            ('PENALTY', {
+                'player': 'Cody Whitehair',
+                'penalty': 'Offensive Holding',
+                'distance': '10 yards',
+                'response': 'accepted',
+                'no_play': None
+            }),
+        ]
+
+
+    def test_kickoff_then_fumble(self):
+        """
+        Test a kickoff return followed by a fumble recovery
+        """
+        events = compound.decompose_play(KICKOFF_THEN_FUMBLE)
+        assert [play_type for (play_type, _) in events] == ['KICKOFF_RETURNED', 'FUMBLE']
+        assert events[1][1]['recoverer'] == 'Khalil Mack'
+
+
+    def test_no_events(self):
+        """
+        Test that descriptions without any events return an empty list
+        """
+        assert compound.decompose_play('End of Regulation') == []
+        assert compound.decompose_play('') == []
+
+
+    def test_long_descriptions(self):
+        """
+        Test that events are found across a very long description in a single pass
+        """
+        play_description = ' '.join([PASS_THEN_FUMBLE + '.'] * 500)
+        events = compound.decompose_play(play_description)
+        assert len(events) == 1000
+        assert [play_type for (play_type, _) in events[:4]] == ['PASS_COMPLETE', 'FUMBLE', 'PASS_COMPLETE', 'FUMBLE']
@@ -1,7 +1,8 @@
 import re
+import time
 import parser.play_components as pc
 import play_examples
-from parser import core
+from parser import core, registry
 
 class TestParseCore:
     
@@ -75,3 +76,15 @@ class TestParseCore:
         for penalty in play_examples.PENALTY_EXAMPLES:
             assert re.search(pc.PENALTY, penalty), \
                 f'Example penalty ({penalty}) did not match Penalty regex'
+
+
+    def test_player_regex_bounded_backtracking(self):
+        """
+        Test that long descriptions that almost match don't backtrack catastrophically
+        (with the unbounded player expression, this description took several seconds to search)
+        """
+        description = ' '.join(['Aaron sacked by and Khalil Mack for'] * 200)
+        for pattern in registry.PATTERNS.values():
+            start = time.perf_counter()
+            pattern.search(description)
+            assert time.perf_counter() - start < 0.5, f'Pattern backtracked too long: {pattern.pattern}'
@@ -0,0 +1,40 @@
+from parser import decode
+
+class TestParseDecode:
+
+    def test_decode_distance(self):
+        """
+        Test that distances are converted to yards
+        """
+        assert decode.decode_distance('15 yards') == 15
+        assert decode.decode_distance('1 yard') == 1
+        assert decode.decode_distance('-3 yards') == -3
+        assert decode.decode_distance('no gain') == 0
+        assert decode.decode_distance('250 yards') == 250 # not in the lookup table
+        assert decode.decode_distance(None) is None
+        assert decode.decode_distances(['no gain', '-1 yards', None]) == [0, -1, None]
+
+
+    def test_decode_yardage(self):
+        """
+        Test that yardage is split into the team_id of the side of the field and the yard line
+        """
+        assert decode.decode_yardage('CHI-10') == ('CHI', 10)
+        assert decode.decode_yardage('SF-5') == ('SF', 5)
+        assert decode.decode_yardage('GNB-35') == ('GB', 35)
+        assert decode.decode_yardage('50') == (None, 50)
+        assert decode.decode_yardage('XYZ-20') == ('XYZ', 20) # unknown team
+        assert decode.decode_yardage(None) == (None, None)
+
+
+    def test_decode_field_position(self):
+        """
+        Test that yardage is converted to a field position relative to the offense
+        """
+        assert decode.decode_field_position('CHI-10', 'CHI') == 10
+        assert decode.decode_field_position('CHI-10', 'GB') == 90
+        assert decode.decode_field_position('GNB-35', 'GB') == 35
+        assert decode.decode_field_position('GB-35', 'GNB') == 35
+        assert decode.decode_field_position('50', 'GB') == 50
+        assert decode.decode_field_position(None, 'GB') is None
+        assert decode.decode_field_positions(['CHI-1', 'SF-49'], ['CHI', 'CHI']) == [1, 51]
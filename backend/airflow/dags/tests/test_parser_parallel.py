@@ -0,0 +1,29 @@
+import play_examples
+from parser import classify, parallel
+
+# Three "games" of different lengths with a mix of play types
+GAMES = [
+    [examples[i] for examples in play_examples.ALL_PLAY_EXAMPLES.values() for i in range(n)]
+    for n in (1, 3, 2)
+]
+
+class TestParseParallel:
+
+    def test_chunk_games(self):
+        """
+        Test that games are grouped into chunks without splitting a game
+        """
+        games = [['a'], ['b', 'c'], ['d'], ['e']]
+        assert parallel.chunk_games(games, 3) == [[['a'], ['b', 'c'], ['d']], [['e']]]
+        assert parallel.chunk_games(games, 1) == [[['a']], [['b', 'c']], [['d']], [['e']]]
+
+
+    def test_parse_season_order(self):
+        """
+        Test that the results from the worker processes are returned in the input order
+        """
+        expected = [[classify.classify_play(description) for description in game] for game in GAMES]
+
+        assert parallel.parse_season(GAMES, chunk_size=1, max_workers=2) == expected
+        assert parallel.parse_season(GAMES, chunk_size=2, max_workers=2, engine='combined') == expected
+        assert parallel.parse_season(GAMES, max_workers=1) == expected
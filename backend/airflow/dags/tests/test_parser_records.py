@@ -0,0 +1,52 @@
+import play_examples
+from parser import records, registry
+
+class TestParseRecords:
+
+    def test_record_types_cover_all_play_types(self):
+        """
+        Test that every play type has a record type
+        """
+        assert list(records.RECORD_TYPES.keys()) == registry.PLAY_TYPES
+
+
+    def test_parse_play_record_all_play_types(self):
+        """
+        Test that the first and last examples of each play type parse into that play type's record
+        """
+        for (play_type, examples) in play_examples.ALL_PLAY_EXAMPLES.items():
+            for example_string in (examples[0], examples[-1]):
+                record = records.parse_play_record(example_string)
+                assert type(record) is records.RECORD_TYPES[play_type], \
+                    f'Example not parsed into a {play_type} record: "{example_string}"'
+
+
+    def test_interception_record(self):
+        """
+        Test the converted fields of an interception record
+        """
+        description = "Aaron Rodgers pass short right (defended by Jaylon Johnson) intended for Davante Adams" + \
+                      " is intercepted by Eddie Jackson at CHI-10 and returned for 45 yards"
+        expected = records.Interception(
+            quarterback='Aaron Rodgers',
+            direction='short right',
+            defender='Jaylon Johnson',
+            receiver='Davante Adams',
+            intercepter='Eddie Jackson',
+            yardage_side='CHI',
+            yardage_line=10,
+            return_distance=45,
+            tackler=None
+        )
+        assert records.parse_play_record(description) == expected
+
+
+    def test_penalty_record(self):
+        """
+        Test that the no play flag is converted to a boolean
+        """
+        record = records.parse_play_record('Penalty on Ndamukong Suh: Unnecessary Roughness, 15 yards (no play)')
+        assert record == records.Penalty(
+            player='Ndamukong Suh', penalty='Unnecessary Roughness', distance=15, response=None, no_play=True
+        )
+        assert records.parse_play_record('End of Regulation') is None
@@ -0,0 +1,26 @@
+import re
+import play_examples
+from parser import registry
+
+class TestParseRegistry:
+
+    def test_registry_covers_all_play_types(self):
+        """
+        Test that every play type has a compiled pattern and a parser function
+        """
+        assert set(registry.PLAY_TYPES) == set(play_examples.ALL_PLAY_TYPES)
+        assert list(registry.PARSERS.keys()) == registry.PLAY_TYPES
+        assert all(isinstance(pattern, re.Pattern) for pattern in registry.PATTERNS.values())
+
+
+    def test_parsers_use_registry_patterns(self):
+        """
+        Test that each parser function returns the same match as its compiled pattern
+        """
+        for (play_type, examples) in play_examples.ALL_PLAY_EXAMPLES.items():
+            description = examples[0]
+            match = registry.PARSERS[play_type](description)
+            expected = registry.PATTERNS[play_type].search(description)
+
+            assert match and match.re is registry.PATTERNS[play_type]
+            assert match.groupdict() == expected.groupdict()
@@ -0,0 +1,57 @@
+from itertools import count, islice
+from parser import stream
+
+class TestParseStream:
+
+    def test_stream_plays(self):
+        """
+        Test the records yielded for matched and unmatched descriptions
+        """
+        descriptions = ['Timeout #1 by Chicago Bears', 'End of Regulation']
+        assert list(stream.stream_plays(descriptions)) == [
+            {
+                'description': 'Timeout #1 by Chicago Bears',
+                'play_type': 'TIMEOUT',
+                'timeout_number': '#1',
+                'team': 'Chicago Bears'
+            },
+            {
+                'description': 'End of Regulation',
+                'play_type': None
+            }
+        ]
+
+
+    def test_stream_plays_is_lazy(self):
+        """
+        Test that descriptions are only read from the input as records are requested
+        """
+        read = []
+        def descriptions():
+            for i in count():
+                read.append(i)
+                yield f'Robbie Gould kicks off {i} yards, touchback'
+
+        records = list(islice(stream.stream_plays(descriptions()), 3))
+        assert [record['distance'] for record in records] == ['0 yards', '1 yards', '2 yards']
+        assert read == [0, 1, 2]
+
+
+    def test_batched(self):
+        """
+        Test that records are grouped into batches, with a smaller final batch
+        """
+        assert list(stream.batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(stream.batched([], 2)) == []
+
+
+    def test_write_plays(self):
+        """
+        Test that the writer is flushed every batch_size plays
+        """
+        flushed = []
+        descriptions = ['Justin Fields spiked the ball'] * 5
+        total = stream.write_plays(descriptions, flush=lambda batch: flushed.append(len(batch)), batch_size=2)
+
+        assert total == 5
+        assert flushed == [2, 2, 1]
@@ -0,0 +1,116 @@
+import os
+import threading
+import pytest
+from scraper import backfill, checkpoint, games
+
+pytest.importorskip('lxml') # used by pandas.read_html
+
+TEAMS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'teams.csv')
+
+HEADER = (
+    '<tr><th>Week</th><th>Day</th><th>Date</th><th>Time</th><th>Winner/tie</th><th></th>'
+    '<th>Loser/tie</th><th></th><th>PtsW</th><th>PtsL</th><th>YdsW</th><th>TOW</th><th>YdsL</th><th>TOL</th></tr>'
+)
+
+
+def games_page(season: int) -> str:
+    """
+    Trimmed down schedule page of a past season, with a header row repeated between weeks
+    and a playoff game after the regular season
+    """
+    rows = [
+        (1, f'{season}-09-13', 'Houston Oilers', '@', 'Baltimore Colts', 24, 17),
+        (1, f'{season}-09-13', 'Chicago Bears', '', 'Green Bay Packers', 20, 10),
+        (2, f'{season}-09-20', 'St. Louis Cardinals', '', 'Dallas Cowboys', 31, 28),
+        ('Division', f'{season + 1}-01-03', 'Dallas Cowboys', '', 'Chicago Bears', 17, 14),
+    ]
+    body = []
+    for (week, date, winner, at, loser, points_winner, points_loser) in rows:
+        if week in (2, 'Division'):
+            body.append(HEADER)
+        body.append(
+            f'<tr><th>{week}</th><td>Sun</td><td>{date}</td><td>1:00PM</td><td>{winner}</td><td>{at}</td>'
+            f'<td>{loser}</td><td>boxscore</td><td>{points_winner}</td><td>{points_loser}</td>'
+            f'<td>300</td><td>1</td><td>250</td><td>2</td></tr>'
+        )
+    return f'<html><body><table id="games"><thead>{HEADER}</thead><tbody>{"".join(body)}</tbody></table></body></html>'
+
+
+@pytest.fixture
+def pfr_directory(tmp_path):
+    """
+    Directory of saved schedule pages for 1970 and 1971 (but not 1972)
+    """
+    for season in (1970, 1971):
+        (tmp_path / 'years' / str(season)).mkdir(parents=True)
+        (tmp_path / 'years' / str(season) / 'games.htm').write_text(games_page(season))
+    return tmp_path
+
+
+class TestBackfill:
+
+    def test_backfill_season(self, pfr_directory, tmp_path):
+        """
+        Test that a season is scraped from the saved pages, formatted, uploaded and checkpointed
+        """
+        uploads = []
+        season_checkpoint = checkpoint.SeasonCheckpoint(str(tmp_path / 'checkpoint.json'))
+        team_name_mapping = games.get_team_name_mapping(TEAMS_PATH, historical=True)
+
+        assert backfill.backfill_season(1970, uploads.append, season_checkpoint, team_name_mapping, str(pfr_directory))
+        assert season_checkpoint.completed() == {1970}
+
+        [rows] = uploads
+        assert [row['game_id'] for row in rows] == ['19700913_IND', '19700913_CHI', '19700920_ARI']
+        assert [row['away_team_id'] for row in rows] == ['TEN', 'GB', 'DAL']
+        assert [(row['home_score'], row['away_score']) for row in rows] == [(17, 24), (20, 10), (31, 28)]
+        assert rows[0]['datetime'] == '1970-09-13 13:00:00'
+
+
+    def test_resume(self, pfr_directory, tmp_path):
+        """
+        Test that restarting a backfill skips the seasons that already finished
+        """
+        uploads = []
+        season_checkpoint = checkpoint.SeasonCheckpoint(str(tmp_path / 'checkpoint.json'))
+        team_name_mapping = games.get_team_name_mapping(TEAMS_PATH, historical=True)
+        run = lambda season: backfill.backfill_season(
+            season, uploads.append, season_checkpoint, team_name_mapping, str(pfr_directory)
+        )
+
+        assert run(1970)
+        with pytest.raises(Exception):
+            run(1972) # page is missing
+        assert season_checkpoint.completed() == {1970}
+
+        (pfr_directory / 'years' / '1972').mkdir()
+        (pfr_directory / 'years' / '1972' / 'games.htm').write_text(games_page(1972))
+        assert [run(season) for season in (1970, 1971, 1972)] == [False, True, True]
+        assert season_checkpoint.completed() == {1970, 1971, 1972}
+        assert len(uploads) == 3
+
+
+class TestSeasonCheckpoint:
+
+    def test_concurrent_updates(self, tmp_path):
+        """
+        Test that seasons marked complete at the same time are all recorded
+        """
+        season_checkpoint = checkpoint.SeasonCheckpoint(str(tmp_path / 'checkpoint.json'))
+        threads = [threading.Thread(target=season_checkpoint.mark_complete, args=(season,)) for season in range(1970, 2022)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert season_checkpoint.completed() == set(range(1970, 2022))
+
+
+    def test_reset(self, tmp_path):
+        """
+        Test that resetting the checkpoint clears every season
+        """
+        season_checkpoint = checkpoint.SeasonCheckpoint(str(tmp_path / 'checkpoint.json'))
+        season_checkpoint.mark_complete(1970)
+        season_checkpoint.reset()
+        assert season_checkpoint.completed() == set()
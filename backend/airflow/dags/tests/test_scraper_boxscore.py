@@ -0,0 +1,207 @@
+import functools
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from parser import combined, registry
+from scraper import boxscore
+
+# Trimmed down boxscore page, with the play by play table inside a comment like on PFR
+BOXSCORE_HTML = """
+<html><body>
+<table id="scoring"><tr><td data-stat="detail">Not a play</td></tr></table>
+<div id="all_pbp"><!--
+<table id="pbp">
+<thead><tr><th data-stat="quarter">Quarter</th><th data-stat="detail">Detail</th></tr></thead>
+<tbody>
+<tr>
+    <th data-stat="quarter">1</th><td data-stat="qtr_time_remain">15:00</td><td data-stat="down"></td>
+    <td data-stat="yds_to_go"></td><td data-stat="location">CHI 35</td>
+    <td data-stat="detail"><a href="/players/S/SantCa00.htm">Cairo Santos</a> kicks off 65 yards, touchback</td>
+</tr>
+<tr>
+    <th data-stat="quarter">1</th><td data-stat="qtr_time_remain">14:55</td><td data-stat="down">1</td>
+    <td data-stat="yds_to_go">10</td><td data-stat="location">LAR 25</td>
+    <td data-stat="detail"><a href="/players/H/HendDa00.htm">Darrell Henderson</a> left end for 3 yards</td>
+</tr>
+<tr class="thead"><th data-stat="quarter">2nd Quarter</th></tr>
+<tr>
+    <th data-stat="quarter">2</th><td data-stat="qtr_time_remain">15:00</td><td data-stat="down"></td>
+    <td data-stat="yds_to_go"></td><td data-stat="location"></td>
+    <td data-stat="detail">End of Quarter</td>
+</tr>
+</tbody>
+</table>
+--></div>
+</body></html>
+"""
+
+GAME_IDS = ['202109120ram', '202109190chi', '202109260chi']
+
+
+@pytest.fixture
+def boxscore_directory(tmp_path):
+    """
+    Directory of saved boxscore pages
+    """
+    (tmp_path / 'boxscores').mkdir()
+    for game_id in GAME_IDS:
+        (tmp_path / f'{game_id}.htm').write_text(BOXSCORE_HTML)
+        (tmp_path / 'boxscores' / f'{game_id}.htm').write_text(BOXSCORE_HTML)
+    return tmp_path
+
+
+@pytest.fixture
+def boxscore_server(boxscore_directory):
+    """
+    Local HTTP server that serves the saved boxscore pages at /boxscores/{game_id}.htm
+    """
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(boxscore_directory))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestBoxscore:
+
+    def test_extract_play_by_play(self):
+        """
+        Test that only the play rows of the commented out play by play table are extracted
+        """
+        rows = boxscore.extract_play_by_play(BOXSCORE_HTML)
+        assert rows == [
+            {
+                'quarter': '1',
+                'time_remaining': '15:00',
+                'down': '',
+                'yards_to_go': '',
+                'location': 'CHI 35',
+                'description': 'Cairo Santos kicks off 65 yards, touchback'
+            },
+            {
+                'quarter': '1',
+                'time_remaining': '14:55',
+                'down': '1',
+                'yards_to_go': '10',
+                'location': 'LAR 25',
+                'description': 'Darrell Henderson left end for 3 yards'
+            },
+            {
+                'quarter': '2',
+                'time_remaining': '15:00',
+                'down': '',
+                'yards_to_go': '',
+                'location': '',
+                'description': 'End of Quarter'
+            },
+        ]
+
+
+    def test_parse_boxscore(self):
+        """
+        Test that every play is numbered and parsed, and unmatched descriptions have no play type
+        """
+        plays = boxscore.parse_boxscore('202109120ram', BOXSCORE_HTML)
+        assert [play['play_index'] for play in plays] == [0, 1, 2]
+        assert [play['play_type'] for play in plays] == ['KICKOFF_TOUCHBACK', 'RUN', None]
+        assert plays[0]['prf_game_id'] == '202109120ram'
+        assert plays[0]['kicker'] == 'Cairo Santos'
+        assert plays[1]['runner'] == 'Darrell Henderson'
+        assert plays[1]['distance'] == '3 yards'
+
+
+    def test_play_column_fields(self):
+        """
+        Test that every play type has typed columns, and each column is one of the play type's variables
+        """
+        assert set(boxscore.PLAY_COLUMN_FIELDS) == set(registry.PLAY_TYPES)
+        for (play_type, fields) in boxscore.PLAY_COLUMN_FIELDS.items():
+            names = {name for (_, name) in combined.FIELD_GROUPS[play_type]}
+            assert {field for field in fields if field is not None} <= names, play_type
+
+
+    def test_to_play_row(self):
+        """
+        Test that plays are converted to typed rows of the plays table
+        """
+        rows = [boxscore.to_play_row(play) for play in boxscore.parse_boxscore('202109120ram', BOXSCORE_HTML)]
+        assert rows[1] == {
+            'prf_game_id': '202109120ram',
+            'play_index': 1,
+            'quarter': 1,
+            'time_remaining': '14:55',
+            'down': 1,
+            'yards_to_go': 10,
+            'field_side': 'LAR',
+            'field_line': 25,
+            'description': 'Darrell Henderson left end for 3 yards',
+            'play_type': 'RUN',
+            'player': 'Darrell Henderson',
+            'target': None,
+            'defender': None,
+            'yards': 3,
+        }
+        assert (rows[0]['player'], rows[0]['yards']) == ('Cairo Santos', 65)
+        assert (rows[2]['play_type'], rows[2]['down'], rows[2]['field_side']) == (None, None, None)
+
+
+    def test_batched_games(self):
+        """
+        Test that games are never split across batches
+        """
+        plays = [{'prf_game_id': game_id, 'play_index': i} for game_id in GAME_IDS for i in range(3)]
+        batches = list(boxscore.batched_games(plays, batch_size=4))
+        assert [len(batch) for batch in batches] == [6, 3]
+        assert [play['prf_game_id'] for play in batches[1]] == [GAME_IDS[2]] * 3
+
+
+    def test_scrape_plays_from_directory(self, boxscore_directory):
+        """
+        Test scraping from a directory of saved pages
+        """
+        plays = list(boxscore.scrape_plays(GAME_IDS, source=str(boxscore_directory)))
+        assert len(plays) == 3 * len(GAME_IDS)
+        assert [play['prf_game_id'] for play in plays[::3]] == GAME_IDS
+
+
+    def test_scrape_plays_from_server(self, boxscore_server):
+        """
+        Test scraping from a local server, with the results in the same order as the game ids
+        """
+        plays = list(boxscore.scrape_plays(GAME_IDS, source=boxscore_server, max_workers=3, requests_per_minute=6000))
+        assert len(plays) == 3 * len(GAME_IDS)
+        assert [play['prf_game_id'] for play in plays[::3]] == GAME_IDS
+
+
+    def test_fetch_boxscore_error(self, boxscore_server):
+        """
+        Test that a missing page raises an error
+        """
+        with pytest.raises(AssertionError, match='404'):
+            boxscore.fetch_boxscore('199901010xxx', source=boxscore_server)
+
+
+    def test_rate_limiter(self):
+        """
+        Test that calls from many threads are spaced out by the limiter's interval
+        """
+        limiter = boxscore.RateLimiter(requests_per_minute=600) # one every 0.1 seconds
+        calls = []
+
+        def _call():
+            limiter.wait()
+            calls.append(time.monotonic())
+
+        threads = [threading.Thread(target=_call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        calls.sort()
+        gaps = [later - earlier for (earlier, later) in zip(calls, calls[1:])]
+        assert all(gap >= 0.09 for gap in gaps), gaps
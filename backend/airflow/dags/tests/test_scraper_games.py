@@ -0,0 +1,88 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scraper import games
+
+TEAMS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'teams.csv')
+TEAM_NAME_MAPPING = {'Chicago Bears': 'CHI', 'Los Angeles Rams': 'LAR', 'Green Bay Packers': 'GB'}
+
+# Upcoming season (home/away columns, written out dates)
+UPCOMING = pd.DataFrame([
+    {'week': '1', 'dow': 'Sun', 'date': 'September 12', 'away_team': 'Chicago Bears', 'at': '@',
+     'away_score': np.nan, 'home_team': 'Los Angeles Rams', 'home_score': np.nan, 'time': '8:20 PM'},
+    {'week': '18', 'dow': 'Sun', 'date': 'January 9', 'away_team': 'Green Bay Packers', 'at': '@',
+     'away_score': np.nan, 'home_team': 'Chicago Bears', 'home_score': np.nan, 'time': '1:00 PM'},
+])
+
+# Season in progress (winner/loser columns, ISO dates)
+IN_PROGRESS = pd.DataFrame([
+    {'week': '1', 'dow': 'Sun', 'date': '2021-09-12', 'time': '8:20PM', 'away_team': 'Los Angeles Rams',
+     'at': np.nan, 'home_team': 'Chicago Bears', 'away_score': 34, 'home_score': 14},
+    {'week': '2', 'dow': 'Sun', 'date': '2021-09-19', 'time': '1:00PM', 'away_team': 'Green Bay Packers',
+     'at': '@', 'home_team': 'Chicago Bears', 'away_score': 24, 'home_score': 17},
+])
+
+
+class TestFormatGames:
+
+    def test_swap_home_away(self):
+        """
+        Test that winner/loser columns are switched to home/away when the winner was the home team
+        """
+        df = games.swap_home_away(IN_PROGRESS, 2021)
+        assert df['home_team'].tolist() == ['Los Angeles Rams', 'Chicago Bears']
+        assert df['away_team'].tolist() == ['Chicago Bears', 'Green Bay Packers']
+        assert df['home_score'].tolist() == [34, 17]
+        assert df['away_score'].tolist() == [14, 24]
+        assert df['season'].tolist() == [2021, 2021]
+        assert df['week'].tolist() == [1, 2]
+
+
+    def test_format_upcoming(self):
+        """
+        Test formatting an upcoming season, where January games are in the next year
+        """
+        df = games.format_for_db(games.swap_home_away(UPCOMING, 2021), TEAM_NAME_MAPPING)
+        assert df.to_dict('records') == [
+            {'game_id': '20210912_LAR', 'season': 2021, 'week': 1, 'datetime': '2021-09-12 20:20:00',
+             'home_team_id': 'LAR', 'away_team_id': 'CHI', 'home_score': None, 'away_score': None},
+            {'game_id': '20220109_CHI', 'season': 2021, 'week': 18, 'datetime': '2022-01-09 13:00:00',
+             'home_team_id': 'CHI', 'away_team_id': 'GB', 'home_score': None, 'away_score': None},
+        ]
+
+
+    def test_format_in_progress(self):
+        """
+        Test formatting a season in progress
+        """
+        df = games.format_for_db(games.swap_home_away(IN_PROGRESS, 2021), TEAM_NAME_MAPPING)
+        assert df['game_id'].tolist() == ['20210912_LAR', '20210919_CHI']
+        assert df['datetime'].tolist() == ['2021-09-12 20:20:00', '2021-09-19 13:00:00']
+
+
+    def test_format_multiple_seasons(self):
+        """
+        Test that several seasons can be formatted at once
+        """
+        df = pd.concat([games.swap_home_away(UPCOMING, 2022), games.swap_home_away(IN_PROGRESS, 2021)])
+        df = games.format_for_db(df, TEAM_NAME_MAPPING)
+        assert df['game_id'].tolist() == ['20220912_LAR', '20230109_CHI', '20210912_LAR', '20210919_CHI']
+
+
+    def test_unknown_team(self):
+        """
+        Test that a team that isn't in the mapping raises an error
+        """
+        with pytest.raises(AssertionError, match='Green Bay Packers'):
+            games.format_for_db(games.swap_home_away(IN_PROGRESS, 2021), {'Chicago Bears': 'CHI', 'Los Angeles Rams': 'LAR'})
+
+
+    def test_team_name_mapping(self):
+        """
+        Test that only active teams are mapped
+        """
+        mapping = games.get_team_name_mapping(TEAMS_PATH)
+        assert mapping['Chicago Bears'] == 'CHI'
+        assert mapping['Los Angeles Rams'] == 'LAR'
+        assert 'St Louis Rams' not in mapping
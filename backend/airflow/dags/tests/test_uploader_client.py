@@ -0,0 +1,130 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import pytest
+from uploader.client import RETRY_METHODS, UploadClient
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """
+    Stands in for the API: records every request and fails the first server.failures requests with a 503
+    """
+    def _respond(self, status: int, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with self.server.lock:
+            if self.server.failures > 0:
+                self.server.failures -= 1
+                return self._respond(503, {'detail': 'unavailable'})
+            self.server.requests.append({
+                'method': self.command,
+                'path': self.path,
+                'encoding': self.headers.get('Content-Encoding'),
+                'body': body,
+                'connection': self.client_address,
+            })
+        self._respond(200, ['ok'])
+
+    do_GET = do_PUT = do_POST = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RecordingHandler)
+    RecordingHandler.protocol_version = 'HTTP/1.1' # keep-alive
+    server.requests = []
+    server.failures = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def decode_body(request: dict) -> list:
+    body = gzip.decompress(request['body']) if request['encoding'] == 'gzip' else request['body']
+    return json.loads(body)
+
+
+class TestUploadClient:
+
+    def test_chunked_upload(self, api_server):
+        """
+        Test that records are sent in gzip compressed chunks, over a single kept alive connection
+        """
+        records = [{'game_id': str(i), 'week': i} for i in range(25)]
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', chunk_size=10) as client:
+            assert client.upload('/games', iter(records), method='PUT') == 25
+
+        assert [len(decode_body(request)) for request in api_server.requests] == [10, 10, 5]
+        assert [decode_body(request) for request in api_server.requests] == [records[:10], records[10:20], records[20:]]
+        assert {(request['method'], request['path'], request['encoding']) for request in api_server.requests} == {
+            ('PUT', '/games', 'gzip')
+        }
+        assert len({request['connection'] for request in api_server.requests}) == 1
+
+
+    def test_upload_dataframe(self, api_server):
+        """
+        Test that dataframes are sent in chunks of records
+        """
+        df = pd.DataFrame({'team_id': ['CHI', 'GB', 'DET'], 'start_year': [1922, 1919, 1934]})
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', chunk_size=2, compress=False) as client:
+            assert client.upload_dataframe('/teams', df) == 3
+
+        assert [decode_body(request) for request in api_server.requests] == [
+            [{'team_id': 'CHI', 'start_year': 1922}, {'team_id': 'GB', 'start_year': 1919}],
+            [{'team_id': 'DET', 'start_year': 1934}],
+        ]
+        assert api_server.requests[0]['encoding'] is None
+
+
+    def test_retry(self, api_server):
+        """
+        Test that failed chunks are retried
+        """
+        api_server.failures = 2
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', backoff_factor=0.01) as client:
+            assert client.upload('/games', [{'week': 1}], method='PUT') == 1
+
+        assert [decode_body(request) for request in api_server.requests] == [[{'week': 1}]]
+
+
+    def test_post_not_retried(self, api_server):
+        """
+        Test that POST requests are only retried when the caller opts in
+        """
+        api_server.failures = 1
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', backoff_factor=0.01) as client:
+            with pytest.raises(AssertionError, match='503'):
+                client.upload('/games', [{'week': 1}])
+        assert api_server.requests == []
+
+        api_server.failures = 1
+        retry_methods = RETRY_METHODS | {'POST'}
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', backoff_factor=0.01, retry_methods=retry_methods) as client:
+            assert client.upload('/plays', [{'play_index': 0}]) == 1
+        assert [decode_body(request) for request in api_server.requests] == [[{'play_index': 0}]]
+
+
+    def test_retries_exhausted(self, api_server):
+        """
+        Test that an error is raised once the retries are used up
+        """
+        api_server.failures = 10
+        with UploadClient(f'http://127.0.0.1:{api_server.server_port}', retries=2, backoff_factor=0.01) as client:
+            with pytest.raises(AssertionError, match='503'):
+                client.upload('/games', [{'week': 1}], method='PUT')
@@ -0,0 +1,41 @@
+from airflow.decorators import dag, task
+from airflow.utils.dates import days_ago
+import os
+from scraper import boxscore
+from uploader.client import RETRY_METHODS, UploadClient
+
+default_args = {
+    'owner': 'sampocs'
+}
+
+API_ENDPOINT = os.environ['JUICE_API_ENDPOINT']
+PFR_SOURCE = os.environ.get('JUICE_PFR_SOURCE', boxscore.PFR_BASE_URL)
+YEAR = 2021
+BATCH_SIZE = 5000 # plays per request (whole games are always sent together)
+
+@dag(default_args=default_args, schedule_interval=None, start_date=days_ago(1))
+def upload_pbp():
+
+    @task()
+    def upload():
+        # POST /plays replaces the games' plays, so it's safe to retry
+        with UploadClient(API_ENDPOINT, retry_methods=RETRY_METHODS | {'POST'}) as client:
+            print('Getting games that need play by play...')
+            prf_game_ids = client.get(f'/pbp/{YEAR}')
+            print(f'{len(prf_game_ids)} games')
+
+            print(f'Scraping from {PFR_SOURCE} and writing to database...')
+            plays = boxscore.scrape_plays(prf_game_ids, source=PFR_SOURCE)
+            chunks = (
+                [boxscore.to_play_row(play) for play in batch]
+                for batch in boxscore.batched_games(plays, BATCH_SIZE)
+            )
+            client.upload_chunks('/plays', chunks, method='POST')
+
+        print('Done.')
+
+        return 
+
+    upload()
+
+upload_pbp = upload_pbp()
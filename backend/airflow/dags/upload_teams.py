@@ -1,8 +1,8 @@
 from airflow.decorators import dag, task
 from airflow.utils.dates import days_ago
 import pandas as pd
-import requests
 import os
+from uploader.client import UploadClient
 
 default_args = {
     'owner': 'sampocs'
@@ -17,15 +17,10 @@ def upload_teams():
     def upload():
         print('Reading data into pandas...')
         df = pd.read_csv('/opt/airflow/data/teams.csv')
-        rows = df.to_dict('records')
 
         print('Writing to database...')
-        res = requests.post(f'{API_ENDPOINT}/teams', json=rows)
-
-        assert res.status_code == 200, f'API Error {res.status_code}'
- 
-        print('Response:')
-        print(res.json())
+        with UploadClient(API_ENDPOINT) as client:
+            client.upload_dataframe('/teams', df, method='PUT')
 
         print('Done.')
 
@@ -33,4 +28,4 @@ def upload_teams():
 
     upload()
 
-upload_teams = upload_teams()
\ No newline at end of file
+upload_teams = upload_teams()
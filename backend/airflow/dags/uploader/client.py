@@ -0,0 +1,138 @@
+import gzip
+import json
+from typing import Iterable, Iterator, List
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.iterables import batched
+
+DEFAULT_CHUNK_SIZE = 1000 # records per request
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF_FACTOR = 0.5 # seconds, doubled after every retry
+DEFAULT_TIMEOUT = 60 # seconds
+
+# Responses that are retried
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Only idempotent requests are retried by default: reads and the upserts (PUT)
+# POST /teams and POST /games are plain inserts, so retrying one that was committed but timed out
+# fails on duplicate keys. Endpoints that are safe to retry (e.g. POST /plays, which replaces
+# the games' plays) can opt in with retry_methods=RETRY_METHODS | {'POST'}
+RETRY_METHODS = frozenset(['GET', 'PUT'])
+
+
+def dataframe_chunks(df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[dict]]:
+    """
+    Lazily converts a dataframe into lists of (at most) chunk_size records,
+    so the whole dataframe is never held as records at once
+    """
+    for i in range(0, len(df), chunk_size):
+        yield df.iloc[i:i + chunk_size].to_dict('records')
+
+
+class UploadClient:
+    """
+    Client for the Juice API used by the DAGs
+
+    Records are sent in fixed-size chunks, one request per chunk, with gzip compressed JSON bodies
+    Every request goes through a single session, so the connection is kept alive between chunks,
+    and failed requests (connection errors and 429/5xx responses) of the retry_methods are retried
+    with exponential backoff
+
+    Example:
+        >>> client = UploadClient('http://api:8000')
+        >>> client.upload('/games', rows, method='PUT')
+        272
+    """
+    def __init__(
+        self,
+        endpoint: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        compress: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        retry_methods: Iterable[str] = RETRY_METHODS
+    ):
+        assert chunk_size > 0, 'chunk_size must be positive'
+
+        self.endpoint = endpoint.rstrip('/')
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.timeout = timeout
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(retry_methods),
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(max_retries=retry))
+        self.session.mount('https://', HTTPAdapter(max_retries=retry))
+
+    def get(self, path: str):
+        """
+        Returns the JSON response of a GET request
+        """
+        res = self.session.get(f'{self.endpoint}{path}', timeout=self.timeout)
+
+        assert res.status_code == 200, f'API Error {res.status_code}'
+
+        return res.json()
+
+    def send(self, path: str, records: List[dict], method: str = 'POST'):
+        """
+        Sends a single chunk of records as the JSON body of a request, returning the JSON response
+        """
+        body = json.dumps(records).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        if self.compress:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+
+        res = self.session.request(method, f'{self.endpoint}{path}', data=body, headers=headers, timeout=self.timeout)
+
+        assert res.status_code == 200, f'API Error {res.status_code}'
+
+        return res.json()
+
+    def upload_chunks(self, path: str, chunks: Iterable[List[dict]], method: str = 'POST') -> int:
+        """
+        Sends every chunk of records (e.g. plays grouped by game), one request per chunk
+        Chunks are only read as they're sent, so memory is bounded by the chunk size
+
+        :return: The total number of records sent
+        """
+        total = 0
+        for chunk in chunks:
+            self.send(path, chunk, method)
+            total += len(chunk)
+            print(f'{total} records sent to {path}')
+        return total
+
+    def upload(self, path: str, records: Iterable[dict], method: str = 'POST') -> int:
+        """
+        Sends the records in chunks of chunk_size records
+
+        :return: The total number of records sent
+        """
+        return self.upload_chunks(path, batched(records, self.chunk_size), method)
+
+    def upload_dataframe(self, path: str, df: pd.DataFrame, method: str = 'POST') -> int:
+        """
+        Sends the rows of a dataframe in chunks of chunk_size records
+
+        :return: The total number of records sent
+        """
+        return self.upload_chunks(path, dataframe_chunks(df, self.chunk_size), method)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,18 @@
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+
+def batched(records: Iterable, batch_size: int) -> Iterator[List]:
+    """
+    Lazily groups an iterable into lists of (at most) batch_size items
+    The next batch isn't built until the previous one has been consumed
+
+    Ex: batched(range(5), 2) => [0, 1], [2, 3], [4]
+    """
+    assert batch_size > 0, 'batch_size must be positive'
+
+    iterator = iter(records)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
@@ -30,5 +30,8 @@ else
     echo "juice-postgres connection already exists."
 fi
 
+echo "Setting the pfr_scraper pool..."
+airflow pools set pfr_scraper ${JUICE_PFR_SCRAPER_SLOTS:-2} "Concurrent scraping tasks against Pro Football Reference"
+
 echo "Starting scheduler..."
 airflow scheduler 
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Game listing serialization benchmark: plain rows + orjson (what GET /games/{year} serves)
+vs ORM objects validated through the pydantic schema (what response_model=List[schemas.Game] did)
+
+Creates a benchmark team and a 50-season game table, builds the JSON of every season with both paths
+(checking they're identical), reports the time per season and for the whole table, and removes
+everything it created
+
+Run inside the api container, against the local postgres container:
+    docker-compose run --rm api python -m benchmarks.game_serialization --seasons 50 --games-per-season 272
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+from fastapi.encoders import jsonable_encoder
+from pydantic import parse_obj_as
+from core import database, models, schemas
+from core.cache import serialize_rows
+import crud
+
+BENCHMARK_TEAM_ID = 'BENCH'
+BENCHMARK_PFR_ID = 'bch'
+FIRST_SEASON = 1800 # well before any real season, so the benchmark games don't mix with real ones
+
+
+def setup(db, num_seasons: int, games_per_season: int):
+    db.merge(models.Team(
+        team_id=BENCHMARK_TEAM_ID, org_id=BENCHMARK_TEAM_ID, city='Benchmark', mascot='Team',
+        start_year=FIRST_SEASON, active=False, pfr_id=BENCHMARK_PFR_ID
+    ))
+    db.commit()
+    games = [
+        {
+            'game_id': f'{season}_{game:04d}_{BENCHMARK_TEAM_ID}',
+            'season': season,
+            'week': 1 + game // 16,
+            'datetime': datetime(season, 9, 1, 13) + timedelta(hours=game),
+            'home_team_id': BENCHMARK_TEAM_ID,
+            'away_team_id': BENCHMARK_TEAM_ID,
+            'home_score': game % 40 if game % 7 else None,
+            'away_score': game % 30 if game % 7 else None,
+            'has_pbp': game % 2 == 0,
+            'prf_game_id': f'{season}{game:04d}0{BENCHMARK_PFR_ID}',
+        }
+        for season in range(FIRST_SEASON, FIRST_SEASON + num_seasons)
+        for game in range(games_per_season)
+    ]
+    db.execute(models.Game.__table__.insert(), games)
+    db.commit()
+
+
+def teardown(db):
+    db.query(models.Game).filter(models.Game.home_team_id == BENCHMARK_TEAM_ID).delete(synchronize_session=False)
+    db.query(models.Team).filter(models.Team.team_id == BENCHMARK_TEAM_ID).delete(synchronize_session=False)
+    db.commit()
+
+
+def schema_games_json(db, year: str) -> bytes:
+    """
+    The schema path: ORM objects validated into List[schemas.Game], then encoded like FastAPI's JSONResponse
+    """
+    games = parse_obj_as(List[schemas.Game], crud.get_games(db, year))
+    content = jsonable_encoder(games)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+
+def rows_games_json(db, year: str) -> bytes:
+    """
+    The fast path: plain column rows serialized with orjson
+    """
+    return serialize_rows(crud.get_game_rows(db, year))
+
+
+def time_seasons(db, build: Callable, seasons: List[str], repeat: int) -> float:
+    """
+    Returns the time (in seconds) to build the JSON of every season (best of repeat runs)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for season in seasons:
+            build(db, season)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--seasons', type=int, default=50)
+    arg_parser.add_argument('--games-per-season', type=int, default=272)
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Timing runs per path (best is reported)')
+    args = arg_parser.parse_args()
+
+    seasons = [str(season) for season in range(FIRST_SEASON, FIRST_SEASON + args.seasons)]
+    db = database.SessionLocal()
+    try:
+        teardown(db)
+        setup(db, args.seasons, args.games_per_season)
+
+        for season in seasons:
+            assert json.loads(rows_games_json(db, season)) == json.loads(schema_games_json(db, season)), \
+                f'Season {season} JSON differs between the two paths'
+
+        results = {}
+        for (name, build) in [('orjson', rows_games_json), ('pydantic', schema_games_json)]:
+            results[name] = time_seasons(db, build, seasons, args.repeat)
+
+        print(f'{args.seasons} seasons x {args.games_per_season} games ({args.seasons * args.games_per_season:,} games)')
+        print(f'{"path":<10}{"per season (ms)":>18}{"all seasons (s)":>18}')
+        for (name, seconds) in results.items():
+            print(f'{name:<10}{seconds / len(seasons) * 1000:>18.2f}{seconds:>18.3f}')
+        print(f'orjson speedup: {results["pydantic"] / results["orjson"]:.1f}x')
+    finally:
+        teardown(db)
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Load test for the read endpoints (/teams and /games/{year})
+
+Sends requests from many concurrent clients to a running API and reports requests/sec
+and p50/p99 latency per endpoint, so the sync and async modes can be compared:
+    JUICE_DB_ASYNC=false uvicorn main:app --port 8000
+    JUICE_DB_ASYNC=true uvicorn main:app --port 8001
+
+With --seed, synthetic teams and games are upserted through the API first
+
+Run from the app directory:
+    python -m benchmarks.load_test --url http://localhost:8000 --seed --concurrency 32 --requests 2000
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import requests
+
+SEED_SEASON = 2021
+SEED_TEAMS = [
+    {'team_id': f'T{i:02d}', 'org_id': f'T{i:02d}', 'city': f'City {i}', 'mascot': 'Team',
+     'start_year': 1960, 'active': True, 'pfr_id': f't{i:02d}'}
+    for i in range(32)
+]
+
+
+def seed(url: str, games_per_season: int = 272):
+    """
+    Upserts 32 teams and a season of games
+    """
+    games = [
+        {
+            'game_id': f'{SEED_SEASON}0912_{game}',
+            'season': SEED_SEASON,
+            'week': 1 + game // 16,
+            'datetime': f'{SEED_SEASON}-09-12 {10 + game % 12}:{game % 60:02d}:00',
+            'home_team_id': SEED_TEAMS[game % 32]['team_id'],
+            'away_team_id': SEED_TEAMS[(game + 1) % 32]['team_id'],
+            'home_score': game % 40,
+            'away_score': game % 30,
+        }
+        for game in range(games_per_season)
+    ]
+    for (path, rows) in [('/teams', SEED_TEAMS), ('/games', games)]:
+        res = requests.put(f'{url}{path}', json=rows)
+        assert res.status_code == 200, f'API Error {res.status_code}'
+
+
+def load_test(url: str, path: str, concurrency: int, num_requests: int) -> Dict[str, float]:
+    """
+    Sends num_requests GET requests from concurrency clients (each with its own connection)
+    """
+    sessions = threading.local()
+    latencies = []
+
+    def _request(_):
+        if not hasattr(sessions, 'session'):
+            sessions.session = requests.Session()
+        start = time.perf_counter()
+        res = sessions.session.get(f'{url}{path}')
+        latencies.append(time.perf_counter() - start)
+        assert res.status_code == 200, f'API Error {res.status_code}'
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(_request, range(num_requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests_per_sec': num_requests / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--url', default='http://localhost:8000')
+    arg_parser.add_argument('--concurrency', type=int, default=32)
+    arg_parser.add_argument('--requests', type=int, default=2000)
+    arg_parser.add_argument('--year', type=int, default=SEED_SEASON)
+    arg_parser.add_argument('--seed', action='store_true', help='Upsert synthetic teams and games first')
+    args = arg_parser.parse_args()
+
+    url = args.url.rstrip('/')
+    if args.seed:
+        seed(url)
+
+    print(f'{args.requests} requests per endpoint, {args.concurrency} concurrent clients')
+    print(f'{"endpoint":<16}{"req/s":>10}{"p50 (ms)":>12}{"p99 (ms)":>12}')
+    for path in ['/teams', f'/games/{args.year}']:
+        results = load_test(url, path, args.concurrency, args.requests)
+        print(f'{path:<16}{results["requests_per_sec"]:>10,.0f}{results["p50_ms"]:>12.1f}{results["p99_ms"]:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Plays ingestion benchmark: COPY FROM STDIN (crud.add_plays) vs ORM bulk_save_objects
+
+Creates a benchmark team and games, loads the same synthetic plays with both paths,
+reports plays/sec for each, and removes everything it created
+
+Run inside the api container, against the local postgres container:
+    docker-compose run --rm api python -m benchmarks.plays_ingest --games 272 --plays-per-game 180
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import List
+from core import database, models, schemas
+import crud
+
+BENCHMARK_TEAM_ID = 'BENCH'
+BENCHMARK_PFR_ID = 'bch'
+FIRST_GAME_DATE = datetime(1900, 9, 1)
+
+
+def build_plays(num_games: int, plays_per_game: int) -> List[schemas.Play]:
+    """
+    Builds plays_per_game synthetic plays for each benchmark game
+    """
+    return [
+        schemas.Play(
+            prf_game_id=f'{game_date(game)}0{BENCHMARK_PFR_ID}',
+            play_index=play_index,
+            quarter=1 + play_index * 4 // plays_per_game,
+            time_remaining='12:34',
+            down=1 + play_index % 4,
+            yards_to_go=10,
+            field_side=BENCHMARK_TEAM_ID,
+            field_line=25,
+            description='Justin Fields pass complete short left to Darnell Mooney for 8 yards (tackle by Jaire Alexander)',
+            play_type='PASS_COMPLETE',
+            player='Justin Fields',
+            target='Darnell Mooney',
+            defender='Jaire Alexander',
+            yards=8,
+        )
+        for game in range(num_games)
+        for play_index in range(plays_per_game)
+    ]
+
+
+def game_date(game: int) -> str:
+    """
+    Each benchmark game is on a different day, so their prf_game_ids are unique
+    """
+    return (FIRST_GAME_DATE + timedelta(days=game)).strftime('%Y%m%d')
+
+
+def setup(db, num_games: int):
+    db.merge(models.Team(
+        team_id=BENCHMARK_TEAM_ID, org_id=BENCHMARK_TEAM_ID, city='Benchmark', mascot='Team',
+        start_year=1900, active=False, pfr_id=BENCHMARK_PFR_ID
+    ))
+    for game in range(num_games):
+        date = game_date(game)
+        db.merge(models.Game(
+            game_id=f'{date}_{BENCHMARK_TEAM_ID}', season=1900, week=1,
+            datetime=FIRST_GAME_DATE + timedelta(days=game),
+            home_team_id=BENCHMARK_TEAM_ID, away_team_id=BENCHMARK_TEAM_ID,
+            prf_game_id=f'{date}0{BENCHMARK_PFR_ID}'
+        ))
+    db.commit()
+
+
+def teardown(db):
+    game_ids = db.query(models.Game.game_id).filter(models.Game.home_team_id == BENCHMARK_TEAM_ID)
+    db.query(models.Play).filter(models.Play.game_id.in_(game_ids)).delete(synchronize_session=False)
+    db.query(models.Game).filter(models.Game.home_team_id == BENCHMARK_TEAM_ID).delete(synchronize_session=False)
+    db.query(models.Team).filter(models.Team.team_id == BENCHMARK_TEAM_ID).delete(synchronize_session=False)
+    db.commit()
+
+
+def clear_plays(db):
+    game_ids = db.query(models.Game.game_id).filter(models.Game.home_team_id == BENCHMARK_TEAM_ID)
+    db.query(models.Play).filter(models.Play.game_id.in_(game_ids)).delete(synchronize_session=False)
+    db.commit()
+
+
+def orm_add_plays(db, plays: List[schemas.Play]) -> int:
+    """
+    The ORM path: one Play object per row saved with bulk_save_objects
+    """
+    game_ids = dict(db.query(models.Game.prf_game_id, models.Game.game_id).all())
+    play_objects = [
+        models.Play(game_id=game_ids[play.prf_game_id], **play.dict(exclude={'prf_game_id'}))
+        for play in plays
+    ]
+    db.bulk_save_objects(play_objects)
+    db.commit()
+    return len(plays)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--games', type=int, default=50)
+    arg_parser.add_argument('--plays-per-game', type=int, default=180)
+    args = arg_parser.parse_args()
+
+    plays = build_plays(args.games, args.plays_per_game)
+    db = database.SessionLocal()
+    try:
+        teardown(db)
+        setup(db, args.games)
+
+        results = {}
+        for (name, add_plays) in [('copy', crud.add_plays), ('orm', orm_add_plays)]:
+            clear_plays(db)
+            start = time.perf_counter()
+            add_plays(db, plays)
+            results[name] = len(plays) / (time.perf_counter() - start)
+
+        print(f'{len(plays):,} plays ({args.games} games)')
+        for (name, throughput) in results.items():
+            print(f'{name:<8}{throughput:>14,.0f} plays/s')
+        print(f'COPY speedup: {results["copy"] / results["orm"]:.1f}x')
+    finally:
+        teardown(db)
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
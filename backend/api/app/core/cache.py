@@ -0,0 +1,258 @@
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, Tuple
+import orjson
+from fastapi import Request, Response
+from core import metrics
+
+# Response cache settings
+#   JUICE_CACHE_BACKEND: "memory" (in-process, the default), "redis", or "none" to disable caching (and ETags)
+#   JUICE_CACHE_TTL: seconds a response is cached for
+#   JUICE_CACHE_MAX_SIZE: number of responses kept by the memory backend
+#   JUICE_REDIS_URL: redis server used by the redis backend
+CACHE_BACKEND = os.environ.get('JUICE_CACHE_BACKEND', 'memory').lower()
+CACHE_TTL = float(os.environ.get('JUICE_CACHE_TTL', 300))
+CACHE_MAX_SIZE = int(os.environ.get('JUICE_CACHE_MAX_SIZE', 1024))
+REDIS_URL = os.environ.get('JUICE_REDIS_URL', 'redis://localhost:6379/0')
+
+CACHE_REQUESTS = metrics.register(metrics.Counter(
+    'juice_cache_requests_total', 'Cached endpoint requests, by route and result (hit, miss or not_modified)'
+))
+CACHE_INVALIDATIONS = metrics.register(metrics.Counter(
+    'juice_cache_invalidations_total', 'Cache invalidations, by table'
+))
+
+
+def _hit_ratios() -> Dict[metrics.Labels, float]:
+    routes = {dict(labels)['route'] for labels in CACHE_REQUESTS._values}
+    ratios = {}
+    for route in routes:
+        hits = CACHE_REQUESTS.value(route=route, result='hit')
+        total = hits + CACHE_REQUESTS.value(route=route, result='miss')
+        ratios[(('route', route),)] = hits / total if total else 0
+    return ratios
+
+metrics.register(metrics.Gauge('juice_cache_hit_ratio', 'Share of cache lookups that were hits', _hit_ratios))
+
+
+class MemoryBackend:
+    """
+    In-process TTL + LRU store
+    Entries expire after ttl seconds, and the least recently used entry is evicted once there are max_size
+
+    Each API process has its own store and versions, so with several workers a write only invalidates
+    the worker that handled it. The others serve stale responses for at most ttl seconds: cached entries
+    expire, and the epoch (which qualifies the ETags) changes every ttl seconds, so a worker that didn't
+    see the write stops answering 304 to the old ETag after at most ttl seconds too
+
+    The epoch also starts with a random token, since the versions restart at 0 with the process
+    """
+    def __init__(self, ttl: float = CACHE_TTL, max_size: int = CACHE_MAX_SIZE):
+        assert max_size > 0, 'max_size must be positive'
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._token = secrets.token_hex(8)
+
+    @property
+    def epoch(self) -> str:
+        return f'{self._token}.{int(time.monotonic() // self.ttl)}'
+
+    def get(self, key: str) -> bytes or None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            (expires_at, value) = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def version(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def increment_version(self, table: str):
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """
+    Store shared by every API process, on a redis compatible server
+    Only get, set (with ex and nx) and incr are used, so any client with the same interface works
+
+    :param client: Redis client (e.g. redis.Redis.from_url(REDIS_URL))
+    """
+    def __init__(self, client, ttl: float = CACHE_TTL, prefix: str = 'juice:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self._epoch = None
+
+    @property
+    def epoch(self) -> str:
+        """
+        Random token shared by every API process, stored the first time it's needed
+        If the server loses its data (and the versions restart at 0), a new epoch is stored
+        """
+        if self._epoch is None or self.client.get(f'{self.prefix}epoch') is None:
+            self.client.set(f'{self.prefix}epoch', secrets.token_hex(8), nx=True)
+            self._epoch = self.client.get(f'{self.prefix}epoch').decode()
+        return self._epoch
+
+    def get(self, key: str) -> bytes or None:
+        return self.client.get(f'{self.prefix}response:{key}')
+
+    def set(self, key: str, value: bytes):
+        self.client.set(f'{self.prefix}response:{key}', value, ex=max(1, int(self.ttl)))
+
+    def version(self, table: str) -> int:
+        return int(self.client.get(f'{self.prefix}version:{table}') or 0)
+
+    def increment_version(self, table: str):
+        self.client.incr(f'{self.prefix}version:{table}')
+
+
+class ResponseCache:
+    """
+    Caches the serialized JSON of read endpoints, keyed by the route, the query parameters,
+    and the version of every table the response is built from
+
+    Writes invalidate a table by incrementing its version, so every cached response that
+    depends on it is skipped (and eventually expires or is evicted) without finding the keys
+
+    The versions also make up the responses' ETag, so a request with a matching If-None-Match
+    gets a 304 Not Modified without reading the cache or the database
+
+    Example:
+        >>> response_cache.cached(request, ['teams'], lambda: serialize_rows(crud.get_team_rows(db=db)))
+        >>> response_cache.invalidate('teams')
+    """
+    def __init__(self, backend=None):
+        self.backend = backend
+
+    def _versions(self, tables: Iterable[str]) -> str:
+        return '.'.join(f'{table}{self.backend.version(table)}' for table in tables)
+
+    def etag(self, versions: str) -> str:
+        return f'"{self.backend.epoch}-{versions}"'
+
+    def _lookup(self, request: Request, tables: Iterable[str]) -> Tuple[str, str, bytes or None]:
+        """
+        Returns the cache key, the ETag and the cached content (None if it isn't cached)
+        The content isn't read when the client already has the current version (If-None-Match)
+        """
+        route = request.scope['route'].path
+        versions = self._versions(tables)
+        etag = self.etag(versions)
+        if etag_matches(request.headers.get('if-none-match'), etag):
+            CACHE_REQUESTS.inc(route=route, result='not_modified')
+            return None, etag, None
+
+        key = f'{request.url.path}?{request.url.query}|{versions}'
+        content = self.backend.get(key)
+        CACHE_REQUESTS.inc(route=route, result='miss' if content is None else 'hit')
+        return key, etag, content
+
+    def cached(self, request: Request, tables: Iterable[str], build: Callable[[], bytes]) -> Response:
+        """
+        Returns the cached response, or builds (and caches) it with build()
+        """
+        if self.backend is None:
+            return json_response(build())
+        (key, etag, content) = self._lookup(request, tables)
+        if key is None:
+            return not_modified_response(etag)
+        if content is None:
+            content = build()
+            self.backend.set(key, content)
+        return json_response(content, etag)
+
+    async def cached_async(self, request: Request, tables: Iterable[str], build: Callable[[], Awaitable[bytes]]) -> Response:
+        """
+        Same as cached, for async routes where build is a coroutine function
+        """
+        if self.backend is None:
+            return json_response(await build())
+        (key, etag, content) = self._lookup(request, tables)
+        if key is None:
+            return not_modified_response(etag)
+        if content is None:
+            content = await build()
+            self.backend.set(key, content)
+        return json_response(content, etag)
+
+    def invalidate(self, *tables: str):
+        if self.backend is None:
+            return
+        for table in tables:
+            self.backend.increment_version(table)
+            CACHE_INVALIDATIONS.inc(table=table)
+
+
+def serialize_rows(rows: Iterable) -> bytes:
+    """
+    Serializes rows of plain values (e.g. from crud.get_team_rows) with orjson, as a list of objects keyed by column
+    This skips validating every row with pydantic, so the rows must already have the schema's fields and types
+    """
+    rows = list(rows)
+    if not rows:
+        return b'[]'
+    fields = rows[0]._fields
+    return orjson.dumps([dict(zip(fields, row)) for row in rows])
+
+
+def etag_matches(if_none_match: str or None, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches the ETag (the weak comparison, as required for If-None-Match)
+    Ex: etag_matches('W/"abc-teams1", "abc-teams2"', '"abc-teams2"') -> True
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or any(tag.replace('W/', '', 1) == etag for tag in tags)
+
+
+# Clients may keep the responses, but have to revalidate them (with If-None-Match) before using them
+CACHE_CONTROL = 'no-cache'
+
+
+def json_response(content: bytes, etag: str or None = None) -> Response:
+    headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL} if etag else None
+    return Response(content=content, media_type='application/json', headers=headers)
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': CACHE_CONTROL})
+
+
+def create_backend(name: str = CACHE_BACKEND):
+    if name == 'none':
+        return None
+    if name == 'redis':
+        import redis # optional, only needed for the redis backend
+        return RedisBackend(redis.Redis.from_url(REDIS_URL))
+    assert name == 'memory', f'Invalid cache backend ({name}). Must be one of: memory, redis, none'
+    return MemoryBackend()
+
+
+response_cache = ResponseCache(create_backend())
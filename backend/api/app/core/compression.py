@@ -0,0 +1,49 @@
+import zlib
+from typing import Callable
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+# Largest request body accepted once decompressed, so a small gzip body can't expand without bound
+MAX_DECOMPRESSED_SIZE = 256 * 1024 * 1024 # bytes
+
+
+def decompress_gzip(body: bytes, max_size: int or None = None) -> bytes:
+    """
+    Decompresses a gzip body, raising a 413 if it's larger than max_size
+    (MAX_DECOMPRESSED_SIZE by default) once decompressed
+    """
+    max_size = max_size or MAX_DECOMPRESSED_SIZE
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        decompressed = decompressor.decompress(body, max_size)
+    except zlib.error:
+        raise HTTPException(status_code=400, detail='Invalid gzip body')
+    if decompressor.unconsumed_tail:
+        raise HTTPException(status_code=413, detail=f'Decompressed body is larger than {max_size} bytes')
+    return decompressed
+
+
+class GzipRequest(Request):
+    """
+    Request whose body is decompressed when it's sent with Content-Encoding: gzip
+    """
+    async def body(self) -> bytes:
+        if not hasattr(self, '_body'):
+            body = await super().body()
+            if 'gzip' in self.headers.getlist('Content-Encoding'):
+                body = decompress_gzip(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """
+    Route that accepts gzip compressed request bodies (e.g. the bulk uploads from the DAGs)
+    """
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def gzip_route_handler(request: Request) -> Response:
+            return await original_route_handler(GzipRequest(request.scope, request.receive))
+
+        return gzip_route_handler
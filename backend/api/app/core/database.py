@@ -1,19 +1,70 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
+from core.metrics import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 
 JUICE_DB = os.environ['JUICE_DB_NAME']
 JUICE_USER = os.environ['JUICE_DB_USER']
 JUICE_PASSWORD = os.environ['JUICE_DB_PASSWORD']
-SQLALCHEMY_DATABASE_URI = f"postgresql://{JUICE_USER}:{JUICE_PASSWORD}@db:5432/{JUICE_DB}"
+SQLALCHEMY_DATABASE_URI = os.environ.get(
+    'JUICE_DATABASE_URI', f"postgresql://{JUICE_USER}:{JUICE_PASSWORD}@db:5432/{JUICE_DB}"
+)
 
-engine = create_engine(SQLALCHEMY_DATABASE_URI)
+# Connection pool settings (shared by the sync and async engines)
+#   JUICE_DB_POOL_SIZE: connections kept open
+#   JUICE_DB_MAX_OVERFLOW: extra connections opened when every pooled one is in use
+#   JUICE_DB_POOL_TIMEOUT: seconds to wait for a connection before failing
+#   JUICE_DB_POOL_PRE_PING: test each connection before using it (drops connections closed by the server)
+#   JUICE_DB_POOL_RECYCLE: seconds after which a connection is replaced (-1 to never recycle)
+POOL_SETTINGS = {
+    'pool_size': int(os.environ.get('JUICE_DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.environ.get('JUICE_DB_MAX_OVERFLOW', 10)),
+    'pool_timeout': float(os.environ.get('JUICE_DB_POOL_TIMEOUT', 30)),
+    'pool_pre_ping': os.environ.get('JUICE_DB_POOL_PRE_PING', 'false').lower() == 'true',
+    'pool_recycle': int(os.environ.get('JUICE_DB_POOL_RECYCLE', -1)),
+}
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URI, poolclass=InstrumentedQueuePool, pool_logging_name='sync', **POOL_SETTINGS
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# In async mode (JUICE_DB_ASYNC=true), the read endpoints are served with async routes
+# on an asyncpg engine instead of the sync routes (see main.py)
+ASYNC_MODE = os.environ.get('JUICE_DB_ASYNC', 'false').lower() == 'true'
+ASYNC_SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace('postgresql://', 'postgresql+asyncpg://', 1)
+
+# The async engine is only created in async mode, so sync deployments don't need asyncpg
+# (and don't report an idle async pool in the metrics)
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_MODE:
+    async_engine = create_async_engine(
+        ASYNC_SQLALCHEMY_DATABASE_URI, poolclass=InstrumentedAsyncAdaptedQueuePool, pool_logging_name='async',
+        **POOL_SETTINGS
+    )
+    AsyncSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=async_engine, class_=AsyncSession
+    )
+
 Base = declarative_base()
 
 from core import models
 
-models.Base.metadata.create_all(bind=engine)
\ No newline at end of file
+
+def create_indexes(bind):
+    """
+    Creates the models' indexes that don't exist yet
+    create_all only creates the indexes of the tables it creates, so this adds the indexes
+    declared since to the tables of existing databases
+    """
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+models.Base.metadata.create_all(bind=engine)
+create_indexes(engine)
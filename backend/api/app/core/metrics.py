@@ -0,0 +1,188 @@
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Latency buckets (seconds) used by the pool histograms
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels, extra: Dict[str, str] or None = None) -> str:
+    pairs = list(labels) + list((extra or {}).items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for (name, value) in pairs) + '}'
+
+
+class Counter:
+    """
+    Monotonically increasing value (e.g. a number of events), optionally split by labels
+    """
+    type = 'counter'
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def samples(self) -> List[str]:
+        return [f'{self.name}{_format_labels(labels)} {value}' for (labels, value) in sorted(self._values.items())]
+
+
+class Gauge:
+    """
+    Value that's read when the metrics are rendered, from a callback that returns the value for each set of labels
+    Ex: Gauge("juice_db_pool_size", "...", lambda: {(("engine", "sync"),): 5})
+    """
+    type = 'gauge'
+
+    def __init__(self, name: str, description: str, callback: Callable[[], Dict[Labels, float]]):
+        self.name = name
+        self.description = description
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        return [f'{self.name}{_format_labels(labels)} {value}' for (labels, value) in sorted(self.callback().items())]
+
+
+class Histogram:
+    """
+    Distribution of observed values (e.g. latencies) in cumulative buckets, optionally split by labels
+    """
+    type = 'histogram'
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self._counts: Dict[Labels, List[int]] = {}
+        self._sums: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for (i, bound) in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0) + value
+
+    def count(self, **labels) -> int:
+        counts = self._counts.get(tuple(sorted(labels.items())))
+        return counts[-1] if counts else 0
+
+    def samples(self) -> List[str]:
+        samples = []
+        for (labels, counts) in sorted(self._counts.items()):
+            for (bound, count) in zip(self.buckets, counts):
+                samples.append(f'{self.name}_bucket{_format_labels(labels, {"le": str(bound)})} {count}')
+            samples.append(f'{self.name}_bucket{_format_labels(labels, {"le": "+Inf"})} {counts[-1]}')
+            samples.append(f'{self.name}_sum{_format_labels(labels)} {self._sums[labels]}')
+            samples.append(f'{self.name}_count{_format_labels(labels)} {counts[-1]}')
+        return samples
+
+
+REGISTRY = []
+
+
+def register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+def render() -> str:
+    """
+    Renders every registered metric in the Prometheus text format
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.description}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(metric.samples())
+    return '\n'.join(lines) + '\n'
+
+
+# Connection pools being measured, by engine label ("sync" or "async")
+POOLS = {}
+
+# Checkout latency is the full time to get a connection from the pool: waiting for one to be checked in,
+# opening a new one (up to max_overflow), and the pre-ping
+# Wait time is only measured for checkouts that started with every connection (including overflow) in use,
+# so it shows when requests are queueing for the pool rather than for the queries
+POOL_CHECKOUT_SECONDS = register(Histogram(
+    'juice_db_pool_checkout_seconds', 'Time to check out a connection from the pool'
+))
+POOL_WAIT_SECONDS = register(Histogram(
+    'juice_db_pool_wait_seconds', 'Time spent waiting for a connection when the pool was exhausted'
+))
+POOL_TIMEOUTS = register(Counter(
+    'juice_db_pool_timeouts_total', 'Checkouts that gave up after pool_timeout'
+))
+register(Gauge(
+    'juice_db_pool_size', 'Number of connections the pool keeps open',
+    lambda: {(('engine', name),): pool.size() for (name, pool) in POOLS.items()}
+))
+register(Gauge(
+    'juice_db_pool_checked_out', 'Connections currently checked out',
+    lambda: {(('engine', name),): pool.checkedout() for (name, pool) in POOLS.items()}
+))
+register(Gauge(
+    'juice_db_pool_checked_in', 'Idle connections in the pool',
+    lambda: {(('engine', name),): pool.checkedin() for (name, pool) in POOLS.items()}
+))
+register(Gauge(
+    'juice_db_pool_overflow', 'Connections open beyond pool_size (negative until the pool is full)',
+    lambda: {(('engine', name),): pool.overflow() for (name, pool) in POOLS.items()}
+))
+
+
+class PoolMetricsMixin:
+    """
+    Records the checkout latency, wait time and timeouts of a queue pool
+    The engine label is the pool's logging name (e.g. create_engine(..., pool_logging_name="sync"))
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.engine_label = self._orig_logging_name or 'default'
+        POOLS[self.engine_label] = self
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start, engine=self.engine_label)
+
+    def _do_get(self):
+        exhausted = self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_TIMEOUTS.inc(engine=self.engine_label)
+            raise
+        finally:
+            if exhausted:
+                POOL_WAIT_SECONDS.observe(time.perf_counter() - start, engine=self.engine_label)
+
+
+class InstrumentedQueuePool(PoolMetricsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(PoolMetricsMixin, AsyncAdaptedQueuePool):
+    pass
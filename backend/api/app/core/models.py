@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from core.database import Base
@@ -39,5 +39,33 @@ class Game(Base):
     has_pbp      = Column('has_pbp',      Boolean, default=False)
     prf_game_id  = Column('prf_game_id',  Text,    nullable=True)
 
+    # Used to find the games that need play by play (see crud.get_games_needing_pbp)
+    __table_args__ = (
+        Index('ix_games_season_has_pbp_datetime', 'season', 'has_pbp', 'datetime'),
+    )
+
     def __repr__(self) -> str:
         return f'<Game: {self.game_id} | {self.away_team_id} @ {self.home_team_id}>'
+
+
+class Play(Base):
+
+    __tablename__ = 'plays'
+
+    game_id        = Column('game_id',        Text,    ForeignKey('games.game_id'), primary_key=True)
+    play_index     = Column('play_index',     Integer, primary_key=True)
+    quarter        = Column('quarter',        Integer, nullable=True)
+    time_remaining = Column('time_remaining', Text,    nullable=True)
+    down           = Column('down',           Integer, nullable=True)
+    yards_to_go    = Column('yards_to_go',    Integer, nullable=True)
+    field_side     = Column('field_side',     Text,    nullable=True)
+    field_line     = Column('field_line',     Integer, nullable=True)
+    description    = Column('description',    Text)
+    play_type      = Column('play_type',      Text,    nullable=True)
+    player         = Column('player',         Text,    nullable=True)
+    target         = Column('target',         Text,    nullable=True)
+    defender       = Column('defender',       Text,    nullable=True)
+    yards          = Column('yards',          Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return f'<Play: {self.game_id} #{self.play_index} | {self.play_type}>'
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from datetime import datetime
 from typing import Optional
 
@@ -27,5 +27,29 @@ class Game(BaseModel):
     away_score: Optional[int]
     has_pbp: bool = False
 
+    # Games read from the database have a datetime, which is returned in the same format it's uploaded in
+    @validator('datetime', pre=True)
+    def format_datetime(cls, value):
+        if isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        return value
+
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class Play(BaseModel):
+    prf_game_id: str
+    play_index: int
+    quarter: Optional[int]
+    time_remaining: Optional[str]
+    down: Optional[int]
+    yards_to_go: Optional[int]
+    field_side: Optional[str]
+    field_line: Optional[int]
+    description: str
+    play_type: Optional[str]
+    player: Optional[str]
+    target: Optional[str]
+    defender: Optional[str]
+    yards: Optional[int]
@@ -1,68 +1,223 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql.functions import mode
 from core import models, schemas
-from typing import List
+from core.cache import response_cache
+from typing import Dict, Iterable, List
 from datetime import datetime, timedelta
 from pytz import timezone
+import csv
+import io
+
+# Columns of the plays table, in the order they're written for COPY
+PLAY_COLUMNS = [column.name for column in models.Play.__table__.columns]
+
+UPSERT_BATCH_SIZE = 1000 # rows per INSERT ... ON CONFLICT statement
+
+
+def _schema_columns(model, schema, **expressions) -> list:
+    """
+    Returns a column for each field of the schema (in the schema's order), labelled with the field name,
+    so the rows can be serialized directly with the same JSON shape as the schema
+    Fields that aren't stored as-is are given as expressions
+    """
+    return [expressions.get(field, getattr(model, field)).label(field) for field in schema.__fields__]
+
+TEAM_COLUMNS = _schema_columns(models.Team, schemas.Team)
+# Formatted by postgres in the same format as schemas.Game.format_datetime
+GAME_COLUMNS = _schema_columns(
+    models.Game, schemas.Game, datetime=func.to_char(models.Game.datetime, 'YYYY-MM-DD HH24:MI:SS')
+)
+
+
+def _upsert(db: Session, model, rows: List[dict], update_columns: List[str]):
+    """
+    Inserts the rows in batches with INSERT ... ON CONFLICT (primary key) DO UPDATE
+    Existing rows are only updated if one of the update_columns changed, so re-sending
+    unchanged rows doesn't write anything
+    """
+    table = model.__table__
+    for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = pg_insert(table).values(rows[i:i + UPSERT_BATCH_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=table.primary_key.columns,
+            set_={column: statement.excluded[column] for column in update_columns},
+            where=or_(*[table.c[column].is_distinct_from(statement.excluded[column]) for column in update_columns])
+        )
+        db.execute(statement)
+    db.commit()
 
 
 def add_teams(db: Session, teams: List[schemas.Team]) -> List[models.Team]:
     team_objects = [models.Team(**team.dict()) for team in teams]
     db.bulk_save_objects(team_objects)
     db.commit()
+    response_cache.invalidate('teams')
+    return teams
+
+def upsert_teams(db: Session, teams: List[schemas.Team]) -> List[schemas.Team]:
+    rows = [team.dict() for team in teams]
+    update_columns = [column.name for column in models.Team.__table__.columns if not column.primary_key]
+    _upsert(db, models.Team, rows, update_columns)
+    response_cache.invalidate('teams')
     return teams
 
 def get_teams(db: Session) -> List[models.Team]:
     return db.query(models.Team).all()
 
-def add_games(db: Session, games: List[schemas.Game]) -> List[schemas.Team]:
+def get_team_rows(db: Session) -> List[Row]:
+    """
+    Returns every team as a plain row of the schemas.Team fields, without building ORM objects
+    """
+    return db.execute(select(*TEAM_COLUMNS)).all()
+
+async def get_team_rows_async(db: AsyncSession) -> List[Row]:
+    result = await db.execute(select(*TEAM_COLUMNS))
+    return result.all()
+
+def get_pfr_ids(db: Session, team_ids: Iterable[str]) -> Dict[str, str]:
+    """
+    Returns the pfr_id of each team, with a single query
+    Ex: {"CHI": "chi", "LAR": "ram"}
+    """
+    return dict(
+        db.query(models.Team.team_id, models.Team.pfr_id)
+        .filter(models.Team.team_id.in_(set(team_ids)))
+        .all()
+    )
+
+def _create_game_records(db: Session, games: List[schemas.Game]) -> List[dict]:
+    """
+    Returns the columns of each game's row, adding the PFR game id
+    """
+    # Look up every home team's pfr_id up front, rather than querying once per game
+    pfr_ids = get_pfr_ids(db, [game.home_team_id for game in games])
 
-    def _create_game_record(game: schemas.Game) -> str:
+    def _create_game_record(game: schemas.Game) -> dict:
         game_datetime = datetime.strptime(game.datetime, '%Y-%m-%d %H:%M:%S')
         game_date = game_datetime.strftime('%Y%m%d')
 
-        home_team = (
-            db.query(models.Team)
-            .filter(models.Team.team_id == game.home_team_id)
-            .first()
-        )
-        assert home_team, f'Team {game.home_team_id} not in Teams table'
+        assert game.home_team_id in pfr_ids, f'Team {game.home_team_id} not in Teams table'
+
+        prf_game_id = f'{game_date}0{pfr_ids[game.home_team_id]}'
 
-        prf_game_id = f'{game_date}0{home_team.pfr_id}'
+        return {**game.dict(), 'prf_game_id': prf_game_id}
 
-        return models.Game(**game.dict(), prf_game_id=prf_game_id)
+    return [_create_game_record(game) for game in games]
 
-    game_objects = [_create_game_record(game) for game in games]
+def add_games(db: Session, games: List[schemas.Game]) -> List[schemas.Game]:
+    game_objects = [models.Game(**record) for record in _create_game_records(db, games)]
 
     db.bulk_save_objects(game_objects)
     db.commit()
-    
-    return games
+    response_cache.invalidate('games')
 
-def get_games(db: Session, year: str) -> List[models.Game]:
-    return db.query(models.Game).filter(models.Game.season == int(year)).all()
+    return games
 
-def get_games_needing_pbp(db: Session, year: str) -> List[str]:
+def upsert_games(db: Session, games: List[schemas.Game]) -> List[schemas.Game]:
+    """
+    Adds new games and updates the changed columns (e.g. scores) of existing ones
+    has_pbp is never overwritten, since it's only set once the play by play is loaded
+    """
+    rows = _create_game_records(db, games)
+    update_columns = [
+        column.name for column in models.Game.__table__.columns
+        if not column.primary_key and column.name != 'has_pbp'
+    ]
+    for row in rows:
+        del row['has_pbp']
+    _upsert(db, models.Game, rows, update_columns)
+    response_cache.invalidate('games')
+    return games
 
-    def _check_game_ended(game: models.Game) -> bool:
-        utc = timezone('UTC')
-        est = timezone('EST')
-        current_time = datetime.now(utc).astimezone()
-        game_time = est.localize(game.datetime).astimezone(utc)
-        if (current_time - game_time > timedelta(hours=4)):
-            return True
-        return False
+def select_games(year: str):
+    return select(models.Game).filter(models.Game.season == int(year)).order_by(models.Game.datetime)
 
-    games = (
-        db.query(models.Game)
+def get_games(db: Session, year: str) -> List[models.Game]:
+    return db.execute(select_games(year)).scalars().all()
+
+def select_game_rows(year: str):
+    return select(*GAME_COLUMNS).filter(models.Game.season == int(year)).order_by(models.Game.datetime)
+
+def get_game_rows(db: Session, year: str) -> List[Row]:
+    """
+    Returns the season's games as plain rows of the schemas.Game fields, without building ORM objects
+    """
+    return db.execute(select_game_rows(year)).all()
+
+async def get_game_rows_async(db: AsyncSession, year: str) -> List[Row]:
+    result = await db.execute(select_game_rows(year))
+    return result.all()
+
+def select_games_needing_pbp(year: str):
+    """
+    Selects the PFR game id of every game in the season that ended (started more than
+    4 hours ago) but doesn't have play by play yet
+    Game times are stored in EST, so the cutoff is computed in EST and compared in the query,
+    which is a single range scan on the (season, has_pbp, datetime) index
+    """
+    cutoff = datetime.now(timezone('EST')).replace(tzinfo=None) - timedelta(hours=4)
+
+    return (
+        select(models.Game.prf_game_id)
         .filter(models.Game.season == int(year))
         .filter(models.Game.has_pbp == False)
+        .filter(models.Game.datetime < cutoff)
+        .order_by(models.Game.datetime)
+    )
+
+def get_games_needing_pbp(db: Session, year: str) -> List[str]:
+    return db.execute(select_games_needing_pbp(year)).scalars().all()
+
+async def get_games_needing_pbp_async(db: AsyncSession, year: str) -> List[str]:
+    result = await db.execute(select_games_needing_pbp(year))
+    return result.scalars().all()
+
+def add_plays(db: Session, plays: List[schemas.Play]) -> int:
+    """
+    Bulk loads plays with COPY FROM STDIN, which is much faster than bulk_save_objects
+    for thousands of rows since they're streamed to postgres in a single statement
+    Any plays already stored for the same games are replaced, and the games are marked as having play by play
+
+    Every play of a game must be in the same request
+    """
+    prf_game_ids = {play.prf_game_id for play in plays}
+    game_ids = dict(
+        db.query(models.Game.prf_game_id, models.Game.game_id)
+        .filter(models.Game.prf_game_id.in_(prf_game_ids))
         .all()
     )
+    missing = prf_game_ids - game_ids.keys()
+    assert not missing, f'Games {sorted(missing)} not in Games table'
+
+    # Write the plays as CSV in memory (empty fields are loaded as NULL)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for play in plays:
+        row = play.dict()
+        row['game_id'] = game_ids[play.prf_game_id]
+        writer.writerow([row[column] for column in PLAY_COLUMNS])
+    buffer.seek(0)
+
+    (
+        db.query(models.Play)
+        .filter(models.Play.game_id.in_(game_ids.values()))
+        .delete(synchronize_session=False)
+    )
 
-    game_ids = [game.prf_game_id for game in games if _check_game_ended(game)]
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY plays ({", ".join(PLAY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)', buffer)
 
-    return game_ids
-    
+    (
+        db.query(models.Game)
+        .filter(models.Game.game_id.in_(game_ids.values()))
+        .update({models.Game.has_pbp: True}, synchronize_session=False)
+    )
+    db.commit()
+    # has_pbp is returned with the games
+    response_cache.invalidate('games')
 
+    return len(plays)
@@ -1,12 +1,17 @@
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.params import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from starlette.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse
+from starlette.responses import PlainTextResponse, RedirectResponse
 from typing import List, Dict
-from core import database, schemas
+from core import database, metrics, schemas
+from core.cache import response_cache, serialize_rows
+from core.compression import GzipRoute
 import crud
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.router.route_class = GzipRoute
 
 def get_db():
     db = database.SessionLocal()
@@ -15,22 +20,70 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with database.AsyncSessionLocal() as db:
+        yield db
 
-@app.get('/teams', response_model=List[schemas.Team])
-def get_teams(db: Session = Depends(get_db)):
-    teams = crud.get_teams(db=db)
-    return teams
+
+# The read endpoints have a sync and an async version, and only one of them is served
+# depending on database.ASYNC_MODE
+# Teams and games are served from the response cache, which the write endpoints invalidate,
+# and are read as plain rows serialized with orjson (skipping the per-row validation of response_model)
+sync_router = APIRouter(route_class=GzipRoute)
+async_router = APIRouter(route_class=GzipRoute)
+
+@sync_router.get('/teams', response_model=List[schemas.Team])
+def get_teams(request: Request, db: Session = Depends(get_db)):
+    return response_cache.cached(request, ['teams'], lambda: serialize_rows(crud.get_team_rows(db=db)))
+
+@async_router.get('/teams', response_model=List[schemas.Team])
+async def get_teams_async(request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def build():
+        return serialize_rows(await crud.get_team_rows_async(db=db))
+    return await response_cache.cached_async(request, ['teams'], build)
+
+@sync_router.get('/games/{year}', response_model=List[schemas.Game])
+def get_games(year: str, request: Request, db: Session = Depends(get_db)):
+    return response_cache.cached(request, ['games'], lambda: serialize_rows(crud.get_game_rows(db=db, year=year)))
+
+@async_router.get('/games/{year}', response_model=List[schemas.Game])
+async def get_games_async(year: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def build():
+        return serialize_rows(await crud.get_game_rows_async(db=db, year=year))
+    return await response_cache.cached_async(request, ['games'], build)
+
+@sync_router.get('/pbp/{year}')
+def get_games_needing_pbp(year: str, db: Session = Depends(get_db)):
+    game_ids = crud.get_games_needing_pbp(db=db, year=year)
+    return game_ids
+
+@async_router.get('/pbp/{year}')
+async def get_games_needing_pbp_async(year: str, db: AsyncSession = Depends(get_async_db)):
+    game_ids = await crud.get_games_needing_pbp_async(db=db, year=year)
+    return game_ids
+
+app.include_router(async_router if database.ASYNC_MODE else sync_router)
 
 @app.post('/teams', response_model=List[schemas.Team])
 def add_teams(teams: List[schemas.Team], db: Session = Depends(get_db)):
     teams = crud.add_teams(db=db, teams=teams)
     return teams
 
+@app.put('/teams', response_model=List[schemas.Team])
+def upsert_teams(teams: List[schemas.Team], db: Session = Depends(get_db)):
+    teams = crud.upsert_teams(db=db, teams=teams)
+    return teams
+
 @app.post('/games', response_model=List[schemas.Game])
 def add_teams(games: List[schemas.Game], db: Session = Depends(get_db)):
     games = crud.add_games(db=db, games=games)
     return games
 
+@app.put('/games', response_model=List[schemas.Game])
+def upsert_games(games: List[schemas.Game], db: Session = Depends(get_db)):
+    games = crud.upsert_games(db=db, games=games)
+    return games
+
 @app.get('/games/past/{year}/')
 def get_past_games(year: str, db: Session = Depends(get_db)):
     pass
@@ -39,7 +92,11 @@ def get_past_games(year: str, db: Session = Depends(get_db)):
 def get_upcoming_games(year: str, db: Session = Depends(get_db)):
     pass
 
-@app.get('/pbp/{year}')
-def get_games_needing_pbp(year: str, db: Session = Depends(get_db)):
-    game_ids = crud.get_games_needing_pbp(db=db, year=year)
-    return game_ids
+@app.post('/plays')
+def add_plays(plays: List[schemas.Play], db: Session = Depends(get_db)):
+    count = crud.add_plays(db=db, plays=plays)
+    return {'plays': count}
+
+@app.get('/metrics', response_class=PlainTextResponse)
+def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
@@ -0,0 +1,240 @@
+import time
+import pytest
+from core import cache
+from core.cache import MemoryBackend, RedisBackend, response_cache
+from test_games import TEAMS, build_games
+
+
+class FakeRedis:
+    """
+    Local stand-in for a redis client, with the few commands the redis backend uses
+    """
+    def __init__(self):
+        self.values = {}
+
+    def get(self, name):
+        (value, expires_at) = self.values.get(name, (None, None))
+        if expires_at is not None and expires_at < time.monotonic():
+            del self.values[name]
+            return None
+        return value
+
+    def set(self, name, value, ex=None, nx=False):
+        if nx and self.get(name) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.values[name] = (value, None if ex is None else time.monotonic() + ex)
+        return True
+
+    def incr(self, name):
+        value = int(self.get(name) or 0) + 1
+        self.values[name] = (str(value).encode(), None)
+        return value
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def backend(request, monkeypatch):
+    """
+    Response cache backed by the memory backend and by the redis backend (on a fake redis)
+    """
+    backend = MemoryBackend() if request.param == 'memory' else RedisBackend(FakeRedis())
+    monkeypatch.setattr(response_cache, 'backend', backend)
+    return backend
+
+
+class TestBackends:
+
+    @pytest.mark.parametrize('backend_class', [MemoryBackend, lambda ttl: RedisBackend(FakeRedis(), ttl=ttl)])
+    def test_ttl(self, backend_class, monkeypatch):
+        """
+        Test that entries expire after the TTL
+        """
+        now = time.monotonic()
+        monkeypatch.setattr(time, 'monotonic', lambda: now)
+        backend = backend_class(ttl=10)
+        backend.set('key', b'[]')
+        assert backend.get('key') == b'[]'
+
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+        assert backend.get('key') is None
+
+
+    def test_lru(self):
+        """
+        Test that the least recently used entry is evicted once the memory backend is full
+        """
+        backend = MemoryBackend(max_size=2)
+        backend.set('a', b'1')
+        backend.set('b', b'2')
+        backend.get('a')
+        backend.set('c', b'3')
+
+        assert backend.get('a') == b'1'
+        assert backend.get('b') is None
+        assert backend.get('c') == b'3'
+
+
+class TestResponseCache:
+
+    def test_cached_teams(self, client, backend, count_queries):
+        """
+        Test that repeated reads are served from the cache without querying the database
+        """
+        client.post('/teams', json=TEAMS)
+        first = client.get('/teams')
+
+        with count_queries() as statements:
+            second = client.get('/teams')
+        assert statements == []
+        assert second.json() == first.json() == TEAMS
+        assert second.headers['content-type'] == 'application/json'
+
+
+    def test_key_includes_params(self, client, backend):
+        """
+        Test that each season's games are cached separately
+        """
+        client.post('/teams', json=TEAMS)
+        client.post('/games', json=build_games(2))
+
+        assert len(client.get('/games/2021').json()) == 2
+        assert client.get('/games/2020').json() == []
+
+
+    def test_write_invalidates(self, client, backend):
+        """
+        Test that every write to a table invalidates the cached responses built from it
+        """
+        client.post('/teams', json=TEAMS)
+        assert len(client.get('/teams').json()) == 2
+
+        client.put('/teams', json=[{**TEAMS[0], 'city': 'Chicagoland'}])
+        cities = {team['team_id']: team['city'] for team in client.get('/teams').json()}
+        assert cities['CHI'] == 'Chicagoland'
+
+        client.post('/games', json=build_games(1))
+        assert len(client.get('/games/2021').json()) == 1
+
+        client.put('/games', json=[{**game, 'home_score': 24} for game in build_games(2)])
+        games = client.get('/games/2021').json()
+        assert [game['home_score'] for game in games] == [24, 24]
+
+        client.post('/plays', json=[{
+            'prf_game_id': '202109010ram', 'play_index': 0, 'quarter': 1, 'time_remaining': '15:00',
+            'down': None, 'yards_to_go': None, 'field_side': 'CHI', 'field_line': 35,
+            'description': 'Cairo Santos kicks off 65 yards, touchback.', 'play_type': 'KICKOFF_TOUCHBACK',
+            'player': 'Cairo Santos', 'target': None, 'defender': None, 'yards': 65,
+        }])
+        assert client.get('/games/2021').json()[0]['has_pbp'] is True
+
+
+    def test_async_reads(self, read_client, backend):
+        """
+        Test that the sync and async read endpoints are both cached
+        """
+        read_client.post('/teams', json=TEAMS)
+        before = cache.CACHE_REQUESTS.value(route='/teams', result='hit')
+
+        assert read_client.get('/teams').json() == TEAMS
+        assert read_client.get('/teams').json() == TEAMS
+        assert cache.CACHE_REQUESTS.value(route='/teams', result='hit') == before + 1
+
+
+    def test_disabled(self, client, monkeypatch, count_queries):
+        """
+        Test that every read queries the database when the cache is disabled
+        """
+        monkeypatch.setattr(response_cache, 'backend', None)
+        client.post('/teams', json=TEAMS)
+
+        client.get('/teams')
+        with count_queries() as statements:
+            assert client.get('/teams').json() == TEAMS
+        assert len(statements) == 1
+
+
+    def test_metrics(self, client, backend):
+        """
+        Test that the hits, misses and hit ratio are exposed with the other metrics
+        """
+        client.get('/teams')
+        client.get('/teams')
+        text = client.get('/metrics').text
+
+        assert 'juice_cache_requests_total{result="hit",route="/teams"}' in text
+        assert 'juice_cache_requests_total{result="miss",route="/teams"}' in text
+        assert 'juice_cache_hit_ratio{route="/teams"}' in text
+        assert 'juice_cache_invalidations_total{table="teams"}' in text
+
+
+class TestETags:
+
+    def test_not_modified(self, client, backend, count_queries):
+        """
+        Test that a request with the current ETag gets a 304 without querying the database
+        """
+        client.post('/teams', json=TEAMS)
+        res = client.get('/teams')
+        etag = res.headers['etag']
+        assert res.headers['cache-control'] == 'no-cache'
+
+        with count_queries() as statements:
+            res = client.get('/teams', headers={'If-None-Match': etag})
+        assert statements == []
+        assert res.status_code == 304
+        assert res.content == b''
+        assert res.headers['etag'] == etag
+
+        res = client.get('/teams', headers={'If-None-Match': f'"other", W/{etag}'})
+        assert res.status_code == 304
+
+
+    def test_etag_changes_on_write(self, read_client, backend):
+        """
+        Test that a write changes the ETag of the responses built from the table (and only those)
+        """
+        read_client.post('/teams', json=TEAMS)
+        teams_etag = read_client.get('/teams').headers['etag']
+        games_etag = read_client.get('/games/2021').headers['etag']
+
+        read_client.post('/games', json=build_games(2))
+        assert read_client.get('/teams', headers={'If-None-Match': teams_etag}).status_code == 304
+        res = read_client.get('/games/2021', headers={'If-None-Match': games_etag})
+        assert res.status_code == 200
+        assert len(res.json()) == 2
+        assert res.headers['etag'] != games_etag
+
+
+    def test_memory_etag_expires(self, client, monkeypatch):
+        """
+        Test that the memory backend's ETags change every ttl seconds, so a worker that didn't
+        handle a write stops answering 304 to the old ETag once its cache would have expired
+        """
+        now = time.monotonic()
+        monkeypatch.setattr(time, 'monotonic', lambda: now)
+        monkeypatch.setattr(response_cache, 'backend', MemoryBackend(ttl=10))
+        client.post('/teams', json=TEAMS)
+        etag = client.get('/teams').headers['etag']
+
+        # Another worker writes: this one's versions don't change
+        assert client.get('/teams', headers={'If-None-Match': etag}).status_code == 304
+        monkeypatch.setattr(time, 'monotonic', lambda: now + 10)
+        res = client.get('/teams', headers={'If-None-Match': etag})
+        assert res.status_code == 200
+        assert res.headers['etag'] != etag
+
+
+    def test_epoch(self):
+        """
+        Test that the same versions give different ETags after a restart (or a redis flush)
+        """
+        assert MemoryBackend().epoch != MemoryBackend().epoch
+
+        redis = FakeRedis()
+        first = RedisBackend(redis)
+        assert first.epoch == RedisBackend(redis).epoch
+
+        epoch = first.epoch
+        redis.values.clear()
+        assert first.epoch != epoch
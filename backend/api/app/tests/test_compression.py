@@ -0,0 +1,42 @@
+import gzip
+import json
+from test_games import TEAMS
+
+
+class TestGzipRequests:
+
+    def test_gzip_body(self, client):
+        """
+        Test that gzip compressed bodies are decompressed
+        """
+        body = gzip.compress(json.dumps(TEAMS).encode('utf-8'))
+        res = client.put('/teams', data=body, headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'})
+        assert res.status_code == 200
+        assert res.json() == TEAMS
+        assert client.get('/teams').json() == TEAMS
+
+
+    def test_uncompressed_body(self, client):
+        """
+        Test that uncompressed bodies still work
+        """
+        assert client.put('/teams', json=TEAMS).status_code == 200
+
+
+    def test_invalid_gzip_body(self, client):
+        """
+        Test that a body that isn't valid gzip is rejected
+        """
+        res = client.put('/teams', data=b'not gzip', headers={'Content-Encoding': 'gzip'})
+        assert res.status_code == 400
+
+
+    def test_decompressed_size_limit(self, client, monkeypatch):
+        """
+        Test that bodies that decompress past the limit are rejected
+        """
+        from core import compression
+        monkeypatch.setattr(compression, 'MAX_DECOMPRESSED_SIZE', 100)
+        body = gzip.compress(json.dumps(TEAMS).encode('utf-8'))
+        res = client.put('/teams', data=body, headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'})
+        assert res.status_code == 413
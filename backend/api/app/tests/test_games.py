@@ -0,0 +1,215 @@
+TEAMS = [
+    {'team_id': 'CHI', 'org_id': 'CHI', 'city': 'Chicago', 'mascot': 'Bears',
+     'start_year': 1920, 'active': True, 'pfr_id': 'chi'},
+    {'team_id': 'LAR', 'org_id': 'LAR', 'city': 'Los Angeles', 'mascot': 'Rams',
+     'start_year': 1937, 'active': True, 'pfr_id': 'ram'},
+]
+
+
+def build_games(num_games: int) -> list:
+    return [
+        {
+            'game_id': f'2021{9 + week // 4:02d}{1 + week % 4 * 7:02d}_{home}',
+            'season': 2021,
+            'week': week + 1,
+            'datetime': f'2021-{9 + week // 4:02d}-{1 + week % 4 * 7:02d} 13:00:00',
+            'home_team_id': home,
+            'away_team_id': away,
+            'home_score': None,
+            'away_score': None,
+        }
+        for week in range(num_games)
+        for (home, away) in [('CHI', 'LAR') if week % 2 else ('LAR', 'CHI')]
+    ]
+
+
+class TestAddGames:
+
+    def test_prf_game_id(self, client, db):
+        """
+        Test that the PFR game id is built from the date and the home team's pfr_id
+        """
+        client.post('/teams', json=TEAMS)
+        res = client.post('/games', json=build_games(2))
+        assert res.status_code == 200
+
+        assert client.get('/pbp/2021').json() == ['202109010ram', '202109080chi']
+
+
+    def test_query_count(self, client, count_queries):
+        """
+        Test that adding games takes the same number of queries no matter how many games there are,
+        with a single team lookup
+        """
+        client.post('/teams', json=TEAMS)
+
+        with count_queries() as statements:
+            client.post('/games', json=build_games(1))
+        one_game = len(statements)
+
+        with count_queries() as statements:
+            client.post('/games', json=build_games(16)[1:])
+        many_games = len(statements)
+
+        assert one_game == many_games
+        assert sum('FROM teams' in statement for statement in statements) == 1
+
+
+class TestUpsertGames:
+
+    def test_upsert(self, client, db):
+        """
+        Test that upserting adds new games and updates the scores of existing ones
+        """
+        client.put('/teams', json=TEAMS)
+        games = build_games(3)
+        assert client.put('/games', json=games[:2]).status_code == 200
+
+        games[0]['home_score'] = 24
+        games[0]['away_score'] = 17
+        assert client.put('/games', json=games).status_code == 200
+
+        rows = db.execute('SELECT game_id, home_score, away_score FROM games ORDER BY game_id').fetchall()
+        assert [tuple(row) for row in rows] == [
+            (games[0]['game_id'], 24, 17),
+            (games[1]['game_id'], None, None),
+            (games[2]['game_id'], None, None),
+        ]
+
+
+    def test_upsert_keeps_pbp(self, client, db):
+        """
+        Test that re-sending a game doesn't reset has_pbp
+        """
+        client.put('/teams', json=TEAMS)
+        games = build_games(1)
+        client.put('/games', json=games)
+        db.execute('UPDATE games SET has_pbp = true')
+        db.commit()
+
+        client.put('/games', json=games)
+        assert db.execute('SELECT has_pbp FROM games').scalar() is True
+
+
+    def test_upsert_unchanged(self, client, db):
+        """
+        Test that re-sending unchanged games and teams doesn't update any rows
+        """
+        client.put('/teams', json=TEAMS)
+        client.put('/games', json=build_games(3))
+        db.commit()
+        xmin = db.execute('SELECT xmin::text FROM games UNION ALL SELECT xmin::text FROM teams').fetchall()
+
+        client.put('/teams', json=TEAMS)
+        client.put('/games', json=build_games(3))
+        db.commit()
+        assert db.execute('SELECT xmin::text FROM games UNION ALL SELECT xmin::text FROM teams').fetchall() == xmin
+
+
+    def test_upsert_batches(self, client, count_queries, monkeypatch):
+        """
+        Test that games are upserted with one statement per batch
+        """
+        import crud
+        monkeypatch.setattr(crud, 'UPSERT_BATCH_SIZE', 4)
+        client.put('/teams', json=TEAMS)
+
+        with count_queries() as statements:
+            client.put('/games', json=build_games(10))
+        assert sum('ON CONFLICT' in statement for statement in statements) == 3
+
+
+class TestGamesNeedingPbp:
+
+    def test_games_needing_pbp(self, client, db):
+        """
+        Test that only games that ended more than 4 hours ago and don't have play by play are returned
+        """
+        from datetime import datetime, timedelta
+        from pytz import timezone
+
+        client.put('/teams', json=TEAMS)
+        now = datetime.now(timezone('EST')).replace(tzinfo=None)
+        games = build_games(4)
+        for (game, hours_ago) in zip(games, [72, 5, 3, -24]):
+            game['datetime'] = (now - timedelta(hours=hours_ago)).strftime('%Y-%m-%d %H:%M:%S')
+        client.put('/games', json=games)
+
+        prf_game_ids = [prf_game_id for (prf_game_id,) in db.execute('SELECT prf_game_id FROM games ORDER BY datetime')]
+        assert client.get('/pbp/2021').json() == prf_game_ids[:2]
+
+        db.execute('UPDATE games SET has_pbp = true WHERE prf_game_id = :prf_game_id', {'prf_game_id': prf_game_ids[0]})
+        db.commit()
+        assert client.get('/pbp/2021').json() == prf_game_ids[1:2]
+
+
+    def test_games_needing_pbp_index(self, db):
+        """
+        Test that the query can use the (season, has_pbp, datetime) index
+        """
+        db.execute('SET enable_seqscan = off')
+        plan = db.execute(
+            "EXPLAIN SELECT prf_game_id FROM games WHERE season = 2021 AND NOT has_pbp AND datetime < now()"
+        ).fetchall()
+        assert 'ix_games_season_has_pbp_datetime' in ' '.join(row[0] for row in plan)
+
+
+    def test_create_indexes(self, db):
+        """
+        Test that the index is created at startup on databases whose games table predates it
+        """
+        from core import database
+        with database.engine.begin() as connection:
+            connection.execute('DROP INDEX ix_games_season_has_pbp_datetime')
+        database.create_indexes(database.engine)
+
+        indexes = [name for (name,) in db.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'games'")]
+        assert 'ix_games_season_has_pbp_datetime' in indexes
+
+
+class TestReadEndpoints:
+
+    def test_get_teams(self, read_client):
+        """
+        Test listing the teams
+        """
+        read_client.put('/teams', json=TEAMS)
+        assert read_client.get('/teams').json() == TEAMS
+
+
+    def test_get_games(self, read_client):
+        """
+        Test listing the games of a season, in the same format they're uploaded in
+        """
+        read_client.put('/teams', json=TEAMS)
+        games = build_games(3)
+        read_client.put('/games', json=games)
+
+        assert read_client.get('/games/2021').json() == [{**game, 'has_pbp': False} for game in games]
+        assert read_client.get('/games/2020').json() == []
+
+
+    def test_get_games_needing_pbp(self, read_client):
+        """
+        Test listing the games that need play by play
+        """
+        read_client.put('/teams', json=TEAMS)
+        read_client.put('/games', json=build_games(2))
+        assert read_client.get('/pbp/2021').json() == ['202109010ram', '202109080chi']
+
+
+    def test_same_json_as_schemas(self, read_client, db):
+        """
+        Test that the rows serialized with orjson give the same JSON (down to the key order) as the schemas
+        """
+        import orjson
+        import crud
+        from core import schemas
+
+        read_client.put('/teams', json=TEAMS)
+        read_client.put('/games', json=[{**game, 'home_score': 21, 'away_score': 17} for game in build_games(2)])
+
+        teams = [schemas.Team.from_orm(team).dict() for team in crud.get_teams(db)]
+        games = [schemas.Game.from_orm(game).dict() for game in crud.get_games(db, '2021')]
+        assert read_client.get('/teams').content == orjson.dumps(teams)
+        assert read_client.get('/games/2021').content == orjson.dumps(games)
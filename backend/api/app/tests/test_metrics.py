@@ -0,0 +1,72 @@
+import threading
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from core import database, metrics
+
+
+class TestPoolMetrics:
+
+    def test_metrics_endpoint(self, client):
+        """
+        Test that the pool metrics are exposed in the Prometheus text format
+        """
+        client.get('/teams')
+        res = client.get('/metrics')
+        assert res.status_code == 200
+        assert res.headers['content-type'].startswith('text/plain')
+
+        text = res.text
+        assert '# TYPE juice_db_pool_checkout_seconds histogram' in text
+        assert 'juice_db_pool_size{engine="sync"} 5' in text
+        assert 'juice_db_pool_checked_out{engine="sync"} 0' in text
+        assert 'juice_db_pool_checkout_seconds_bucket{engine="sync",le="+Inf"}' in text
+
+
+    def test_checkout_latency(self, db):
+        """
+        Test that every checkout is measured
+        """
+        before = metrics.POOL_CHECKOUT_SECONDS.count(engine='sync')
+        for _ in range(3):
+            with database.engine.connect() as connection:
+                connection.execute('SELECT 1')
+        assert metrics.POOL_CHECKOUT_SECONDS.count(engine='sync') == before + 3
+
+
+    def test_pool_exhausted(self):
+        """
+        Test that waiting on an exhausted pool and timing out are recorded
+        """
+        engine = create_engine(
+            database.SQLALCHEMY_DATABASE_URI, poolclass=metrics.InstrumentedQueuePool,
+            pool_logging_name='test', pool_size=1, max_overflow=0, pool_timeout=0.2
+        )
+        held = engine.connect()
+
+        # A connection checked in while another checkout waits
+        release = threading.Timer(0.05, held.close)
+        release.start()
+        with engine.connect():
+            pass
+        release.join()
+        assert metrics.POOL_WAIT_SECONDS.count(engine='test') == 1
+
+        held = engine.connect()
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        held.close()
+
+        assert metrics.POOL_WAIT_SECONDS.count(engine='test') == 2
+        assert metrics.POOL_TIMEOUTS.value(engine='test') == 1
+        engine.dispose()
+
+
+    def test_sync_mode_has_no_async_pool(self):
+        """
+        Test that the async engine (and its pool) only exists in async mode
+        """
+        if database.ASYNC_MODE:
+            pytest.skip('JUICE_DB_ASYNC is on')
+        assert database.async_engine is None
+        assert 'async' not in metrics.POOLS
@@ -0,0 +1,95 @@
+import pytest
+from test_games import TEAMS, build_games
+
+PRF_GAME_ID = '202109010ram'
+
+
+def build_plays(num_plays: int, prf_game_id: str = PRF_GAME_ID) -> list:
+    return [
+        {
+            'prf_game_id': prf_game_id,
+            'play_index': play_index,
+            'quarter': 1,
+            'time_remaining': '15:00',
+            'down': 1 + play_index % 4,
+            'yards_to_go': 10,
+            'field_side': 'CHI',
+            'field_line': 25 + play_index,
+            'description': f'David Montgomery right tackle for {play_index} yards',
+            'play_type': 'RUN',
+            'player': 'David Montgomery',
+            'target': None,
+            'defender': None,
+            'yards': play_index,
+        }
+        for play_index in range(num_plays)
+    ]
+
+
+@pytest.fixture
+def games(client):
+    client.post('/teams', json=TEAMS)
+    client.post('/games', json=build_games(2))
+
+
+def stored_plays(db) -> list:
+    from core import models
+    return db.query(models.Play).order_by(models.Play.game_id, models.Play.play_index).all()
+
+
+class TestAddPlays:
+
+    def test_add_plays(self, client, db, games):
+        """
+        Test that the plays are loaded with their game's id, and the game is marked as having play by play
+        """
+        res = client.post('/plays', json=build_plays(3))
+        assert res.status_code == 200
+        assert res.json() == {'plays': 3}
+
+        plays = stored_plays(db)
+        assert [play.play_index for play in plays] == [0, 1, 2]
+        assert {play.game_id for play in plays} == {'20210901_LAR'}
+        assert (plays[2].down, plays[2].field_line, plays[2].yards, plays[2].target) == (3, 27, 2, None)
+
+        has_pbp = {game['game_id']: game['has_pbp'] for game in client.get('/games/2021').json()}
+        assert has_pbp == {'20210901_LAR': True, '20210908_CHI': False}
+
+
+    def test_replace_plays(self, client, db, games):
+        """
+        Test that re-posting a game's plays replaces them instead of duplicating them
+        """
+        client.post('/plays', json=build_plays(5))
+        client.post('/plays', json=build_plays(5, '202109080chi'))
+        res = client.post('/plays', json=build_plays(2))
+        assert res.status_code == 200
+
+        plays = stored_plays(db)
+        assert [(play.game_id, play.play_index) for play in plays] == (
+            [('20210901_LAR', index) for index in range(2)] + [('20210908_CHI', index) for index in range(5)]
+        )
+
+
+    def test_unknown_game(self, client, db, games):
+        """
+        Test that plays of a game that isn't in the games table are rejected, without loading any of the request
+        """
+        plays = build_plays(2) + build_plays(1, '202109150gnb')
+        with pytest.raises(AssertionError, match='202109150gnb'):
+            client.post('/plays', json=plays)
+        assert stored_plays(db) == []
+
+
+    def test_csv_escaping(self, client, db, games):
+        """
+        Test that descriptions with commas, quotes and empty fields round trip through the CSV load
+        """
+        description = 'Robbie Gould kicks off 65 yards, returned by "Pat" O\'Donnell for 20 yards (tackle by Joe, Jr.)'
+        play = {**build_plays(1)[0], 'description': description, 'time_remaining': '', 'player': 'O\'Donnell, "Pat"'}
+        client.post('/plays', json=[play])
+
+        (stored,) = stored_plays(db)
+        assert stored.description == description
+        assert stored.player == 'O\'Donnell, "Pat"'
+        assert stored.time_remaining is None